@@ -0,0 +1,74 @@
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import pandas as pd
+
+# Add the project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.corpus import DEFAULT_CORPUS_PATH, load_corpus, parse_corpus_csv
+
+PROJECTIONS = {'all': None, 'titles_dates': ['Title', 'Date'], 'categories': ['AwesomeListCategory']}
+
+def scaled_corpus(directory: str, scale: int) -> str:
+    """
+    papers.csv repeated ``scale`` times, written to ``directory``
+    """
+    path = os.path.join(directory, 'papers.csv')
+    if scale == 1:
+        shutil.copyfile(DEFAULT_CORPUS_PATH, path)
+    else:
+        df = parse_corpus_csv(DEFAULT_CORPUS_PATH)
+        pd.concat([df] * scale, ignore_index=True).to_csv(path, index=False)
+    return path
+
+def timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+def bench_scale(scale: int, repeat: int) -> Dict[str, float]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = scaled_corpus(tmp, scale)
+        cache_dir = os.path.join(tmp, 'cache')
+        results[f"csv_parse[x{scale}]"] = min(timed(lambda: parse_corpus_csv(path)) for _ in range(repeat))
+        results[f"cold_load[x{scale}]"] = timed(lambda: load_corpus(path, cache_dir=cache_dir))
+        for name, columns in PROJECTIONS.items():
+            results[f"warm_load_{name}[x{scale}]"] = min(
+                timed(lambda: load_corpus(path, columns=columns, cache_dir=cache_dir)) for _ in range(repeat))
+        # A new mtime with the same content costs a hash, not a parse
+        os.utime(path)
+        results[f"touched_load[x{scale}]"] = timed(lambda: load_corpus(path, columns=['Title'], cache_dir=cache_dir))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold and warm load times of the papers.csv corpus")
+    parser.add_argument('--scales', default='1,100', help="comma-separated copies of papers.csv to load")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="write results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = {}
+    for scale in [int(scale) for scale in args.scales.split(',')]:
+        results.update(bench_scale(scale, args.repeat))
+
+    width = max(len(name) for name in results)
+    for name, seconds in results.items():
+        print(f"{name:<{width}}  {seconds * 1000:10.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
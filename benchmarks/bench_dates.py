@@ -0,0 +1,96 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+# Add the project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.dates import DateIndex, parse_date, parse_dates, range_bound
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+def synthetic_dates(n: int, seed: int = 0) -> List[str]:
+    """
+    Publication dates in the forms the sources produce: ISO days and
+    timestamps, dotted days, named months, bare years, and some missing
+    """
+    rng = random.Random(seed)
+    dates = []
+    for _ in range(n):
+        year, month, day = rng.randint(1990, 2024), rng.randint(1, 12), rng.randint(1, 28)
+        form = rng.random()
+        if form < 0.4:
+            dates.append(f"{year}-{month:02d}-{day:02d}")
+        elif form < 0.55:
+            dates.append(f"{year}-{month:02d}-{day:02d} 12:00:00+00:00")
+        elif form < 0.7:
+            dates.append(f"{year}.{month}.{day}")
+        elif form < 0.8:
+            dates.append(f"{MONTH_NAMES[month - 1]} {year}")
+        elif form < 0.95:
+            dates.append(str(year))
+        else:
+            dates.append(None)
+    return dates
+
+def timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+def per_row_filter(dates: List[str], start: str, end: str) -> List[int]:
+    # What a range filter costs without normalized dates: parse every row
+    start_day, end_day = range_bound(start), range_bound(end, end=True)
+    matches = []
+    for i, value in enumerate(dates):
+        day, precision = parse_date(value)
+        if precision and start_day <= day <= end_day:
+            matches.append(i)
+    return matches
+
+def bench(n: int, queries: int, repeat: int) -> Dict[str, float]:
+    dates = synthetic_dates(n)
+    rng = random.Random(1)
+    ranges = []
+    for _ in range(queries):
+        year = rng.randint(1990, 2024)
+        ranges.append((f"{year}-{rng.randint(1, 6):02d}", f"{year}-{rng.randint(7, 12):02d}"))
+
+    results = {}
+    results[f"normalize[{n}]"] = min(timed(lambda: parse_dates(dates)) for _ in range(repeat))
+    days, precisions = parse_dates(dates)
+    results[f"index_build[{n}]"] = min(timed(lambda: DateIndex(days, precisions)) for _ in range(repeat))
+    index = DateIndex(days, precisions)
+    assert sorted(index.between(*ranges[0]).tolist()) == per_row_filter(dates, *ranges[0])
+    results[f"per_row_query[{n}]"] = timed(lambda: [per_row_filter(dates, *bounds) for bounds in ranges]) / queries
+    results[f"index_query[{n}]"] = min(
+        timed(lambda: [index.between(*bounds) for bounds in ranges]) for _ in range(repeat)) / queries
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Date-range filters: per-row parsing against the sorted date index")
+    parser.add_argument('--sizes', default='10000,1000000', help="comma-separated numbers of dates")
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="write results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for n in [int(n) for n in args.sizes.split(',')]:
+        results.update(bench(n, args.queries, args.repeat))
+
+    width = max(len(name) for name in results)
+    for name, seconds in results.items():
+        print(f"{name:<{width}}  {seconds * 1000:10.3f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
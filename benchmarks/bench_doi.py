@@ -0,0 +1,130 @@
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+# Add the project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.doi_resolver import DOICache, DOIResolver, HTTPDOIFetcher
+
+def synthetic_dois(n: int, missing_ratio: float = 0.05, seed: int = 0) -> List[str]:
+    """
+    DOIs for the stand-in resolver; about ``missing_ratio`` of them are
+    unknown to it
+    """
+    rng = random.Random(seed)
+    return [f"10.5555/{'missing' if rng.random() < missing_ratio else 'bench'}.{i}" for i in range(n)]
+
+def csl_record(doi: str) -> Dict[str, Any]:
+    rng = random.Random(doi)
+    return {
+        'DOI': doi,
+        'title': f"Synthetic paper {doi.rsplit('.', 1)[-1]}",
+        'author': [{'given': rng.choice('ABCDEFGH') + '.', 'family': rng.choice(('Smith', 'Chen', 'Rossi', 'Kim'))}
+                   for _ in range(rng.randint(1, 4))],
+        'issued': {'date-parts': [[rng.randint(1990, 2024), rng.randint(1, 12)]]},
+        'abstract': '<jats:p>Synthetic abstract.</jats:p>',
+        'URL': f"https://doi.org/{doi}"
+    }
+
+class StandInResolver:
+    """
+    Local HTTP server answering DOI content negotiation like doi.org, with
+    a fixed latency per request; DOIs under 10.5555/missing get a 404
+    """
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.requests = 0
+        resolver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                resolver.requests += 1
+                time.sleep(resolver.latency)
+                doi = self.path.lstrip('/')
+                if doi.startswith('10.5555/missing'):
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = json.dumps(csl_record(doi)).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/vnd.citationstyles.csl+json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        Handler.protocol_version = 'HTTP/1.1'
+        # Headers and body go out in separate writes; without this, delayed
+        # ACKs add ~40 ms to every keep-alive response
+        Handler.disable_nagle_algorithm = True
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> 'StandInResolver':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+def bench_resolve(n: int, workers: int, latency: float, cache_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Resolve ``n`` DOIs against the stand-in twice, cold and then warm, and
+    return each batch's statistics
+    """
+    dois = synthetic_dois(n)
+    results = []
+    with StandInResolver(latency) as stand_in, tempfile.TemporaryDirectory() as tmp:
+        cache = DOICache(cache_path or os.path.join(tmp, 'dois.sqlite3'))
+        resolver = DOIResolver(HTTPDOIFetcher(stand_in.url, pool_size=workers), cache, max_workers=workers)
+        try:
+            for name in ('cold', 'warm'):
+                before = stand_in.requests
+                result = resolver.resolve(dois)
+                results.append({'batch': name, 'dois': n, 'resolved': len(result.papers),
+                                'not_found': len(result.not_found), 'failed': len(result.failed),
+                                'requests': stand_in.requests - before, 'seconds': result.elapsed,
+                                'dois_per_second': result.throughput, 'hit_rate': result.hit_rate})
+        finally:
+            resolver.close()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="DOI resolution against a local stand-in resolver")
+    parser.add_argument('--dois', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=0.05, help="stand-in latency per request, in seconds")
+    parser.add_argument('--cache', help="DOI cache file to use instead of a temporary one")
+    parser.add_argument('--output', help="write results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    results = bench_resolve(args.dois, args.workers, args.latency, args.cache)
+    for row in results:
+        print(f"{row['batch']:<5} {row['dois']} DOIs in {row['seconds']:.2f}s  "
+              f"{row['dois_per_second']:8.0f} DOIs/s  hit rate {row['hit_rate']:4.0%}  "
+              f"requests {row['requests']}  resolved {row['resolved']}  not found {row['not_found']}  "
+              f"failed {row['failed']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, Tuple
+
+# Add the project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from benchmarks.bench_scraper import synthetic_semantic_scholar_records
+from src.corpus import iter_corpus_papers
+from src.paper_store import PaperStore
+from src.research_scraper import paper_from_semantic_scholar
+
+def synthetic_stream(n: int) -> Iterator:
+    for record in synthetic_semantic_scholar_records(n):
+        paper = paper_from_semantic_scholar(record)
+        if paper:
+            yield paper
+
+def corpus_stream(scale: int) -> Iterator:
+    # Fresh objects for every copy, as separate loads would produce
+    for _ in range(scale):
+        yield from iter_corpus_papers()
+
+def retained(build: Callable[[], object]) -> Tuple[int, float]:
+    """
+    Bytes still allocated once ``build`` returns (its result is kept alive),
+    and the seconds it took
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - started
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size, seconds
+
+def bench(name: str, stream: Callable[[], Iterator]) -> Dict[str, float]:
+    objects, objects_seconds = retained(lambda: list(stream()))
+    store, store_seconds = retained(lambda: PaperStore(stream()))
+    count = len(PaperStore(stream()))
+    return {
+        f"papers[{name}]": count,
+        f"objects_mb[{name}]": objects / 1e6,
+        f"store_mb[{name}]": store / 1e6,
+        f"ratio[{name}]": objects / max(store, 1),
+        f"objects_build_s[{name}]": objects_seconds,
+        f"store_build_s[{name}]": store_seconds,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory held by ResearchPaper lists against a PaperStore")
+    parser.add_argument('--sizes', default='10000,100000', help="comma-separated numbers of synthetic papers")
+    parser.add_argument('--corpus-scales', default='1,20', help="comma-separated copies of papers.csv")
+    parser.add_argument('--output', help="write results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for n in [int(n) for n in args.sizes.split(',') if n]:
+        results.update(bench(f"synthetic x{n}", lambda: synthetic_stream(n)))
+    for scale in [int(scale) for scale in args.corpus_scales.split(',') if scale]:
+        results.update(bench(f"papers.csv x{scale}", lambda: corpus_stream(scale)))
+
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:12.3f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
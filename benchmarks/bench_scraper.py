@@ -0,0 +1,232 @@
+import argparse
+import base64
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+# Add the project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.circuit_breaker import CircuitBreakerRegistry
+from src.replay import Cassette, record_scraper, replay_scraper
+from src.research_scraper import (ResearchPaper, ResearchScraper, deduplicate_papers,
+                                  paper_from_semantic_scholar, parse_arxiv_feed)
+
+DEFAULT_SIZES = (10, 1000, 100000)
+BENCHMARK_QUERY = "graph neural networks"
+
+WORDS = ("learning neural graph network deep model transformer attention robust efficient "
+         "sparse adaptive inference optimization language vision reinforcement bayesian "
+         "generative contrastive federated causal scalable retrieval").split()
+# Pseudo-words widen the title vocabulary so synthetic titles collide about
+# as rarely as real ones do
+SYLLABLES = "ka lo mi ne ru sa ti vo ze pa bel cor dan fen gar hul jor kin lum mor".split()
+TITLE_WORDS = WORDS + [a + b + c for a in SYLLABLES for b in SYLLABLES for c in ('n', 'r', 'x')]
+SURNAMES = ("Smith Chen Wang Garcia Müller Kim Nguyen Rossi Novak Sato Okafor Silva "
+            "Kowalski Dubois Larsen Ivanova Haddad Tanaka Moreau Ahmed").split()
+
+def _title(rng: random.Random) -> str:
+    return ' '.join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(5, 10))).capitalize()
+
+def _authors(rng: random.Random) -> List[str]:
+    return [f"{rng.choice('ABCDEFGHJKLMNPRST')}. {rng.choice(SURNAMES)}" for _ in range(rng.randint(1, 5))]
+
+def synthetic_semantic_scholar_records(n: int, duplicate_ratio: float = 0.1, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Semantic Scholar search hits with a share of re-listed duplicates
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        if records and rng.random() < duplicate_ratio:
+            records.append(dict(rng.choice(records)))
+            continue
+        records.append({
+            'paperId': f"{i:040x}",
+            'title': _title(rng),
+            'authors': [{'name': name} for name in _authors(rng)],
+            'abstract': ' '.join(rng.choice(WORDS) for _ in range(80)),
+            'url': f"https://www.semanticscholar.org/paper/{i:040x}",
+            'venue': 'Synthetic',
+            'year': rng.randint(1995, 2024),
+            'externalIds': {'DOI': f"10.5555/bench.{i}"} if rng.random() < 0.5 else {}
+        })
+    return records
+
+def synthetic_arxiv_feed(n: int, seed: int = 0) -> str:
+    """
+    arXiv API Atom feed with ``n`` entries
+    """
+    rng = random.Random(seed)
+    entries = []
+    for i in range(n):
+        arxiv_id = f"{rng.randint(10, 24):02d}{rng.randint(1, 12):02d}.{i % 100000:05d}"
+        authors = ''.join(f"<author><name>{escape(name)}</name></author>" for name in _authors(rng))
+        entries.append(
+            "<entry>"
+            f"<id>http://arxiv.org/abs/{arxiv_id}v1</id>"
+            f"<published>20{arxiv_id[:2]}-{arxiv_id[2:4]}-15T12:00:00Z</published>"
+            f"<updated>20{arxiv_id[:2]}-{arxiv_id[2:4]}-15T12:00:00Z</updated>"
+            f"<title>{escape(_title(rng))}</title>"
+            f"<summary>{' '.join(rng.choice(WORDS) for _ in range(80))}</summary>"
+            f"{authors}"
+            f'<link href="http://arxiv.org/abs/{arxiv_id}v1" rel="alternate" type="text/html"/>'
+            f'<link title="pdf" href="http://arxiv.org/pdf/{arxiv_id}v1" rel="related" type="application/pdf"/>'
+            '<category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>'
+            "</entry>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom"'
+        ' xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        '<title>arXiv Query</title><id>http://arxiv.org/api/bench</id><updated>2024-01-01T00:00:00Z</updated>'
+        f'<opensearch:totalResults>{n}</opensearch:totalResults>'
+        '<opensearch:startIndex>0</opensearch:startIndex>'
+        f'<opensearch:itemsPerPage>{n}</opensearch:itemsPerPage>'
+        f"{''.join(entries)}</feed>"
+    )
+
+def synthetic_papers(n: int, seed: int = 0) -> List[ResearchPaper]:
+    return [paper for paper in map(paper_from_semantic_scholar, synthetic_semantic_scholar_records(n, seed=seed))
+            if paper]
+
+def synthetic_cassette(n: int = 10, latency: float = 0.2) -> Cassette:
+    """
+    In-memory cassette answering every source with ``n`` synthetic results
+    """
+    cassette = Cassette()
+    cassette.http[ResearchScraper.arxiv_url] = [{
+        'status': 200,
+        'headers': {'content-type': 'application/atom+xml; charset=utf-8'},
+        'body': base64.b64encode(synthetic_arxiv_feed(n).encode('utf-8')).decode('ascii'),
+        'latency': latency
+    }]
+    cassette.http[ResearchScraper.semantic_scholar_url] = [{
+        'status': 200,
+        'headers': {'content-type': 'application/json'},
+        'body': base64.b64encode(json.dumps({
+            'total': n, 'data': synthetic_semantic_scholar_records(n, seed=1)
+        }).encode('utf-8')).decode('ascii'),
+        'latency': latency
+    }]
+    cassette.scholarly[f"scholarly:{BENCHMARK_QUERY}"] = {
+        'results': [
+            {'bib': {'title': record['title'], 'author': [a['name'] for a in record['authors']],
+                     'abstract': record['abstract'], 'year': record['year']},
+             'pub_url': record['url']}
+            for record in synthetic_semantic_scholar_records(n, seed=2)
+        ],
+        'latency': latency
+    }
+    return cassette
+
+def measure(func: Callable[[], Any], repeat: int = 3, setup: Optional[Callable[[], Any]] = None) -> float:
+    """
+    Best wall-clock time in seconds over ``repeat`` runs. ``setup`` runs
+    untimed before each run and its result is passed to ``func``.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        args = (setup(),) if setup else ()
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def bench_search(cassette: Cassette, query: str, repeat: int,
+                 latency: Optional[float], latency_scale: float) -> float:
+    def run():
+        scraper = ResearchScraper(max_results=10, breakers=CircuitBreakerRegistry())
+        replay_scraper(scraper, cassette, latency=latency, latency_scale=latency_scale, strict=False)
+        try:
+            result = scraper.search(query)
+        finally:
+            scraper.close()
+        if result.partial:
+            logging.warning(f"Replayed search was partial: {result.sources}")
+    return measure(run, repeat)
+
+def bench_sizes(sizes: List[int], repeat: int) -> Dict[str, float]:
+    results = {}
+    for n in sizes:
+        records = synthetic_semantic_scholar_records(n)
+        feed = synthetic_arxiv_feed(n)
+        results[f"parse_semantic_scholar[{n}]"] = measure(
+            lambda: [paper_from_semantic_scholar(record) for record in records], repeat)
+        results[f"parse_arxiv_feed[{n}]"] = measure(lambda: parse_arxiv_feed(feed), repeat)
+        # Deduplication merges into its inputs, so each run gets fresh papers
+        results[f"dedupe[{n}]"] = measure(deduplicate_papers, repeat, setup=lambda: synthetic_papers(n))
+        papers = synthetic_papers(n)
+        scraper = ResearchScraper(breakers=CircuitBreakerRegistry())
+        results[f"to_dataframe[{n}]"] = measure(lambda: scraper.to_dataframe(papers), repeat)
+        scraper.close()
+    return results
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """
+    Names of benchmarks slower than the baseline by more than ``tolerance``
+    """
+    return [name for name, seconds in results.items()
+            if name in baseline and seconds > baseline[name] * (1 + tolerance)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for ResearchScraper")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated result counts")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--query', default=BENCHMARK_QUERY)
+    parser.add_argument('--cassette', help="replay search traffic from this fixture file")
+    parser.add_argument('--record', help="run a live search and record it to this fixture file")
+    parser.add_argument('--latency', type=float, help="fixed synthetic latency per request, in seconds")
+    parser.add_argument('--latency-scale', type=float, default=1.0, help="multiplier for recorded latencies")
+    parser.add_argument('--output', help="write results as JSON")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown before failing")
+    args = parser.parse_args()
+
+    # The scraper pins its own logger to INFO, so silence per-search chatter globally
+    logging.disable(logging.INFO)
+
+    if args.record:
+        cassette = Cassette(args.record)
+        scraper = ResearchScraper()
+        record_scraper(scraper, cassette)
+        try:
+            result = scraper.search(args.query)
+        finally:
+            scraper.close()
+        cassette.save()
+        print(f"Recorded {len(result.papers)} papers for '{args.query}' to {args.record}")
+        return
+
+    if args.cassette:
+        cassette, query = Cassette(args.cassette), args.query
+    else:
+        cassette, query = synthetic_cassette(), BENCHMARK_QUERY
+
+    results = {'search_latency': bench_search(cassette, query, args.repeat, args.latency, args.latency_scale)}
+    results.update(bench_sizes([int(size) for size in args.sizes.split(',')], args.repeat))
+
+    width = max(len(name) for name in results)
+    for name, seconds in results.items():
+        print(f"{name:<{width}}  {seconds * 1000:10.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"Regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
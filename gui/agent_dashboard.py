@@ -7,6 +7,9 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import networkx as nx
 import pandas as pd
 import random
+import queue
+import threading
+import webbrowser
 from datetime import datetime
 
 # Add the project root to the Python path
@@ -43,7 +46,7 @@ class MARCDashboard:
         self.coordinator = CoordinatorAgent()
         self.research_agent = ResearchAgent(research_domain="AI")
         self.analytics_agent = AnalyticsAgent()
-        self.paper_agent = PaperAgent()
+        self.paper_agent = PaperAgent(llm_manager=self.llm_manager)
         print("Agents created.")
 
         # Register agents
@@ -407,6 +410,11 @@ class MARCDashboard:
         export_bibtex_btn = ttk.Button(import_export_frame, text="Export BibTeX", command=self.export_bibtex)
         export_bibtex_btn.pack(side=tk.LEFT, padx=5, pady=5)
 
+        # Progress of imports and exports running in the background
+        self.library_task_progress = ttk.Progressbar(left_frame, mode='determinate', maximum=1.0)
+        self.library_task_label = ttk.Label(left_frame, text="", foreground="gray", wraplength=300)
+        self.library_task_label.pack(fill=tk.X, padx=5, pady=(0, 5))
+
         # Right panel for library display and search
         right_frame = ttk.Frame(paned)
         paned.add(right_frame, weight=2)
@@ -439,7 +447,7 @@ class MARCDashboard:
         library_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Create tree view with more columns
-        columns = ("Title", "Authors", "Topics", "Added Date", "Citations")
+        columns = ("Title", "Authors", "Source", "Date", "URL")
         self.paper_library_tree = ttk.Treeview(library_frame, columns=columns, show="headings")
         
         # Configure columns
@@ -463,14 +471,15 @@ class MARCDashboard:
         # Context menu
         self.create_library_context_menu()
 
-        # Load sample data
-        self.load_sample_library_data()
+        # Load papers stored in the library
+        self.load_library_data()
 
     def create_library_context_menu(self):
         self.library_menu = tk.Menu(self.master, tearoff=0)
         self.library_menu.add_command(label="View Details", command=self.view_selected_paper)
         self.library_menu.add_command(label="Open URL", command=self.open_paper_url)
         self.library_menu.add_command(label="Copy Citation", command=self.copy_citation)
+        self.library_menu.add_command(label="Related Papers", command=self.show_related_papers)
         self.library_menu.add_separator()
         self.library_menu.add_command(label="Edit", command=self.edit_paper)
         self.library_menu.add_command(label="Delete", command=self.delete_paper)
@@ -494,8 +503,9 @@ class MARCDashboard:
     def open_paper_url(self):
         selected = self.paper_library_tree.selection()
         if selected:
-            # Implement URL opening logic
-            pass
+            url = str(self.paper_library_tree.item(selected[0])["values"][4])
+            if url.startswith(('http://', 'https://')):
+                webbrowser.open(url)
 
     def copy_citation(self):
         selected = self.paper_library_tree.selection()
@@ -507,6 +517,24 @@ class MARCDashboard:
             self.master.clipboard_append(citation)
             messagebox.showinfo("Success", "Citation copied to clipboard!")
 
+    def show_related_papers(self):
+        selected = self.paper_library_tree.selection()
+        if not selected:
+            return
+        related = self.paper_agent.related_papers(int(selected[0]), k=10)
+        if not related:
+            messagebox.showinfo("Related Papers", "No related papers found in the library.")
+            return
+
+        related_window = tk.Toplevel(self.master)
+        related_window.title("Related Papers")
+        related_window.geometry("600x300")
+        related_list = tk.Listbox(related_window)
+        related_list.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        for paper in related:
+            related_list.insert(tk.END, f"{paper.title} ({', '.join(paper.authors[:3])})")
+        ttk.Button(related_window, text="Close", command=related_window.destroy).pack(pady=5)
+
     def edit_paper(self):
         selected = self.paper_library_tree.selection()
         if selected:
@@ -516,7 +544,9 @@ class MARCDashboard:
     def delete_paper(self):
         selected = self.paper_library_tree.selection()
         if selected and messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this paper?"):
-            self.paper_library_tree.delete(selected)
+            if self.paper_agent.library is not None:
+                self.paper_agent.library.delete(int(item) for item in selected)
+            self.paper_library_tree.delete(*selected)
 
     def sort_library(self, column):
         # Get all items
@@ -532,20 +562,111 @@ class MARCDashboard:
         # Reverse sort next time
         self.sort_reverse = not getattr(self, "sort_reverse", False)
 
+    def run_library_task(self, work, on_done, description):
+        """
+        Run ``work(report)`` on a worker thread; it calls ``report(text,
+        fraction)`` to update the progress bar, and ``on_done`` gets its
+        result on the Tk thread
+        """
+        updates = queue.Queue()
+
+        def run():
+            try:
+                result = work(lambda text, fraction=None: updates.put(('progress', text, fraction)))
+                updates.put(('done', result, None))
+            except Exception as e:
+                updates.put(('error', e, None))
+
+        self.library_task_progress['value'] = 0
+        self.library_task_progress.pack(fill=tk.X, padx=5, pady=(0, 5), before=self.library_task_label)
+        self.library_task_label.config(text=description, foreground="gray")
+        threading.Thread(target=run, daemon=True).start()
+        self.master.after(100, lambda: self.drain_library_task(updates, on_done))
+
+    def drain_library_task(self, updates, on_done):
+        try:
+            while True:
+                kind, value, fraction = updates.get_nowait()
+                if kind == 'progress':
+                    self.library_task_label.config(text=value, foreground="gray")
+                    if fraction is not None:
+                        self.library_task_progress['value'] = fraction
+                    continue
+                self.library_task_progress.pack_forget()
+                if kind == 'error':
+                    self.library_task_label.config(text=f"Error: {value}", foreground="red")
+                else:
+                    on_done(value)
+                return
+        except queue.Empty:
+            self.master.after(100, lambda: self.drain_library_task(updates, on_done))
+
     def import_bibtex(self):
         file_path = filedialog.askopenfilename(
             title="Select BibTeX File",
             filetypes=[("BibTeX files", "*.bib"), ("All files", "*.*")]
         )
-        if file_path:
-            # Implement BibTeX import logic
-            messagebox.showinfo("Success", "BibTeX file imported successfully!")
+        if not file_path:
+            return
+
+        def work(report):
+            return self.paper_agent.import_bibtex(file_path, progress=lambda done, total, stored: report(
+                f"Imported {stored} papers ({done / 2**20:.0f} of {total / 2**20:.0f} MB read)",
+                done / total if total else 1.0))
+
+        def done(stats):
+            self.load_library_data()
+            self.library_task_label.config(
+                text=f"Imported {stats['stored']} papers from BibTeX ({stats['added']} new)", foreground="green")
+
+        self.run_library_task(work, done, "Importing BibTeX...")
 
     def import_from_doi(self):
-        doi = simpledialog.askstring("Import from DOI", "Enter DOI:")
-        if doi:
-            # Implement DOI import logic
-            messagebox.showinfo("Success", "Paper imported from DOI successfully!")
+        doi_window = tk.Toplevel(self.master)
+        doi_window.title("Import from DOI")
+        doi_window.geometry("500x350")
+        ttk.Label(doi_window, text="Paste DOIs (one per line, or any text containing them):").pack(
+            anchor=tk.W, padx=10, pady=(10, 0))
+        doi_text = scrolledtext.ScrolledText(doi_window, height=12)
+        doi_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        def load_file():
+            file_path = filedialog.askopenfilename(
+                parent=doi_window,
+                title="Select DOI List",
+                filetypes=[("Text files", "*.txt *.csv"), ("All files", "*.*")]
+            )
+            if file_path:
+                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                    doi_text.insert(tk.END, f.read())
+
+        def start_import():
+            text = doi_text.get("1.0", tk.END)
+            doi_window.destroy()
+
+            def work(report):
+                return self.paper_agent.import_dois(text, progress=lambda done, total, stored: report(
+                    f"Resolved {done} of {total} DOIs, {stored} papers stored", done / total if total else 1.0))
+
+            def done(stats):
+                self.load_library_data()
+                if not stats['requested']:
+                    self.library_task_label.config(text="No DOIs found in the input", foreground="orange")
+                    return
+                missing = len(stats['not_found']) + len(stats['failed'])
+                self.library_task_label.config(
+                    text=f"Imported {stats['stored']} of {stats['requested']} DOIs ({stats['added']} new, "
+                         f"{stats['throughput']:.0f} DOIs/s, {stats['hit_rate']:.0%} cached"
+                         f"{f', {missing} unresolved' if missing else ''})",
+                    foreground="green" if not missing else "orange")
+
+            self.run_library_task(work, done, "Resolving DOIs...")
+
+        buttons = ttk.Frame(doi_window)
+        buttons.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(buttons, text="Load File...", command=load_file).pack(side=tk.LEFT)
+        ttk.Button(buttons, text="Import", command=start_import).pack(side=tk.RIGHT)
+        ttk.Button(buttons, text="Cancel", command=doi_window.destroy).pack(side=tk.RIGHT, padx=5)
 
     def export_bibtex(self):
         file_path = filedialog.asksaveasfilename(
@@ -553,20 +674,32 @@ class MARCDashboard:
             defaultextension=".bib",
             filetypes=[("BibTeX files", "*.bib"), ("All files", "*.*")]
         )
-        if file_path:
-            # Implement BibTeX export logic
-            messagebox.showinfo("Success", "Library exported to BibTeX successfully!")
+        if not file_path:
+            return
 
-    def load_sample_library_data(self):
-        sample_data = [
-            ("Deep Learning in Multi-Agent Systems", "Smith, J., Jones, K.", "ML, AI", "2023-01-15", 150),
-            ("Natural Language Processing for Agents", "Brown, M.", "NLP, AI", "2023-02-20", 75),
-            ("Cooperative Robot Learning", "Wilson, R., Taylor, S.", "Robotics, AI", "2023-03-10", 120),
-            ("Multi-Agent Reinforcement Learning", "Davis, A.", "ML, AI", "2023-04-05", 200),
-        ]
+        def work(report):
+            return self.paper_agent.export_papers(filename=file_path, export_format='bibtex', from_library=True)
 
-        for item in sample_data:
-            self.paper_library_tree.insert("", tk.END, values=item)
+        def done(path):
+            if path:
+                self.library_task_label.config(text=f"Library exported to {path}", foreground="green")
+            else:
+                self.library_task_label.config(text="BibTeX export failed, see the log", foreground="red")
+
+        self.run_library_task(work, done, "Exporting library to BibTeX...")
+
+    def load_library_data(self, rows=None):
+        """
+        Show library papers, the most recently added ones by default
+        """
+        if rows is None:
+            rows = self.paper_agent.library.recent() if self.paper_agent.library is not None else []
+
+        self.paper_library_tree.delete(*self.paper_library_tree.get_children())
+        for paper_id, paper in rows:
+            self.paper_library_tree.insert("", tk.END, iid=str(paper_id), values=(
+                paper.title, ", ".join(paper.authors), paper.source, paper.publication_date or "", paper.url
+            ))
 
     def create_agent_network_tab(self):
         # Agent Network Visualization Tab
@@ -778,47 +911,58 @@ class MARCDashboard:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         def search_papers():
-            try:
-                query = search_entry.get().strip()
-                if not query:
-                    self.status_label.config(text="Please enter a search query.", foreground="red")
-                    return
-
-                # Clear previous results
-                for i in self.research_papers_tree.get_children():
-                    self.research_papers_tree.delete(i)
-
-                # Show progress bar and update status
-                self.search_progress.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(0, 5))
-                self.search_progress.start(10)
-                self.status_label.config(text="Searching papers...", foreground="gray")
-                self.master.update()
-
-                # Search papers
-                papers = self.paper_agent.search_papers(query)
-
-                # Hide progress bar
-                self.search_progress.stop()
-                self.search_progress.pack_forget()
+            query = search_entry.get().strip()
+            if not query:
+                self.status_label.config(text="Please enter a search query.", foreground="red")
+                return
 
-                if papers:
-                    # Update treeview with results
-                    for paper in papers:
+            # Clear previous results
+            for i in self.research_papers_tree.get_children():
+                self.research_papers_tree.delete(i)
+
+            # Show progress bar and update status
+            self.search_progress.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(0, 5))
+            self.search_progress.start(10)
+            self.status_label.config(text="Searching papers...", foreground="gray")
+
+            # Stream results on a worker thread; the Tk loop drains the queue
+            events = queue.Queue()
+
+            def run_search():
+                try:
+                    for event in self.paper_agent.search_papers_stream(query):
+                        events.put(event)
+                except Exception as e:
+                    events.put(e)
+                events.put(None)
+
+            threading.Thread(target=run_search, daemon=True).start()
+            self.master.after(100, lambda: drain_search_events(events, {}, 0))
+
+        def drain_search_events(events, source_status, found):
+            finished = False
+            try:
+                while True:
+                    event = events.get_nowait()
+                    if event is None:
+                        finished = True
+                        break
+                    if isinstance(event, Exception):
+                        raise event
+
+                    # Update treeview with the new results
+                    for paper in event.papers:
                         self.research_papers_tree.insert("", tk.END, values=(
                             paper.title,
                             ", ".join(paper.authors),
                             paper.source,
                             paper.url
                         ))
-                    self.status_label.config(
-                        text=f"Found {len(papers)} papers from multiple sources.",
-                        foreground="green"
-                    )
-                else:
-                    self.status_label.config(
-                        text="No papers found. Try a different search query.",
-                        foreground="orange"
-                    )
+                    found += len(event.papers)
+                    if event.status != 'papers':
+                        source_status[event.source] = event.status
+            except queue.Empty:
+                pass
             except Exception as e:
                 self.search_progress.stop()
                 self.search_progress.pack_forget()
@@ -826,6 +970,31 @@ class MARCDashboard:
                     text=f"Error searching papers: {str(e)}",
                     foreground="red"
                 )
+                return
+
+            progress = " | ".join(f"{source}: {status}" for source, status in source_status.items())
+            if not finished:
+                self.status_label.config(text=f"Found {found} papers so far. {progress}", foreground="gray")
+                self.master.after(100, lambda: drain_search_events(events, source_status, found))
+                return
+
+            # Hide progress bar
+            self.search_progress.stop()
+            self.search_progress.pack_forget()
+
+            # The search results were added to the library
+            self.load_library_data()
+
+            if found:
+                self.status_label.config(
+                    text=f"Found {found} papers from multiple sources. {progress}",
+                    foreground="green"
+                )
+            else:
+                self.status_label.config(
+                    text="No papers found. Try a different search query.",
+                    foreground="orange"
+                )
 
         # Buttons Frame
         buttons_frame = ttk.Frame(research_papers_frame)
@@ -974,11 +1143,15 @@ class MARCDashboard:
             )
             
             # Add paper to library
+            paper.abstract = self.paper_abstract.get("1.0", tk.END).strip()
+            paper.url = self.paper_url_entry.get().strip()
             paper_id = self.paper_agent.add_paper(paper)
+            if paper_id is None:
+                messagebox.showerror("Error", "The paper library is not available")
+                return
             
             # Update treeview
-            self.paper_library_tree.insert('', 'end', 
-                values=(paper.title, ', '.join(paper.authors), paper.publication_date))
+            self.load_library_data()
             
             # Clear input fields
             self.paper_title_entry.delete(0, tk.END)
@@ -1001,17 +1174,11 @@ class MARCDashboard:
                 messagebox.showwarning("Invalid Search", "Please enter a search keyword")
                 return
             
-            # Search papers
-            results = self.paper_agent.search_papers(keyword)
+            # Search the library's full-text index
+            results = self.paper_agent.library.search(keyword, limit=500) if self.paper_agent.library is not None else []
 
-            # Clear existing treeview
-            for i in self.paper_library_tree.get_children():
-                self.paper_library_tree.delete(i)
-            
             # Populate treeview with results
-            for paper in results:
-                self.paper_library_tree.insert('', 'end', 
-                    values=(paper.title, ', '.join(paper.authors), paper.publication_date))
+            self.load_library_data(results)
             
             # Update collaboration log
             self.log_collaboration(f"Searched papers with keyword: {keyword}")
@@ -1044,7 +1211,7 @@ class MARCDashboard:
 
     def export_research_papers(self):
         """
-        Export collected research papers to a CSV file
+        Export collected research papers to CSV, JSON Lines or Parquet
         """
         try:
             # Get the current collected papers from the PaperAgent
@@ -1057,14 +1224,16 @@ class MARCDashboard:
             # Open a file dialog to choose export location
             export_filename = filedialog.asksaveasfilename(
                 defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
+                filetypes=[("CSV files", "*.csv"), ("Compressed CSV", "*.csv.gz"),
+                           ("JSON Lines", "*.jsonl"), ("Compressed JSON Lines", "*.jsonl.gz"),
+                           ("Parquet", "*.parquet")],
                 initialdir=os.path.join(project_root, 'exports')
             )
             
             if export_filename:
                 # Export papers to the chosen file
-                exported_file = self.paper_agent.export_papers_to_csv(
-                    papers=papers, 
+                exported_file = self.paper_agent.export_papers(
+                    papers=papers,
                     filename=os.path.basename(export_filename)
                 )
                 
@@ -1095,7 +1264,6 @@ class MARCDashboard:
             paper_url = item_values[-1]
             
             if paper_url and paper_url.startswith(('http://', 'https://')):
-                import webbrowser
                 webbrowser.open(paper_url)
             else:
                 messagebox.showinfo("Open Link", "No valid URL found for this paper.")
@@ -1109,10 +1277,10 @@ class MARCDashboard:
         if not selected_item:
             return
 
-        # Get paper details from the selected item
+        # Get paper details from the library
         item = selected_item[0]
-        values = self.paper_library_tree.item(item)['values']
-        if not values:
+        paper = self.paper_agent.library.get(int(item)) if self.paper_agent.library is not None else None
+        if paper is None:
             return
 
         # Create a new window for paper details
@@ -1126,24 +1294,24 @@ class MARCDashboard:
 
         # Add paper details
         ttk.Label(frame, text="Title:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
-        ttk.Label(frame, text=values[0], wraplength=550).pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(frame, text=paper.title, wraplength=550).pack(anchor=tk.W, pady=(0, 10))
 
         ttk.Label(frame, text="Authors:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
-        ttk.Label(frame, text=values[1], wraplength=550).pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(frame, text=", ".join(paper.authors), wraplength=550).pack(anchor=tk.W, pady=(0, 10))
 
         ttk.Label(frame, text="Abstract:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
         abstract_text = scrolledtext.ScrolledText(frame, wrap=tk.WORD, height=8)
-        abstract_text.insert(tk.END, values[2])
+        abstract_text.insert(tk.END, paper.abstract)
         abstract_text.configure(state='disabled')
         abstract_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
         ttk.Label(frame, text="URL:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
-        url_text = ttk.Label(frame, text=values[3], wraplength=550, foreground="blue", cursor="hand2")
+        url_text = ttk.Label(frame, text=paper.url, wraplength=550, foreground="blue", cursor="hand2")
         url_text.pack(anchor=tk.W, pady=(0, 10))
         url_text.bind("<Button-1>", lambda e: self.open_paper_url())
 
-        ttk.Label(frame, text="Topics:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
-        ttk.Label(frame, text=values[4], wraplength=550).pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(frame, text="Source:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
+        ttk.Label(frame, text=paper.source, wraplength=550).pack(anchor=tk.W, pady=(0, 10))
 
         # Add a close button
         ttk.Button(frame, text="Close", command=details_window.destroy).pack(pady=10)
@@ -0,0 +1,345 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.circuit_breaker import CircuitBreakerRegistry, default_registry
+from src.http_cache import CacheMissError, HTTPCache
+from src.research_scraper import (
+    SEMANTIC_SCHOLAR_FIELDS,
+    PaperDeduplicator,
+    ResearchPaper,
+    ResearchScraper,
+    SearchEvent,
+    deduplicate_papers,
+    paper_from_semantic_scholar,
+    parse_arxiv_feed,
+)
+
+# Optional aiohttp import with error handling
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logging.warning("aiohttp not available. The asyncio scraping engine is disabled.")
+
+ARXIV_API_URL = ResearchScraper.arxiv_url
+SEMANTIC_SCHOLAR_API_URL = ResearchScraper.semantic_scholar_url
+
+class AsyncResearchScraper:
+    """
+    Asyncio scraping engine with pooled keep-alive HTTP connections.
+
+    A single aiohttp session is shared by every query, connections are capped
+    per host, and paginated sources fetch all their pages concurrently.
+    Endpoint URLs are constructor arguments so the engine can be pointed at
+    local stand-in servers.
+    """
+    def __init__(self,
+                 max_results: int = 10,
+                 page_size: int = 100,
+                 max_connections: int = 20,
+                 limit_per_host: int = 4,
+                 host_limits: Optional[Dict[str, int]] = None,
+                 timeout: float = 10.0,
+                 arxiv_url: str = ARXIV_API_URL,
+                 semantic_scholar_url: str = SEMANTIC_SCHOLAR_API_URL,
+                 include_google_scholar: bool = False,
+                 scholar_workers: int = 1,
+                 scraper: Optional[ResearchScraper] = None,
+                 cache: Optional[HTTPCache] = None,
+                 breakers: Optional[CircuitBreakerRegistry] = None):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncResearchScraper")
+
+        self.max_results = max_results
+        self.page_size = page_size
+        self.max_connections = max_connections
+        self.limit_per_host = limit_per_host
+        self.host_limits = host_limits or {}
+        self.timeout = timeout
+        self.arxiv_url = arxiv_url
+        self.semantic_scholar_url = semantic_scholar_url
+        self.include_google_scholar = include_google_scholar
+        self.scholar_workers = scholar_workers
+        self.scraper = scraper
+        self.cache = cache
+        self.breakers = breakers or default_registry
+
+        self.logger = logging.getLogger(__name__)
+        self.session: Optional['aiohttp.ClientSession'] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._scholar_executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> 'AsyncResearchScraper':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """
+        Create the shared session and its keep-alive connection pool
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.limit_per_host
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+
+    async def close(self) -> None:
+        """
+        Close the session and any blocking-source worker threads
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self._scholar_executor is not None:
+            self._scholar_executor.shutdown(wait=False)
+            self._scholar_executor = None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_semaphores:
+            limit = self.host_limits.get(host, self.limit_per_host)
+            self._host_semaphores[host] = asyncio.Semaphore(limit)
+        return self._host_semaphores[host]
+
+    async def fetch(self, url: str, params: Optional[Dict[str, Any]] = None, as_json: bool = False) -> Any:
+        """
+        GET a URL through the pooled session, honouring the per-host limit
+        and serving or revalidating through the response cache when set
+        """
+        body = await self._fetch_body(url, params)
+        if as_json:
+            return json.loads(body)
+        return body.decode('utf-8')
+
+    async def _fetch_body(self, url: str, params: Optional[Dict[str, Any]]) -> bytes:
+        key = entry = None
+        headers = {}
+        if self.cache is not None:
+            key = self.cache.key_for(url, params)
+            entry = self.cache.lookup(key)
+            if self.cache.can_serve(entry):
+                return entry.body
+            if self.cache.cache_only:
+                raise CacheMissError(f"No cached response for {key}")
+            headers = self.cache.conditional_headers(entry)
+
+        await self.open()
+        async with self._host_semaphore(url):
+            async with self.session.get(url, params=params, headers=headers) as response:
+                if response.status == 304 and entry is not None:
+                    self.cache.refresh(key)
+                    return entry.body
+                response.raise_for_status()
+                body = await response.read()
+                if self.cache is not None:
+                    self.cache.store(key, dict(response.headers), body)
+                return body
+
+    def _page_offsets(self) -> List[int]:
+        return list(range(0, self.max_results, self.page_size))
+
+    def _page_limit(self, offset: int) -> int:
+        return min(self.page_size, self.max_results - offset)
+
+    async def fetch_arxiv_page(self, query: str, offset: int) -> List[ResearchPaper]:
+        """
+        Fetch one page of arXiv results starting at ``offset``
+        """
+        params = {
+            'search_query': f'all:{query}',
+            'start': offset,
+            'max_results': self._page_limit(offset),
+            'sortBy': 'relevance'
+        }
+        return parse_arxiv_feed(await self.fetch(self.arxiv_url, params))
+
+    async def fetch_semantic_scholar_page(self, query: str, offset: int) -> List[ResearchPaper]:
+        """
+        Fetch one page of Semantic Scholar results starting at ``offset``
+        """
+        params = {
+            'query': query,
+            'offset': offset,
+            'limit': self._page_limit(offset),
+            'fields': SEMANTIC_SCHOLAR_FIELDS
+        }
+        data = await self.fetch(self.semantic_scholar_url, params, as_json=True)
+        papers = []
+        for paper_data in data.get('data', []):
+            try:
+                paper = paper_from_semantic_scholar(paper_data)
+                if paper:
+                    papers.append(paper)
+            except Exception as e:
+                self.logger.warning(f"Error processing Semantic Scholar result: {e}")
+        return papers
+
+    async def search_arxiv(self, query: str) -> List[ResearchPaper]:
+        """
+        Search arXiv, fetching all result pages concurrently
+        """
+        breaker = self.breakers.get('arXiv')
+        if not breaker.allow():
+            return []
+        try:
+            pages = await asyncio.gather(*(self.fetch_arxiv_page(query, offset)
+                                           for offset in self._page_offsets()))
+            papers = [paper for page in pages for paper in page][:self.max_results]
+            breaker.record_success()
+            self.logger.info(f"Found {len(papers)} papers from arXiv")
+            return papers
+        except Exception as e:
+            breaker.record_failure()
+            self.logger.error(f"Error scraping arXiv: {e}")
+            return []
+
+    async def search_semantic_scholar(self, query: str) -> List[ResearchPaper]:
+        """
+        Search Semantic Scholar, fetching all result pages concurrently
+        """
+        breaker = self.breakers.get('Semantic Scholar')
+        if not breaker.allow():
+            return []
+        try:
+            pages = await asyncio.gather(*(self.fetch_semantic_scholar_page(query, offset)
+                                           for offset in self._page_offsets()))
+            papers = [paper for page in pages for paper in page][:self.max_results]
+            breaker.record_success()
+            self.logger.info(f"Found {len(papers)} papers from Semantic Scholar")
+            return papers
+        except Exception as e:
+            breaker.record_failure()
+            self.logger.error(f"Error scraping Semantic Scholar: {e}")
+            return []
+
+    async def search_google_scholar(self, query: str) -> List[ResearchPaper]:
+        """
+        Search Google Scholar on a small shared worker pool, since scholarly
+        is blocking and has no asyncio interface
+        """
+        return await self._in_scholar_worker('scrape_google_scholar', query)
+
+    async def _in_scholar_worker(self, method: str, query: str) -> List[ResearchPaper]:
+        if self._scholar_executor is None:
+            self._scholar_executor = ThreadPoolExecutor(max_workers=self.scholar_workers)
+        if self.scraper is None:
+            self.scraper = ResearchScraper(max_results=self.max_results)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._scholar_executor, getattr(self.scraper, method), query)
+
+    async def search_all(self, query: str) -> List[ResearchPaper]:
+        """
+        Search every configured source concurrently and deduplicate
+        """
+        searches = [self.search_arxiv(query), self.search_semantic_scholar(query)]
+        if self.include_google_scholar:
+            searches.append(self.search_google_scholar(query))
+
+        results = await asyncio.gather(*searches)
+        unique_papers = deduplicate_papers([paper for papers in results for paper in papers])
+        self.logger.info(f"Total unique papers found for '{query}': {len(unique_papers)}")
+        return unique_papers
+
+    async def stream_all(self, query: str, deadline: Optional[float] = None) -> AsyncIterator[SearchEvent]:
+        """
+        Search every configured source, yielding deduplicated papers page by
+        page as each response arrives. Sources still running when the
+        ``deadline`` (seconds) expires are cancelled and reported 'timed_out'.
+        """
+        dedupe = PaperDeduplicator()
+        started_at = asyncio.get_running_loop().time()
+        expires_at = None if deadline is None else started_at + deadline
+        page_fetchers = {
+            'arXiv': self.fetch_arxiv_page,
+            'Semantic Scholar': self.fetch_semantic_scholar_page
+        }
+
+        tasks: Dict[asyncio.Task, str] = {}
+        pages_left: Dict[str, int] = {}
+        for source_name, fetch_page in page_fetchers.items():
+            # Sources with an open circuit are skipped without a request
+            if not self.breakers.get(source_name).allow():
+                yield SearchEvent(source=source_name, status='skipped', error='circuit open')
+                continue
+            for offset in self._page_offsets():
+                tasks[asyncio.ensure_future(fetch_page(query, offset))] = source_name
+            pages_left[source_name] = len(self._page_offsets())
+            yield SearchEvent(source=source_name, status='started')
+        if self.include_google_scholar:
+            # Gated and recorded here like the paged sources, so the unguarded search runs
+            if not self.breakers.get('Google Scholar').allow():
+                yield SearchEvent(source='Google Scholar', status='skipped', error='circuit open')
+            else:
+                tasks[asyncio.ensure_future(self._in_scholar_worker('_search_google_scholar', query))] = 'Google Scholar'
+                pages_left['Google Scholar'] = 1
+                yield SearchEvent(source='Google Scholar', status='started')
+
+        def record(source_name: str, success: bool) -> None:
+            if success:
+                self.breakers.get(source_name).record_success()
+            else:
+                self.breakers.get(source_name).record_failure()
+
+        failed = set()
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = None if expires_at is None else max(0.0, expires_at - asyncio.get_running_loop().time())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                elapsed = asyncio.get_running_loop().time() - started_at
+                if not done:
+                    for source_name in {tasks[task] for task in pending} - failed:
+                        record(source_name, False)
+                        self.logger.warning(f"{source_name} missed its search deadline; returning partial results")
+                        yield SearchEvent(source=source_name, status='timed_out', elapsed=elapsed)
+                    break
+                for task in done:
+                    source_name = tasks[task]
+                    pages_left[source_name] -= 1
+                    if source_name in failed:
+                        # Retrieve the outcome of the source's other pages so it is not reported unhandled
+                        if not task.cancelled():
+                            task.exception()
+                        continue
+                    try:
+                        new_papers = dedupe.add(task.result())
+                    except Exception as e:
+                        self.logger.error(f"Error retrieving papers from {source_name}: {e}")
+                        record(source_name, False)
+                        failed.add(source_name)
+                        yield SearchEvent(source=source_name, status='failed', error=str(e), elapsed=elapsed)
+                        continue
+                    if new_papers or dedupe.enriched:
+                        yield SearchEvent(source=source_name, status='papers', papers=new_papers, elapsed=elapsed,
+                                          enriched=dedupe.enriched)
+                    if pages_left[source_name] == 0:
+                        record(source_name, True)
+                        yield SearchEvent(source=source_name, status='completed', elapsed=elapsed)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def search_many(self, queries: List[str]) -> Dict[str, List[ResearchPaper]]:
+        """
+        Run many queries concurrently over the shared connection pool
+        """
+        results = await asyncio.gather(*(self.search_all(query) for query in queries))
+        return dict(zip(queries, results))
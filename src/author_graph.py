@@ -0,0 +1,318 @@
+import logging
+import os
+import sys
+import threading
+from array import array
+from itertools import combinations
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    logging.warning("scipy not available. Author graph analysis will be disabled.")
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_identity import PLACEHOLDER_AUTHORS, _fold
+
+def author_key(name: str) -> Optional[str]:
+    """
+    Case-, accent- and spacing-insensitive key for an author name, or None
+    for placeholders such as "Unknown Author"
+    """
+    key = ' '.join(_fold(name or '').split())
+    return key if key and key not in PLACEHOLDER_AUTHORS else None
+
+def pagerank(matrix, damping: float = 0.85, tol: float = 1e-6, max_iter: int = 100,
+             start: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    PageRank of a symmetric weighted adjacency matrix by power iteration;
+    nodes without edges spread their rank uniformly
+    """
+    n = matrix.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    degree = np.asarray(matrix.sum(axis=1)).ravel()
+    inverse = np.divide(1.0, degree, out=np.zeros(n), where=degree > 0)
+    dangling = degree == 0
+    rank = np.full(n, 1.0 / n) if start is None else start / start.sum()
+    for _ in range(max_iter):
+        # Symmetric, so rows pull from neighbours exactly like columns push
+        following = damping * (matrix @ (rank * inverse))
+        following += (1 - damping + damping * rank[dangling].sum()) / n
+        converged = np.abs(following - rank).sum() < tol
+        rank = following
+        if converged:
+            break
+    return rank
+
+class AuthorGraph:
+    """
+    Paper-author and co-author graphs, grown incrementally as papers arrive.
+
+    Every paper adds its (paper, author) pairs and its co-author pairs to
+    append-only edge logs. Before a query the pending edges are folded into
+    compact CSR matrices, the paper x author incidence and the weighted
+    author x author co-authorship (shared paper counts), with one sparse
+    addition instead of a rebuild from the papers. Connected components
+    of the paper-author graph are kept current by a union-find updated on
+    every paper. PageRank is warm-started from the previous ranks, so after
+    a small update it converges in a few iterations; PageRank restricted to
+    a tag (e.g. a category) runs on the co-author graph induced by the
+    tagged papers and is cached until new papers arrive.
+    """
+    def __init__(self,
+                 key: Callable[[str], Optional[str]] = author_key,
+                 damping: float = 0.85,
+                 max_clique: int = 50):
+        self.key = key
+        self.damping = damping
+        # Papers with huge author lists (consortia) add incidence edges only
+        self.max_clique = max_clique
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self.papers: List[Any] = []
+        self.names: List[str] = []
+        self._author_ids: Dict[str, int] = {}
+        self._paper_ids: Dict[Any, int] = {}
+        self._tags: Dict[str, array] = {}
+        self._parent = array('i')
+
+        # Edge logs not yet folded into the CSR matrices
+        self._pending_papers = array('i')
+        self._pending_authors = array('i')
+        self._pending_left = array('i')
+        self._pending_right = array('i')
+
+        self._incidence = None
+        self._authored = None
+        self._coauthors = None
+        self._ranks: Optional[np.ndarray] = None
+        self._tag_ranks: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    @property
+    def author_count(self) -> int:
+        return len(self.names)
+
+    def _find(self, author: int) -> int:
+        parent = self._parent
+        root = author
+        while parent[root] != root:
+            root = parent[root]
+        while parent[author] != root:
+            parent[author], author = root, parent[author]
+        return root
+
+    def _union(self, first: int, second: int) -> None:
+        first, second = self._find(first), self._find(second)
+        if first != second:
+            self._parent[max(first, second)] = min(first, second)
+
+    def add(self, papers: Iterable[Any], tags: Optional[Iterable[Iterable[str]]] = None,
+            keys: Optional[Iterable[Any]] = None) -> int:
+        """
+        Add papers with optional per-paper tags and identity keys (e.g.
+        library ids; papers whose key is already present are skipped), and
+        return how many were added
+        """
+        papers = list(papers)
+        tags = list(tags) if tags is not None else [()] * len(papers)
+        keys = list(keys) if keys is not None else [None] * len(papers)
+        added = 0
+        with self._lock:
+            for paper, paper_tags, paper_key in zip(papers, tags, keys):
+                if paper_key is not None:
+                    if paper_key in self._paper_ids:
+                        continue
+                    self._paper_ids[paper_key] = len(self.papers)
+                paper_id = len(self.papers)
+                self.papers.append(paper)
+                added += 1
+                for tag in paper_tags:
+                    self._tags.setdefault(tag, array('i')).append(paper_id)
+
+                authors = []
+                for name in paper.authors or ():
+                    key = self.key(name)
+                    if key is None:
+                        continue
+                    author = self._author_ids.get(key)
+                    if author is None:
+                        author = self._author_ids[key] = len(self.names)
+                        self.names.append(name.strip())
+                        self._parent.append(author)
+                    if author not in authors:
+                        authors.append(author)
+
+                for author in authors:
+                    self._pending_papers.append(paper_id)
+                    self._pending_authors.append(author)
+                    self._union(authors[0], author)
+                if len(authors) <= self.max_clique:
+                    for left, right in combinations(authors, 2):
+                        self._pending_left.append(left)
+                        self._pending_right.append(right)
+            if added:
+                self._tag_ranks.clear()
+        return added
+
+    def _refresh(self) -> None:
+        # Called with the lock held: fold pending edges into the CSR matrices
+        n_papers, n_authors = len(self.papers), len(self.names)
+        if self._incidence is None:
+            self._incidence = sp.csr_matrix((n_papers, n_authors), dtype=np.float32)
+            self._coauthors = sp.csr_matrix((n_authors, n_authors), dtype=np.float32)
+        if self._incidence.shape == (n_papers, n_authors) and not len(self._pending_papers):
+            return
+
+        rows = np.frombuffer(self._pending_papers, dtype=np.int32)
+        cols = np.frombuffer(self._pending_authors, dtype=np.int32)
+        self._incidence.resize((n_papers, n_authors))
+        self._incidence = self._incidence + sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n_papers, n_authors))
+
+        left = np.frombuffer(self._pending_left, dtype=np.int32)
+        right = np.frombuffer(self._pending_right, dtype=np.int32)
+        self._coauthors.resize((n_authors, n_authors))
+        self._coauthors = self._coauthors + sp.csr_matrix(
+            (np.ones(2 * len(left), dtype=np.float32), (np.concatenate([left, right]), np.concatenate([right, left]))),
+            shape=(n_authors, n_authors))
+
+        self._pending_papers, self._pending_authors = array('i'), array('i')
+        self._pending_left, self._pending_right = array('i'), array('i')
+        self._authored = None
+
+    def author_id(self, name: str) -> Optional[int]:
+        key = self.key(name)
+        return self._author_ids.get(key) if key is not None else None
+
+    def author_papers(self, name: str) -> List[Any]:
+        """
+        Papers listing an author
+        """
+        author = self.author_id(name)
+        if author is None:
+            return []
+        with self._lock:
+            self._refresh()
+            if self._authored is None:
+                # Author x paper, for row lookups
+                self._authored = self._incidence.T.tocsr()
+            start, end = self._authored.indptr[author], self._authored.indptr[author + 1]
+            paper_ids = self._authored.indices[start:end]
+        return [self.papers[paper_id] for paper_id in np.sort(paper_ids).tolist()]
+
+    def coauthors(self, name: str, k: int = 10) -> List[Tuple[str, int]]:
+        """
+        An author's ``k`` most frequent co-authors with their shared paper
+        counts
+        """
+        author = self.author_id(name)
+        if author is None:
+            return []
+        with self._lock:
+            self._refresh()
+            start, end = self._coauthors.indptr[author], self._coauthors.indptr[author + 1]
+            others = self._coauthors.indices[start:end]
+            weights = self._coauthors.data[start:end]
+        order = np.argsort(-weights, kind='stable')[:k]
+        return [(self.names[other], int(weights[i])) for i, other in zip(order, others[order])]
+
+    def pagerank(self) -> np.ndarray:
+        """
+        PageRank of every author in the co-author graph, by author id
+        """
+        with self._lock:
+            self._refresh()
+            n_authors = len(self.names)
+            start = None
+            if self._ranks is not None and len(self._ranks):
+                # New authors start at the average rank
+                start = np.concatenate([self._ranks, np.full(n_authors - len(self._ranks), 1.0 / n_authors)])
+            self._ranks = pagerank(self._coauthors, self.damping, start=start)
+            return self._ranks
+
+    def _tag_pagerank(self, tag: str) -> Tuple[np.ndarray, np.ndarray]:
+        # Called with the lock held: ranks on the co-author graph of the tagged papers
+        cached = self._tag_ranks.get(tag)
+        if cached is not None:
+            return cached
+        paper_ids = np.frombuffer(self._tags.get(tag, array('i')), dtype=np.int32)
+        incidence = self._incidence[paper_ids]
+        authors = np.unique(incidence.indices)
+        incidence = incidence[:, authors]
+        # Co-author counts within the tag, leaving out the oversized papers
+        small = np.diff(incidence.indptr) <= self.max_clique
+        incidence = incidence[small]
+        coauthors = (incidence.T @ incidence).tocsr()
+        coauthors.setdiag(0)
+        coauthors.eliminate_zeros()
+        cached = self._tag_ranks[tag] = (authors, pagerank(coauthors, self.damping))
+        return cached
+
+    def central_authors(self, k: int = 10, tag: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        The ``k`` authors with the highest PageRank, over all papers or only
+        the papers with ``tag``
+        """
+        if tag is None:
+            ranks = self.pagerank()
+            authors = np.arange(len(ranks))
+        else:
+            with self._lock:
+                self._refresh()
+                authors, ranks = self._tag_pagerank(tag)
+        if not len(ranks):
+            return []
+        k = min(k, len(ranks))
+        top = np.argpartition(-ranks, k - 1)[:k]
+        top = top[np.argsort(-ranks[top], kind='stable')]
+        return [(self.names[authors[i]], float(ranks[i])) for i in top]
+
+    def tags(self) -> Dict[str, int]:
+        """
+        Paper count of every tag
+        """
+        return {tag: len(paper_ids) for tag, paper_ids in self._tags.items()}
+
+    def _roots(self) -> np.ndarray:
+        # Called with the lock held: every author's union-find root, by pointer jumping
+        roots = np.frombuffer(self._parent, dtype=np.int32).copy()
+        while True:
+            jumped = roots[roots]
+            if np.array_equal(jumped, roots):
+                return roots
+            roots = jumped
+
+    def component(self, name: str) -> List[str]:
+        """
+        Every author connected to an author through shared papers
+        """
+        author = self.author_id(name)
+        if author is None:
+            return []
+        with self._lock:
+            roots = self._roots()
+        return [self.names[other] for other in np.flatnonzero(roots == roots[author]).tolist()]
+
+    def components(self, min_size: int = 2) -> List[List[str]]:
+        """
+        Groups of authors connected through shared papers, largest first
+        """
+        with self._lock:
+            roots = self._roots()
+        sizes = np.bincount(roots, minlength=len(roots))
+        order = np.argsort(roots, kind='stable')
+        groups = np.split(order, np.cumsum(sizes[sizes > 0])[:-1])
+        return sorted(([self.names[author] for author in group.tolist()] for group in groups
+                       if len(group) >= min_size), key=len, reverse=True)
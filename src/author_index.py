@@ -0,0 +1,255 @@
+import os
+import re
+import sys
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_identity import PLACEHOLDER_AUTHORS, _fold
+
+NAME_PART_PATTERN = re.compile(r"[^\W\d_]+(?:['\-][^\W\d_]+)*")
+
+# Lower-case words that start a multi-word surname ("van der Berg")
+SURNAME_PARTICLES = frozenset('van von der den de del della di da du la le dos das ter ten bin ibn al el'.split())
+NAME_SUFFIXES = frozenset('jr sr ii iii iv'.split())
+
+@dataclass(frozen=True)
+class AuthorName:
+    """
+    Parsed, accent- and case-folded author name; initials are single letters
+    """
+    surname: str
+    given: Tuple[str, ...] = ()
+
+    @property
+    def key(self) -> str:
+        """
+        Blocking key: surname and first initial
+        """
+        return f"{self.surname} {self.given[0][0]}" if self.given else self.surname
+
+    def compatible(self, other: 'AuthorName') -> bool:
+        """
+        Whether both names can denote the same person: same surname and
+        given names that agree wherever both are present, an initial
+        agreeing with any name it starts
+        """
+        if self.surname != other.surname:
+            return False
+        for mine, theirs in zip(self.given, other.given):
+            if len(mine) == 1 or len(theirs) == 1:
+                if mine[0] != theirs[0]:
+                    return False
+            elif mine != theirs:
+                return False
+        return True
+
+    def specificity(self) -> Tuple[int, int]:
+        return sum(len(part) > 1 for part in self.given), len(self.given)
+
+def _given_parts(raw_tokens: List[str]) -> Tuple[str, ...]:
+    parts = []
+    for token in raw_tokens:
+        # Glued initials such as "JA" in "Smith JA"
+        if token.isupper() and len(token) <= 3:
+            parts.extend(_fold(letter) for letter in token)
+        else:
+            parts.append(_fold(token))
+    return tuple(parts)
+
+def parse_author_name(name: str) -> Optional[AuthorName]:
+    """
+    Parse "John A. Smith", "Smith, J. A.", "J.A. Smith" or "Smith JA" into
+    surname and given names; None for empty or placeholder names
+    """
+    if not name or name.strip().lower() in PLACEHOLDER_AUTHORS:
+        return None
+    if ',' in name:
+        surname_part, given_part = name.split(',', 1)
+        surname = [_fold(token) for token in NAME_PART_PATTERN.findall(surname_part)]
+        given_tokens = [token for token in NAME_PART_PATTERN.findall(given_part)
+                        if token.lower() not in NAME_SUFFIXES]
+        if not surname:
+            return None
+        return AuthorName(' '.join(surname), _given_parts(given_tokens))
+
+    tokens = NAME_PART_PATTERN.findall(name)
+    while len(tokens) > 1 and tokens[-1].lower() in NAME_SUFFIXES:
+        tokens.pop()
+    if not tokens:
+        return None
+    if len(tokens) == 1:
+        return AuthorName(_fold(tokens[0]))
+    # "Smith JA": surname first, then glued initials
+    if len(tokens) == 2 and tokens[1].isupper() and len(tokens[1]) <= 3 and not tokens[0].isupper():
+        return AuthorName(_fold(tokens[0]), _given_parts(tokens[1:]))
+
+    start = len(tokens) - 1
+    for i in range(1, len(tokens) - 1):
+        if tokens[i] in SURNAME_PARTICLES:
+            start = i
+            break
+    surname = ' '.join(_fold(token) for token in tokens[start:])
+    return AuthorName(surname, _given_parts(tokens[:start]))
+
+class AuthorIndex:
+    """
+    Maps author name variants to canonical author ids.
+
+    Names are parsed and blocked on surname plus first initial, so a new
+    name is only compared with the few authors in its block, never with
+    every author. Within a block a name joins the compatible author ("J.
+    Smith" and "John Smith"); when several are compatible the one sharing
+    co-authors with the paper wins, then the one with exactly that form of
+    the name. A name that stays ambiguous becomes an author of its own (and
+    collects later identical mentions) rather than being attributed to the
+    wrong person.
+    Each author keeps the most complete form of their name and a
+    precomputed list of their papers, so author queries are dictionary and
+    array lookups.
+    """
+    def __init__(self):
+        self.papers: List[Any] = []
+        self.names: List[str] = []
+        self._lock = threading.Lock()
+        self._parsed: List[AuthorName] = []
+        self._variants: List[Set[str]] = []
+        self._paper_ids: List[array] = []
+        self._coauthor_keys: List[Set[str]] = []
+        self._blocks: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _resolve(self, parsed: AuthorName, key: str, coauthor_keys: Set[str]) -> Optional[int]:
+        candidates = [author for author in self._blocks.get(key, ())
+                      if parsed.compatible(self._parsed[author])]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        overlaps = [len(coauthor_keys & self._coauthor_keys[author]) for author in candidates]
+        best = max(overlaps)
+        if best and overlaps.count(best) == 1:
+            return candidates[overlaps.index(best)]
+        # Otherwise the same form of the name, which for an ambiguous "J.
+        # Smith" is the author collecting the earlier ambiguous mentions
+        exact = [author for author in candidates if self._parsed[author] == parsed]
+        return exact[0] if len(exact) == 1 else None
+
+    def add_paper(self, paper: Any) -> List[int]:
+        """
+        Index one paper and return the canonical ids of its authors
+        """
+        parsed_names = []
+        for name in paper.authors or ():
+            parsed = parse_author_name(name)
+            if parsed is not None:
+                parsed_names.append((name.strip(), parsed, parsed.key))
+        keys = {key for _, _, key in parsed_names}
+
+        with self._lock:
+            paper_id = len(self.papers)
+            self.papers.append(paper)
+            author_ids = []
+            for name, parsed, key in parsed_names:
+                coauthor_keys = keys - {key}
+                author = self._resolve(parsed, key, coauthor_keys)
+                if author is None:
+                    author = len(self.names)
+                    self.names.append(name)
+                    self._parsed.append(parsed)
+                    self._variants.append({name})
+                    self._paper_ids.append(array('i'))
+                    self._coauthor_keys.append(set())
+                    self._blocks.setdefault(key, []).append(author)
+                else:
+                    self._variants[author].add(name)
+                    if parsed.specificity() > self._parsed[author].specificity():
+                        # Keep the most complete form of the name
+                        self._parsed[author] = parsed
+                        self.names[author] = name
+                if author in author_ids:
+                    continue
+                author_ids.append(author)
+                self._paper_ids[author].append(paper_id)
+                self._coauthor_keys[author].update(coauthor_keys)
+        return author_ids
+
+    def add(self, papers: Iterable[Any]) -> None:
+        for paper in papers:
+            self.add_paper(paper)
+
+    def candidates(self, name: str) -> List[int]:
+        """
+        Ids of every author a name could refer to, most papers first
+        """
+        parsed = parse_author_name(name)
+        if parsed is None:
+            return []
+        authors = [author for author in self._blocks.get(parsed.key, ())
+                   if parsed.compatible(self._parsed[author])]
+        return sorted(authors, key=lambda author: len(self._paper_ids[author]), reverse=True)
+
+    def author_id(self, name: str) -> Optional[int]:
+        """
+        Canonical id for a name: the exact form if known, otherwise the
+        compatible author with the most papers
+        """
+        parsed = parse_author_name(name)
+        if parsed is None:
+            return None
+        candidates = self.candidates(name)
+        for author in candidates:
+            if self._parsed[author] == parsed:
+                return author
+        return candidates[0] if candidates else None
+
+    def canonical_name(self, name: str) -> Optional[str]:
+        author = self.author_id(name)
+        return self.names[author] if author is not None else None
+
+    def variants(self, author: int) -> List[str]:
+        return sorted(self._variants[author])
+
+    def paper_ids(self, author: int) -> np.ndarray:
+        return np.frombuffer(self._paper_ids[author], dtype=np.int32).copy()
+
+    def author_papers(self, name: str) -> List[Any]:
+        """
+        Papers by the author a name refers to
+        """
+        author = self.author_id(name)
+        if author is None:
+            return []
+        return [self.papers[paper_id] for paper_id in self._paper_ids[author]]
+
+    def normalize_authors(self, names: Iterable[str]) -> List[str]:
+        """
+        Canonical forms of an author list, without placeholders or
+        duplicates
+        """
+        canonical = []
+        for name in names:
+            author = self.author_id(name)
+            if author is not None and self.names[author] not in canonical:
+                canonical.append(self.names[author])
+        return canonical
+
+    def top_authors(self, k: int = 10) -> List[Tuple[str, int]]:
+        """
+        The ``k`` authors with the most papers
+        """
+        counts = np.fromiter((len(paper_ids) for paper_ids in self._paper_ids), dtype=np.int64,
+                             count=len(self._paper_ids))
+        if not len(counts):
+            return []
+        k = min(k, len(counts))
+        top = np.argpartition(-counts, k - 1)[:k]
+        top = top[np.argsort(-counts[top], kind='stable')]
+        return [(self.names[author], int(counts[author])) for author in top.tolist()]
@@ -0,0 +1,319 @@
+import codecs
+import logging
+import os
+import re
+import sys
+import unicodedata
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_identity import normalize_arxiv_id
+from src.research_scraper import ResearchPaper
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 1 << 20
+# An entry still open after this many characters is treated as malformed
+MAX_ENTRY_SIZE = 1 << 20
+
+ENTRY_START = re.compile(r'@\s*([A-Za-z]+)\s*([{(])')
+BRACES = re.compile(r'[{}]')
+PAREN_BRACES = re.compile(r'[{})]')
+FIELD_NAME = re.compile(r'\s*,?\s*([^\s=,{}"#]+)\s*=\s*')
+MACRO_NAME = re.compile(r'[^\s=,{}"#]+')
+QUOTED = re.compile(r'["{}]')
+
+MONTHS = {name: str(number) for number, name in enumerate(
+    'jan feb mar apr may jun jul aug sep oct nov dec'.split(), 1)}
+
+# LaTeX accent commands and the combining characters they stand for
+ACCENTS = {"'": '\u0301', '`': '\u0300', '^': '\u0302', '"': '\u0308', '~': '\u0303', '=': '\u0304',
+           '.': '\u0307', 'u': '\u0306', 'v': '\u030c', 'H': '\u030b', 'c': '\u0327', 'k': '\u0328'}
+ACCENT_PATTERN = re.compile(r'\\([\'`^"~=.uvHck])\s*(?:\{\s*(\\?[A-Za-z])\s*\}|(\\?[A-Za-z]))')
+SPECIAL_PATTERN = re.compile(r'\\([&%$#_{}])')
+COMMAND_PATTERN = re.compile(r'\\[A-Za-z]+\*?\s*')
+LETTERS = {'\\i': 'i', '\\j': 'j', '\\o': 'ø', '\\O': 'Ø', '\\l': 'ł', '\\L': 'Ł', '\\ss': 'ß',
+           '\\ae': 'æ', '\\AE': 'Æ', '\\aa': 'å', '\\AA': 'Å', '\\oe': 'œ', '\\OE': 'Œ'}
+LETTER_PATTERN = re.compile(r'\\(ss|ae|AE|aa|AA|oe|OE|[ijoOlL])(?![A-Za-z])\s*')
+
+ESCAPE_PATTERN = re.compile(r'([&%$#_])')
+
+@dataclass
+class BibEntry:
+    """
+    One BibTeX entry with lower-case field names and LaTeX-decoded values
+    """
+    entry_type: str
+    key: str
+    fields: Dict[str, str] = field(default_factory=dict)
+
+def latex_to_text(value: str) -> str:
+    """
+    Plain Unicode text from a BibTeX value: accents decoded, escapes and
+    grouping braces removed, whitespace collapsed
+    """
+    if '\\' in value:
+        value = LETTER_PATTERN.sub(lambda m: LETTERS['\\' + m.group(1)], value)
+        value = ACCENT_PATTERN.sub(
+            lambda m: (m.group(2) or m.group(3)).lstrip('\\') + ACCENTS[m.group(1)], value)
+        value = SPECIAL_PATTERN.sub(r'\1', value.replace('\\{', '\x00').replace('\\}', '\x01'))
+        value = COMMAND_PATTERN.sub('', value)
+    value = value.replace('{', '').replace('}', '').replace('\x00', '{').replace('\x01', '}').replace('~', ' ')
+    value = ' '.join(value.split())
+    return unicodedata.normalize('NFC', value) if not value.isascii() else value
+
+def _braced_end(text: str, start: int) -> int:
+    # Index just past the brace group opening at text[start]
+    depth = 0
+    for match in BRACES.finditer(text, start):
+        depth += 1 if match.group() == '{' else -1
+        if depth == 0:
+            return match.end()
+    return -1
+
+def _quoted_end(text: str, start: int) -> int:
+    # Index just past the quoted string opening at text[start]; quotes inside braces do not count
+    depth = 0
+    for match in QUOTED.finditer(text, start + 1):
+        char = match.group()
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        elif depth == 0:
+            return match.end()
+    return -1
+
+def _parse_value(body: str, i: int, macros: Dict[str, str]) -> Tuple[str, int]:
+    parts = []
+    while True:
+        while i < len(body) and body[i].isspace():
+            i += 1
+        if i >= len(body):
+            break
+        char = body[i]
+        if char == '{':
+            end = _braced_end(body, i)
+            if end < 0:
+                raise ValueError("unbalanced braces")
+            parts.append(body[i + 1:end - 1])
+        elif char == '"':
+            end = _quoted_end(body, i)
+            if end < 0:
+                raise ValueError("unterminated string")
+            parts.append(body[i + 1:end - 1])
+        else:
+            match = MACRO_NAME.match(body, i)
+            if not match:
+                break
+            end = match.end()
+            word = match.group()
+            parts.append(word if word.isdigit() else macros.get(word.lower(), MONTHS.get(word.lower()[:3], word)))
+        i = end
+        while i < len(body) and body[i].isspace():
+            i += 1
+        if i < len(body) and body[i] == '#':
+            i += 1
+            continue
+        break
+    return ''.join(parts), i
+
+def _parse_fields(body: str, i: int, macros: Dict[str, str]) -> Dict[str, str]:
+    fields = {}
+    while True:
+        match = FIELD_NAME.match(body, i)
+        if not match:
+            break
+        value, i = _parse_value(body, match.end(), macros)
+        fields[match.group(1).lower()] = value
+    return fields
+
+def _parse_entry(entry_type: str, body: str, macros: Dict[str, str]) -> Optional[BibEntry]:
+    entry_type = entry_type.lower()
+    if entry_type in ('comment', 'preamble'):
+        return None
+    if entry_type == 'string':
+        macros.update((name, latex_to_text(value)) for name, value in _parse_fields(body, 0, macros).items())
+        return None
+    comma = body.find(',')
+    key = (body if comma < 0 else body[:comma]).strip()
+    raw = _parse_fields(body, comma if comma >= 0 else len(body), macros)
+    return BibEntry(entry_type, key, {name: latex_to_text(value) for name, value in raw.items()})
+
+def iter_bibtex(stream: IO[bytes], progress: Optional[Callable[[int], None]] = None,
+                read_size: int = READ_SIZE) -> Iterator[BibEntry]:
+    """
+    Entries of a BibTeX file read incrementally from a binary stream, so
+    memory stays at one read block plus the entry being parsed however
+    large the file is. ``progress`` is called with the number of bytes read
+    so far. Malformed entries are logged and skipped.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    macros: Dict[str, str] = {}
+    buffer = ''
+    position = 0
+    bytes_read = 0
+    eof = False
+
+    while True:
+        at = buffer.find('@', position)
+        match = ENTRY_START.match(buffer, at) if at >= 0 else None
+        end = -1
+        if match:
+            pattern = BRACES if match.group(2) == '{' else PAREN_BRACES
+            depth = 1
+            for brace in pattern.finditer(buffer, match.end()):
+                char = brace.group()
+                if char == '{':
+                    depth += 1
+                elif char == '}' or depth == 1:
+                    depth -= 1
+                if depth == 0:
+                    end = brace.end()
+                    break
+
+        if end >= 0:
+            try:
+                entry = _parse_entry(match.group(1), buffer[match.end():end - 1], macros)
+            except ValueError as e:
+                logger.warning(f"Skipping malformed BibTeX entry at character {at}: {e}")
+                entry = None
+            if entry is not None:
+                yield entry
+            position = end
+            continue
+
+        if at >= 0 and (eof or (match is None and len(buffer) - at > 64)
+                        or len(buffer) - at > MAX_ENTRY_SIZE):
+            # Stray "@" or an entry that never closes
+            if match is not None:
+                logger.warning(f"Skipping unterminated BibTeX entry at character {at}")
+            position = at + 1
+            continue
+        if eof:
+            return
+
+        # Need more text: drop everything consumed and read the next block
+        buffer = buffer[at:] if at >= 0 else ''
+        position = 0
+        data = stream.read(read_size)
+        bytes_read += len(data)
+        if not data:
+            eof = True
+            buffer += decoder.decode(b'', final=True)
+        else:
+            buffer += decoder.decode(data)
+        if progress is not None:
+            progress(bytes_read)
+
+def split_authors(value: str) -> List[str]:
+    """
+    Names of a BibTeX author list as "First Last"
+    """
+    names = []
+    for name in re.split(r'\s+and\s+', value.strip()):
+        parts = [part.strip() for part in name.split(',')]
+        if len(parts) == 2:
+            name = f"{parts[1]} {parts[0]}"
+        elif len(parts) == 3:
+            # "von Last, Jr, First"
+            name = f"{parts[2]} {parts[0]} {parts[1]}"
+        name = ' '.join(name.split())
+        if name and name.lower() != 'others':
+            names.append(name)
+    return names
+
+def entry_to_paper(entry: BibEntry) -> Optional[ResearchPaper]:
+    """
+    ResearchPaper for a BibTeX entry, or None when it has no title
+    """
+    fields = entry.fields
+    title = fields.get('title')
+    if not title:
+        return None
+    arxiv_id = None
+    if fields.get('archiveprefix', '').lower() == 'arxiv' or 'arxiv' in fields.get('journal', '').lower():
+        arxiv_id = normalize_arxiv_id(fields.get('eprint'))
+    doi = fields.get('doi') or None
+    url = fields.get('url') or (f"https://doi.org/{doi}" if doi else '') or \
+        (f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else '')
+    return ResearchPaper(
+        title=title,
+        authors=split_authors(fields.get('author', '')),
+        abstract=fields.get('abstract', ''),
+        url=url,
+        publication_date=fields.get('year') or None,
+        source='BibTeX',
+        doi=doi,
+        arxiv_id=arxiv_id
+    )
+
+def iter_bibtex_papers(stream: IO[bytes], progress: Optional[Callable[[int], None]] = None) -> Iterator[ResearchPaper]:
+    """
+    Papers of a BibTeX stream, skipping entries without a title
+    """
+    for entry in iter_bibtex(stream, progress):
+        paper = entry_to_paper(entry)
+        if paper is not None:
+            yield paper
+
+def _escape(value: str) -> str:
+    value = ESCAPE_PATTERN.sub(r'\\\1', value or '')
+    # Unbalanced braces would end the field early; drop them
+    if value.count('{') != value.count('}'):
+        value = value.replace('{', '').replace('}', '')
+    return value
+
+# Letters that NFKD does not split into an ASCII letter and a combining mark
+ASCII_LETTERS = str.maketrans({'ß': 'ss', 'ø': 'o', 'Ø': 'O', 'ł': 'l', 'Ł': 'L', 'đ': 'd', 'Đ': 'D',
+                               'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE', 'ı': 'i', 'þ': 'th', 'Þ': 'Th'})
+
+def ascii_fold(text: str) -> str:
+    """
+    ``text`` with accents removed and other non-ASCII characters dropped
+    """
+    if text.isascii():
+        return text
+    text = unicodedata.normalize('NFKD', text.translate(ASCII_LETTERS))
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).encode('ascii', 'ignore').decode('ascii')
+
+def citation_key(paper: Any, used: Set[str]) -> str:
+    """
+    "surnameYEARword" key for a paper in plain ASCII, made unique against
+    ``used``
+    """
+    # Sources sometimes list blank author names; use the first real one
+    surname = next((name.split()[-1] for name in paper.authors or [] if name and name.split()), 'anon')
+    surname = re.sub(r'[^A-Za-z0-9]', '', ascii_fold(surname))
+    year = re.match(r'\d{4}', str(paper.publication_date or ''))
+    words = [word for word in re.findall(r'[A-Za-z]+', ascii_fold(paper.title or '')) if len(word) > 3]
+    base = f"{surname.lower()}{year.group() if year else ''}{words[0].lower() if words else ''}" or 'paper'
+    key, suffix = base, 0
+    while key in used:
+        suffix += 1
+        key = f"{base}{chr(ord('a') + suffix - 1) if suffix <= 26 else suffix}"
+    used.add(key)
+    return key
+
+def paper_to_bibtex(paper: Any, key: str) -> str:
+    """
+    BibTeX entry for a paper: @misc with eprint fields for arXiv papers,
+    @article otherwise
+    """
+    arxiv_id = normalize_arxiv_id(getattr(paper, 'arxiv_id', None))
+    fields = [
+        ('title', paper.title),
+        ('author', ' and '.join(name.strip() for name in paper.authors or [] if name and name.strip())),
+        ('year', (re.match(r'\d{4}', str(paper.publication_date or '')) or [None])[0]),
+        ('doi', getattr(paper, 'doi', None)),
+        ('eprint', arxiv_id),
+        ('archivePrefix', 'arXiv' if arxiv_id else None),
+        ('url', paper.url),
+        ('abstract', paper.abstract),
+    ]
+    body = ',\n'.join(f"  {name} = {{{_escape(value)}}}" for name, value in fields if value)
+    return f"@{'misc' if arxiv_id else 'article'}{{{key},\n{body}\n}}\n\n"
@@ -0,0 +1,141 @@
+import math
+import os
+import sys
+import threading
+from array import array
+from collections import Counter
+from typing import Any, Iterable, List, Tuple
+
+import numpy as np
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.keyword_index import tokenize
+
+class BM25Index:
+    """
+    Ranked retrieval over paper titles and abstracts with BM25F.
+
+    Postings keep per-field term frequencies and every document's field
+    lengths are stored as it is added, so document frequencies, IDF and
+    average lengths are always current without a rebuild; the per-document
+    length normalisation is recomputed in one vectorised pass only when a
+    query follows new additions. A query scores each of its terms' posting
+    lists with numpy into a dense score array and selects the top ``k``
+    with a partial sort.
+    """
+    def __init__(self,
+                 title_weight: float = 2.5,
+                 abstract_weight: float = 1.0,
+                 k1: float = 1.2,
+                 title_b: float = 0.5,
+                 abstract_b: float = 0.75):
+        self.title_weight = title_weight
+        self.abstract_weight = abstract_weight
+        self.k1 = k1
+        self.title_b = title_b
+        self.abstract_b = abstract_b
+
+        self.docs: List[Any] = []
+        self._lock = threading.Lock()
+        self._postings = {}
+        self._title_lengths = array('I')
+        self._abstract_lengths = array('I')
+        self._title_total = 0
+        self._abstract_total = 0
+        self._norms = None
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, papers: Iterable[Any]) -> None:
+        """
+        Index papers, giving each the next document id
+        """
+        with self._lock:
+            postings = self._postings
+            for paper in papers:
+                doc_id = len(self.docs)
+                self.docs.append(paper)
+                title = tokenize(paper.title)
+                abstract = tokenize(paper.abstract)
+
+                title_counts = Counter(title)
+                abstract_counts = Counter(abstract)
+                for token in title_counts.keys() | abstract_counts.keys():
+                    posting = postings.get(token)
+                    if posting is None:
+                        posting = postings[token] = (array('i'), array('H'), array('H'))
+                    posting[0].append(doc_id)
+                    posting[1].append(min(title_counts[token], 0xFFFF))
+                    posting[2].append(min(abstract_counts[token], 0xFFFF))
+
+                self._title_lengths.append(len(title))
+                self._abstract_lengths.append(len(abstract))
+                self._title_total += len(title)
+                self._abstract_total += len(abstract)
+            self._norms = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self.docs = []
+            self._postings = {}
+            self._title_lengths = array('I')
+            self._abstract_lengths = array('I')
+            self._title_total = 0
+            self._abstract_total = 0
+            self._norms = None
+
+    def idf(self, token: str) -> float:
+        posting = self._postings.get(token)
+        df = len(posting[0]) if posting else 0
+        return math.log(1 + (len(self.docs) - df + 0.5) / (df + 0.5))
+
+    def _field_norms(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Called with the lock held: field weight over BM25 length normalisation
+        if self._norms is None:
+            count = max(len(self.docs), 1)
+            title_lengths = np.frombuffer(self._title_lengths, dtype=np.uint32).astype(np.float32)
+            abstract_lengths = np.frombuffer(self._abstract_lengths, dtype=np.uint32).astype(np.float32)
+            title_avg = max(self._title_total / count, 1.0)
+            abstract_avg = max(self._abstract_total / count, 1.0)
+            self._norms = (
+                self.title_weight / (1 - self.title_b + self.title_b * title_lengths / title_avg),
+                self.abstract_weight / (1 - self.abstract_b + self.abstract_b * abstract_lengths / abstract_avg)
+            )
+        return self._norms
+
+    def search_ids(self, query: str, k: int = 50) -> List[Tuple[int, float]]:
+        """
+        ``(doc_id, score)`` for the ``k`` best documents, best first
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            if not tokens or not self.docs:
+                return []
+            title_norms, abstract_norms = self._field_norms()
+            scores = np.zeros(len(self.docs), dtype=np.float32)
+            for token in tokens:
+                posting = self._postings.get(token)
+                if posting is None:
+                    continue
+                ids = np.frombuffer(posting[0], dtype=np.int32)
+                tf = (np.frombuffer(posting[1], dtype=np.uint16) * title_norms[ids]
+                      + np.frombuffer(posting[2], dtype=np.uint16) * abstract_norms[ids])
+                scores[ids] += self.idf(token) * tf / (self.k1 + tf)
+
+        matched = np.count_nonzero(scores)
+        if not matched:
+            return []
+        k = min(k, matched)
+        top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in top if scores[doc_id] > 0]
+
+    def search(self, query: str, k: int = 50) -> List[Any]:
+        """
+        The ``k`` most relevant papers for a free-text query, best first
+        """
+        return [self.docs[doc_id] for doc_id, _ in self.search_ids(query, k)]
@@ -0,0 +1,235 @@
+import atexit
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Tuple
+
+# Optional WebDriver imports with error handling
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+    from selenium.webdriver.chrome.options import Options
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+    logging.warning("Selenium or WebDriver not available. Some web scraping features will be limited.")
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    # ChromeDriverManager checks versions over the network; do it once per process
+    return ChromeDriverManager().install()
+
+def create_chrome_driver() -> Any:
+    """
+    Launch a headless Chrome WebDriver
+    """
+    if not SELENIUM_AVAILABLE:
+        raise RuntimeError("Selenium is not available")
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    return webdriver.Chrome(service=Service(_chromedriver_path()), options=chrome_options)
+
+def _is_healthy(driver: Any) -> bool:
+    try:
+        # Any round trip to the browser proves the session is still alive
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+def _quit(driver: Any) -> None:
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error closing WebDriver: {e}")
+
+class BrowserPool:
+    """
+    Bounded pool of headless browsers shared across scrapers.
+
+    Browsers are only launched when first acquired (or explicitly warmed up
+    in the background), health-checked before being handed out, and closed
+    after sitting idle for ``idle_timeout`` seconds.
+    """
+    def __init__(self,
+                 max_size: int = 2,
+                 idle_timeout: float = 300.0,
+                 driver_factory: Callable[[], Any] = create_chrome_driver):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.driver_factory = driver_factory
+
+        self._idle: List[Tuple[Any, float]] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop_reaper = threading.Event()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of live browsers, including ones being launched
+        """
+        with self._cond:
+            return self._size
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Take a healthy browser from the pool, launching one if under capacity
+        and waiting up to ``timeout`` seconds otherwise
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            candidate = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Browser pool is closed")
+                    if self._idle:
+                        candidate, _ = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a browser")
+                    self._cond.wait(remaining)
+
+            if candidate is None:
+                return self._launch()
+            if _is_healthy(candidate):
+                return candidate
+            logger.warning("Discarding unhealthy browser from pool")
+            self.discard(candidate)
+
+    def release(self, driver: Any) -> None:
+        """
+        Return a browser to the pool for reuse
+        """
+        with self._cond:
+            if not self._closed:
+                self._idle.append((driver, time.monotonic()))
+                self._cond.notify()
+                self._start_reaper()
+                return
+        self.discard(driver)
+
+    def discard(self, driver: Any) -> None:
+        """
+        Close a browser and free its slot
+        """
+        _quit(driver)
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def browser(self, timeout: Optional[float] = None):
+        """
+        Context manager that acquires a browser and releases it afterwards
+        """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except Exception:
+            # The page state is unknown after an error; do not reuse it
+            self.discard(driver)
+            raise
+        else:
+            self.release(driver)
+
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        Launch a browser on a background thread so a later acquire is instant
+        """
+        with self._cond:
+            if self._closed or self._idle or self._size >= self.max_size:
+                return None
+            self._size += 1
+
+        def _warm():
+            try:
+                driver = self._launch()
+            except Exception:
+                return
+            self.release(driver)
+
+        thread = threading.Thread(target=_warm, name="browser-pool-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def reap_idle(self) -> int:
+        """
+        Close browsers that have been idle longer than the idle timeout
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._cond:
+            expired = [driver for driver, last_used in self._idle if last_used < cutoff]
+            self._idle = [(driver, last_used) for driver, last_used in self._idle if last_used >= cutoff]
+        for driver in expired:
+            self.discard(driver)
+        return len(expired)
+
+    def close(self) -> None:
+        """
+        Close every idle browser and refuse further acquisitions
+        """
+        with self._cond:
+            self._closed = True
+            idle = [driver for driver, _ in self._idle]
+            self._idle = []
+            self._cond.notify_all()
+        self._stop_reaper.set()
+        for driver in idle:
+            self.discard(driver)
+
+    def _launch(self) -> Any:
+        # The caller has already reserved a slot in self._size
+        try:
+            return self.driver_factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _start_reaper(self) -> None:
+        # Called with self._cond held
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+
+        def _run():
+            interval = max(self.idle_timeout / 2, 1.0)
+            while not self._stop_reaper.wait(interval):
+                self.reap_idle()
+                with self._cond:
+                    if not self._idle:
+                        self._reaper = None
+                        return
+
+        self._reaper = threading.Thread(target=_run, name="browser-pool-reaper", daemon=True)
+        self._reaper.start()
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Return the process-wide browser pool, creating it on first use
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
@@ -0,0 +1,170 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is refused because its circuit is open
+    """
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one upstream source.
+
+    Outcomes of the last ``window`` calls are tracked. Once at least
+    ``min_calls`` have been seen and the failure rate reaches
+    ``failure_threshold`` the circuit opens and calls are refused without
+    touching the network. After ``cooldown`` seconds it turns half-open and
+    lets ``half_open_max_calls`` probes through: a successful probe closes
+    the circuit, a failed one re-opens it for another cooldown.
+    """
+    def __init__(self,
+                 name: str,
+                 failure_threshold: float = 0.5,
+                 window: int = 20,
+                 min_calls: int = 4,
+                 cooldown: float = 60.0,
+                 half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        # Called with the lock held
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self.logger.info(f"Circuit for {self.name} is half-open; probing")
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go ahead now. In the half-open state a True
+        answer reserves one of the probe slots.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self.logger.info(f"Circuit for {self.name} closed after a successful probe")
+                self._state = CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._open()
+                return
+            self._outcomes.append(False)
+            if self._state == CLOSED and len(self._outcomes) >= self.min_calls:
+                if self._failure_rate() >= self.failure_threshold:
+                    self._open()
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+        self.logger.warning(f"Circuit for {self.name} opened; skipping it for {self.cooldown:.0f}s")
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run ``func`` through the breaker, recording its outcome
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit for {self.name} is open")
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._outcomes.clear()
+            self._probes_in_flight = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current state for monitoring
+        """
+        with self._lock:
+            self._maybe_half_open()
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+            return {
+                'name': self.name,
+                'state': self._state,
+                'failure_rate': round(self._failure_rate(), 3),
+                'calls': len(self._outcomes),
+                'rejected': self._rejected,
+                'retry_in': round(retry_in, 1)
+            }
+
+class CircuitBreakerRegistry:
+    """
+    Named circuit breakers shared by everything that uses the registry
+    """
+    def __init__(self, **defaults):
+        self.defaults = defaults
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, **self.defaults)
+            return self._breakers[name]
+
+    def states(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.snapshot() for breaker in breakers]
+
+# Process-wide registry so every scraper instance sees the same source health
+default_registry = CircuitBreakerRegistry()
+
+def get_breaker(name: str) -> CircuitBreaker:
+    return default_registry.get(name)
+
+def breaker_states() -> List[Dict[str, Any]]:
+    return default_registry.states()
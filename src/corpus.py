@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logging.warning("pyarrow not available. papers.csv will be parsed on every load.")
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.dates import parse_dates
+
+DEFAULT_CORPUS_PATH = os.path.join(project_root, 'papers.csv')
+DEFAULT_CORPUS_CACHE_DIR = os.path.join(project_root, 'cache', 'corpus')
+
+# Column dtypes of papers.csv; missing values load as empty strings
+CORPUS_SCHEMA: Dict[str, str] = {
+    'Title': 'str',
+    'Authors': 'str',
+    'Date': 'str',
+    'Abstract': 'str',
+    'Url': 'str',
+    'AwesomeListCategory': 'category',
+    'Categories': 'str',
+    'PaperIndex': 'str',
+    'Affiliation': 'str',
+}
+# Columns computed at parse time, and the CSV column each is derived from:
+# the Date as an epoch day (int32) and its precision (int8, see src.dates)
+DERIVED_COLUMNS: Dict[str, str] = {
+    'DateDay': 'Date',
+    'DatePrecision': 'Date',
+}
+# Bump when the schema or the derived columns change, so sidecars are rebuilt
+CORPUS_CACHE_VERSION = 2
+
+logger = logging.getLogger(__name__)
+
+def parse_corpus_csv(path: str = DEFAULT_CORPUS_PATH, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    papers.csv parsed with the corpus schema, plus the derived columns
+    """
+    usecols = None
+    if columns is not None:
+        usecols = list(dict.fromkeys(DERIVED_COLUMNS.get(column, column) for column in columns))
+    df = pd.read_csv(path, on_bad_lines='warn', dtype=str, keep_default_na=False, usecols=usecols)
+    categorical = [column for column in df.columns if CORPUS_SCHEMA.get(column) == 'category']
+    if categorical:
+        df = df.astype({column: 'category' for column in categorical})
+    if 'Date' in df.columns:
+        df['DateDay'], df['DatePrecision'] = parse_dates(df['Date'])
+    return df[list(columns)] if columns is not None else df
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _sidecar_paths(path: str, cache_dir: str) -> Dict[str, str]:
+    # One sidecar per source file, named after it
+    source = os.path.abspath(path)
+    stem = f"{os.path.splitext(os.path.basename(source))[0]}-{hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]}"
+    return {'data': os.path.join(cache_dir, f"{stem}.feather"), 'meta': os.path.join(cache_dir, f"{stem}.json")}
+
+def _sidecar_valid(path: str, sidecar: Dict[str, str]) -> bool:
+    if not os.path.exists(sidecar['meta']) or not os.path.exists(sidecar['data']):
+        return False
+    try:
+        with open(sidecar['meta'], 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if meta.get('version') != CORPUS_CACHE_VERSION:
+        return False
+    stat = os.stat(path)
+    if meta.get('mtime_ns') == stat.st_mtime_ns and meta.get('size') == stat.st_size:
+        return True
+    # Touched but possibly unchanged: compare content before reparsing
+    if meta.get('size') != stat.st_size or meta.get('sha256') != file_sha256(path):
+        return False
+    meta.update(mtime_ns=stat.st_mtime_ns)
+    _write_json(sidecar['meta'], meta)
+    return True
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _write_sidecar(path: str, df: pd.DataFrame, sidecar: Dict[str, str]) -> None:
+    os.makedirs(os.path.dirname(sidecar['data']), exist_ok=True)
+    stat = os.stat(path)
+    tmp_path = f"{sidecar['data']}.{os.getpid()}.tmp"
+    # Uncompressed so warm loads can memory-map the columns they need
+    feather.write_feather(df, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, sidecar['data'])
+    # The metadata goes last: a sidecar without it is never trusted
+    _write_json(sidecar['meta'], {'version': CORPUS_CACHE_VERSION, 'source': os.path.abspath(path),
+                                  'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                                  'sha256': file_sha256(path)})
+
+def load_corpus(path: str = DEFAULT_CORPUS_PATH,
+                columns: Optional[Sequence[str]] = None,
+                cache_dir: str = DEFAULT_CORPUS_CACHE_DIR,
+                use_cache: bool = True) -> pd.DataFrame:
+    """
+    papers.csv as a typed DataFrame, optionally only some ``columns``.
+
+    The first load parses the CSV and writes a Feather sidecar under
+    ``cache_dir``; later loads memory-map just the requested columns from
+    it, so reading titles and dates never touches the abstracts. The
+    sidecar is rebuilt when the CSV's size or content changes (a new
+    mtime alone only triggers a hash check).
+    """
+    if not use_cache or not PYARROW_AVAILABLE:
+        return parse_corpus_csv(path, columns)
+
+    sidecar = _sidecar_paths(path, cache_dir)
+    if not _sidecar_valid(path, sidecar):
+        df = parse_corpus_csv(path)
+        try:
+            _write_sidecar(path, df, sidecar)
+        except OSError as e:
+            logger.warning(f"Could not write corpus cache {sidecar['data']}: {e}")
+        return df[list(columns)] if columns is not None else df
+
+    table = feather.read_table(sidecar['data'], columns=list(columns) if columns is not None else None,
+                               memory_map=True)
+    return table.to_pandas()
+
+def iter_corpus_papers(path: str = DEFAULT_CORPUS_PATH) -> Iterator[Any]:
+    """
+    Papers listed in the curated papers.csv corpus, one at a time
+    """
+    # Imported here so that loading the corpus as a table stays cheap
+    from src.research_scraper import ResearchPaper
+
+    df = load_corpus(path, columns=['Title', 'Authors', 'Abstract', 'Url', 'Date'])
+    for row in df.itertuples(index=False):
+        yield ResearchPaper(
+            title=' '.join(row.Title.split()),
+            authors=[author.strip() for author in row.Authors.split(',') if author.strip()],
+            abstract=' '.join(row.Abstract.split()),
+            url=row.Url,
+            publication_date=row.Date or None,
+            source='papers.csv'
+        )
+
+def load_corpus_papers(path: str = DEFAULT_CORPUS_PATH) -> List[Any]:
+    """
+    Papers listed in the curated papers.csv corpus
+    """
+    return list(iter_corpus_papers(path))
+
+def load_corpus_categories(path: str = DEFAULT_CORPUS_PATH) -> List[str]:
+    """
+    Category of every paper in papers.csv (e.g. "Communication"), in the
+    order of ``load_corpus_papers``
+    """
+    return load_corpus(path, columns=['AwesomeListCategory'])['AwesomeListCategory'].astype(str).tolist()
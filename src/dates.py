@@ -0,0 +1,170 @@
+import re
+from datetime import date, datetime
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# How much of a date is known; coarser dates stand for their first day
+DATE_UNKNOWN = 0
+DATE_YEAR = 1
+DATE_MONTH = 2
+DATE_DAY = 3
+
+# Epoch day stored for papers without a usable date; sorts before every real date
+NO_DAY = np.iinfo(np.int32).min
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Longest period a coarse date covers, in days
+MAX_PERIOD_DAYS = 366
+# Plausible publication years; other four-digit numbers are not dates
+MIN_YEAR, MAX_YEAR = 1800, 2199
+
+# "2024-05-20", "2024.5.20", "2024-05-20 12:34:56+00:00", "2014-07", "2021"
+NUMERIC_DATE_PATTERN = re.compile(r'\s*(\d{4})(?:[-./](\d{1,2})(?:[-./](\d{1,2}))?)?(?!\d)')
+# "20 May 2024", "May 20, 2024", "May 2024"
+NAMED_DATE_PATTERN = re.compile(
+    r'\s*(?:(\d{1,2})\s+)?([A-Za-z]{3})[a-z]*\.?\s+(?:(\d{1,2}),?\s+)?(\d{4})(?!\d)')
+MONTHS = {name: number for number, name in enumerate(
+    'jan feb mar apr may jun jul aug sep oct nov dec'.split(), 1)}
+
+def _epoch_day(year: int, month: int = 1, day: int = 1) -> int:
+    return date(year, month, day).toordinal() - EPOCH_ORDINAL
+
+def _from_parts(year: int, month: Optional[int], day: Optional[int]) -> Tuple[int, int]:
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        return NO_DAY, DATE_UNKNOWN
+    if month is None or not 1 <= month <= 12:
+        return _epoch_day(year), DATE_YEAR
+    if day is not None:
+        try:
+            return _epoch_day(year, month, day), DATE_DAY
+        except ValueError:
+            pass
+    return _epoch_day(year, month), DATE_MONTH
+
+def parse_date(value: Any) -> Tuple[int, int]:
+    """
+    Epoch day (days since 1970-01-01) and precision of a publication date
+    in any of the forms the sources produce; coarse dates map to the first
+    day of their year or month, unusable ones to ``(NO_DAY, DATE_UNKNOWN)``
+    """
+    if value is None:
+        return NO_DAY, DATE_UNKNOWN
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.toordinal() - EPOCH_ORDINAL, DATE_DAY
+    if isinstance(value, (int, np.integer)):
+        return _from_parts(int(value), None, None)
+    if isinstance(value, (float, np.floating)):
+        return _from_parts(int(value), None, None) if value == value and value.is_integer() else (NO_DAY, DATE_UNKNOWN)
+
+    text = str(value)
+    match = NUMERIC_DATE_PATTERN.match(text)
+    if match:
+        year, month, day = match.groups()
+        return _from_parts(int(year), int(month) if month else None, int(day) if day else None)
+    match = NAMED_DATE_PATTERN.match(text)
+    if match and match.group(2).lower() in MONTHS:
+        day = match.group(1) or match.group(3)
+        return _from_parts(int(match.group(4)), MONTHS[match.group(2).lower()], int(day) if day else None)
+    return NO_DAY, DATE_UNKNOWN
+
+def parse_dates(values: Iterable[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Epoch days (int32) and precisions (int8) of many dates; each distinct
+    value is parsed once
+    """
+    codes, uniques = pd.factorize(pd.Series(list(values), dtype=object), use_na_sentinel=True)
+    parsed = [parse_date(value) for value in uniques]
+    # One extra slot at the end for missing values, which factorize codes as -1
+    days = np.array([day for day, _ in parsed] + [NO_DAY], dtype=np.int32)
+    precisions = np.array([precision for _, precision in parsed] + [DATE_UNKNOWN], dtype=np.int8)
+    return days[codes], precisions[codes]
+
+def period_ends(days: np.ndarray, precisions: np.ndarray) -> np.ndarray:
+    """
+    Last epoch day covered by each date: the day itself, or the end of its
+    month or year
+    """
+    days = np.asarray(days, dtype=np.int32)
+    precisions = np.asarray(precisions, dtype=np.int8)
+    ends = days.copy()
+    as_dates = days.astype('datetime64[D]')
+    month = precisions == DATE_MONTH
+    ends[month] = ((as_dates[month].astype('datetime64[M]') + 1).astype('datetime64[D]') - 1).astype(np.int32)
+    year = precisions == DATE_YEAR
+    ends[year] = ((as_dates[year].astype('datetime64[Y]') + 1).astype('datetime64[D]') - 1).astype(np.int32)
+    return ends
+
+def format_date(day: int, precision: int) -> Optional[str]:
+    """
+    ISO form of a normalized date at its precision: "2024-05-20",
+    "2024-05" or "2024"
+    """
+    if precision == DATE_UNKNOWN:
+        return None
+    text = str(np.datetime64(int(day), 'D'))
+    return text[:{DATE_YEAR: 4, DATE_MONTH: 7}.get(precision, 10)]
+
+def range_bound(value: Any, end: bool = False) -> Optional[int]:
+    """
+    Epoch day of a date-range bound given as an epoch day or a date in any
+    parseable form; an end bound covers its whole year or month
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)) and not MIN_YEAR <= value <= MAX_YEAR:
+        return int(value)
+    day, precision = parse_date(value)
+    if precision == DATE_UNKNOWN:
+        raise ValueError(f"Unrecognized date: {value!r}")
+    if end:
+        day = int(period_ends(np.array([day]), np.array([precision]))[0])
+    return day
+
+class DateIndex:
+    """
+    Sorted index over normalized publication dates.
+
+    Positions are sorted once by epoch day, so a date-range filter is two
+    binary searches (``np.searchsorted``) and a slice instead of parsing
+    every row's date string. Papers without a usable date are left out.
+    With ``overlap`` a coarse date counts when any part of its year or
+    month falls in the range (a paper dated "2021" is found by a query
+    for March 2021); otherwise only its first day is compared.
+    """
+    def __init__(self, days: np.ndarray, precisions: np.ndarray):
+        days = np.asarray(days, dtype=np.int32)
+        precisions = np.asarray(precisions, dtype=np.int8)
+        order = np.argsort(days, kind='stable')
+        self._order = order[precisions[order] != DATE_UNKNOWN]
+        self._days = days[self._order]
+        self._ends = period_ends(self._days, precisions[self._order])
+
+    @classmethod
+    def from_dates(cls, values: Iterable[Any]) -> 'DateIndex':
+        return cls(*parse_dates(values))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def between(self, start: Any = None, end: Any = None, overlap: bool = False) -> np.ndarray:
+        """
+        Positions of the dates from ``start`` through ``end`` (dates in any
+        parseable form, or epoch days; either may be None), oldest first.
+        An end such as "2023" or "2023-06" includes its whole period; a
+        bound that is not a date raises ValueError.
+        """
+        start_day = range_bound(start)
+        end_day = range_bound(end, end=True)
+        low = 0 if start_day is None else int(np.searchsorted(self._days, start_day, side='left'))
+        high = len(self._days) if end_day is None else int(np.searchsorted(self._days, end_day, side='right'))
+        positions = self._order[low:high]
+        if overlap and start_day is not None and (end_day is None or end_day >= start_day):
+            # Coarse dates starting up to a year earlier may still reach into the range
+            early = int(np.searchsorted(self._days, start_day - MAX_PERIOD_DAYS, side='left'))
+            reaching = np.flatnonzero(self._ends[early:low] >= start_day) + early
+            positions = np.concatenate([self._order[reaching], positions])
+        return positions
@@ -0,0 +1,276 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_identity import normalize_arxiv_id, normalize_doi
+from src.research_scraper import ResearchPaper
+
+DEFAULT_DOI_CACHE_PATH = os.path.join(project_root, 'cache', 'doi_metadata.sqlite3')
+
+# doi.org content negotiation returns CSL JSON for Crossref, DataCite and mEDRA DOIs
+DEFAULT_RESOLVER_URL = 'https://doi.org/'
+CSL_JSON = 'application/vnd.citationstyles.csl+json'
+
+# Old Wiley SICI DOIs carry angle brackets, as in 10.1002/(SICI)...35:4<>3.0.CO;2-K
+# or ...<1743::AID-SIM849>3.0.CO;2-D; a bracket pair counts only when it is
+# empty or holds a number first, so markup such as </a> still ends a DOI
+DOI_PATTERN = re.compile(r'10\.\d{4,9}/(?:[^\s"<>]|<(?:\d[^\s"<>]*)?>)+')
+JATS_TAG_PATTERN = re.compile(r'<[^>]+>')
+CLOSING = {')': '(', ']': '[', '}': '{'}
+
+def extract_dois(text: str) -> List[str]:
+    """
+    Normalized DOIs found in pasted text or a file, in order and without
+    duplicates; bare DOIs, doi: prefixes and doi.org URLs all work
+    """
+    dois = []
+    for match in DOI_PATTERN.finditer(text or ''):
+        doi = match.group().rstrip('.,;')
+        # Closing brackets belong to the DOI only when it opened them, as in 10.1002/(SICI)...
+        while doi and doi[-1] in CLOSING and doi.count(doi[-1]) > doi.count(CLOSING[doi[-1]]):
+            doi = doi[:-1].rstrip('.,;')
+        doi = normalize_doi(doi)
+        if doi:
+            dois.append(doi)
+    return list(dict.fromkeys(dois))
+
+def csl_to_paper(doi: str, record: Dict[str, Any]) -> ResearchPaper:
+    """
+    ResearchPaper from a CSL JSON record
+    """
+    title = record.get('title') or ''
+    if isinstance(title, list):
+        title = title[0] if title else ''
+    authors = []
+    for author in record.get('author') or ():
+        name = author.get('literal') or ' '.join(
+            part for part in (author.get('given'), author.get('family')) if part)
+        if name:
+            authors.append(name)
+    date_parts = ((record.get('issued') or {}).get('date-parts') or [[]])[0] or []
+    publication_date = '-'.join(f"{int(part):02d}" if i else str(int(part))
+                                for i, part in enumerate(date_parts) if part is not None) or None
+    abstract = ' '.join(JATS_TAG_PATTERN.sub(' ', record.get('abstract') or '').split())
+    return ResearchPaper(
+        title=' '.join(title.split()),
+        authors=authors,
+        abstract=abstract,
+        url=record.get('URL') or f"https://doi.org/{doi}",
+        publication_date=publication_date,
+        source='DOI',
+        doi=doi,
+        # arXiv's own DOIs, 10.48550/arXiv.<id>
+        arxiv_id=normalize_arxiv_id(doi) if doi.startswith('10.48550/') else None
+    )
+
+class DOICache:
+    """
+    Persistent map from DOI to its CSL JSON metadata; DOIs the resolver
+    does not know are stored too (as NULL), so they are not asked for again
+    """
+    def __init__(self, path: str = DEFAULT_DOI_CACHE_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS dois ("
+            " doi TEXT PRIMARY KEY, metadata TEXT, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM dois").fetchone()[0]
+
+    def get_many(self, dois: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Cached metadata of every known DOI; None marks a DOI known not to resolve
+        """
+        dois = list(dict.fromkeys(dois))
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(dois), 500):
+                batch = dois[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                for doi, metadata in self._conn.execute(
+                        f"SELECT doi, metadata FROM dois WHERE doi IN ({placeholders})", batch):
+                    found[doi] = json.loads(metadata) if metadata is not None else None
+        return found
+
+    def put_many(self, records: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        if not records:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dois (doi, metadata, fetched_at) VALUES (?, ?, ?)",
+                [(doi, json.dumps(record) if record is not None else None, now)
+                 for doi, record in records.items()]
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class HTTPDOIFetcher:
+    """
+    Fetches CSL JSON for a DOI by content negotiation against ``base_url``,
+    doi.org by default or a local stand-in resolver for tests and
+    benchmarks. Returns None for DOIs the resolver does not know and raises
+    on other failures, which are retried on the next batch.
+    """
+    def __init__(self, base_url: str = DEFAULT_RESOLVER_URL, timeout: float = 15.0, pool_size: int = 8):
+        self.base_url = base_url if base_url.endswith('/') else f"{base_url}/"
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({'Accept': CSL_JSON})
+
+    def __call__(self, doi: str) -> Optional[Dict[str, Any]]:
+        # DOIs may contain "#", "?" or "%", which would otherwise end or garble the path
+        response = self.session.get(f"{self.base_url}{quote(doi, safe='/:;()<>')}", timeout=self.timeout)
+        if response.status_code in (404, 410):
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        self.session.close()
+
+@dataclass
+class DOIBatchResult:
+    """
+    Outcome of resolving one batch of DOIs
+    """
+    papers: List[ResearchPaper] = field(default_factory=list)
+    not_found: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    requested: int = 0
+    cache_hits: int = 0
+    fetched: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.requested if self.requested else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        DOIs resolved per second, cached ones included
+        """
+        return self.requested / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (f"Resolved {len(self.papers)} of {self.requested} DOIs in {self.elapsed:.1f}s "
+                f"({self.throughput:.0f} DOIs/s, cache hit rate {self.hit_rate:.0%}, "
+                f"{self.fetched} fetched, {len(self.not_found)} not found, {len(self.failed)} failed)")
+
+class DOIResolver:
+    """
+    Resolves DOIs to papers in batches through a persistent cache.
+
+    A batch is deduplicated and looked up in the cache with a few queries;
+    only the misses go to ``fetch`` (a callable from DOI to CSL JSON, by
+    default ``HTTPDOIFetcher``), at most ``max_workers`` at a time. Every
+    answer, including "not found", is written back to the cache in
+    transactions as it arrives, so a DOI is fetched once ever and an
+    interrupted batch keeps what it already fetched. Fetch errors are
+    reported and not cached.
+    """
+    def __init__(self,
+                 fetch: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+                 cache: Optional[DOICache] = None,
+                 max_workers: int = 8,
+                 write_batch: int = 200):
+        self.fetch = fetch or HTTPDOIFetcher(pool_size=max_workers)
+        self.cache = cache if cache is not None else DOICache()
+        self.max_workers = max_workers
+        self.write_batch = write_batch
+        self.logger = logging.getLogger(__name__)
+
+    def _fetch(self, doi: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        return doi, self.fetch(doi)
+
+    def resolve(self, dois: Iterable[str],
+                progress: Optional[Callable[[int, int], None]] = None) -> DOIBatchResult:
+        """
+        Resolve a batch of DOIs; ``progress`` is called with the number of
+        DOIs done and the batch size
+        """
+        start = time.time()
+        dois = list(dict.fromkeys(doi for doi in map(normalize_doi, dois) if doi))
+        records = self.cache.get_many(dois)
+        result = DOIBatchResult(requested=len(dois), cache_hits=len(records))
+        misses = [doi for doi in dois if doi not in records]
+        done = len(records)
+        if progress is not None:
+            progress(done, len(dois))
+
+        if misses:
+            pending: Dict[str, Optional[Dict[str, Any]]] = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._fetch, doi): doi for doi in misses}
+                try:
+                    for future in as_completed(futures):
+                        try:
+                            doi, record = future.result()
+                        except Exception as e:
+                            self.logger.warning(f"Failed to resolve DOI {futures[future]}: {e}")
+                            result.failed.append(futures[future])
+                        else:
+                            records[doi] = pending[doi] = record
+                            result.fetched += 1
+                            if len(pending) >= self.write_batch:
+                                self.cache.put_many(pending)
+                                pending = {}
+                        done += 1
+                        if progress is not None:
+                            progress(done, len(dois))
+                finally:
+                    for future in futures:
+                        future.cancel()
+                    self.cache.put_many(pending)
+
+        for doi in dois:
+            if doi not in records:
+                continue
+            if records[doi] is None:
+                result.not_found.append(doi)
+                continue
+            try:
+                result.papers.append(csl_to_paper(doi, records[doi]))
+            except (TypeError, ValueError, AttributeError) as e:
+                self.logger.warning(f"Unusable metadata for DOI {doi}: {e}")
+                result.failed.append(doi)
+        result.elapsed = time.time() - start
+        self.logger.info(result.summary())
+        return result
+
+    def close(self) -> None:
+        close = getattr(self.fetch, 'close', None)
+        if close is not None:
+            close()
+        self.cache.close()
@@ -0,0 +1,194 @@
+import csv
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.research_scraper import ResearchPaper, ResearchScraper
+
+DEFAULT_STATE_DIR = os.path.join(project_root, 'harvests')
+
+HARVEST_SOURCES = ('arXiv', 'Semantic Scholar')
+
+@dataclass
+class HarvestCursor:
+    """
+    Resumable position of a harvest for one query and source.
+
+    arXiv pages are addressed by ``offset``; Semantic Scholar bulk search by
+    its continuation ``token``.
+    """
+    query: str
+    source: str
+    offset: int = 0
+    token: Optional[str] = None
+    harvested: int = 0
+    done: bool = False
+
+class JSONLinesSink:
+    """
+    Appends papers to a JSON Lines file, one paper per line
+    """
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, papers: List[ResearchPaper]) -> None:
+        for paper in papers:
+            self._file.write(json.dumps(asdict(paper), ensure_ascii=False))
+            self._file.write('\n')
+
+    def flush(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+class CSVSink:
+    """
+    Appends papers to a CSV file with the to_dataframe column layout
+    """
+    fieldnames = ['title', 'authors', 'abstract', 'url', 'publication_date', 'source', 'doi', 'arxiv_id']
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'a', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+        if write_header:
+            self._writer.writeheader()
+
+    def write(self, papers: List[ResearchPaper]) -> None:
+        for paper in papers:
+            row = asdict(paper)
+            row['authors'] = ', '.join(row['authors'])
+            self._writer.writerow(row)
+
+    def flush(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+class Harvester:
+    """
+    Harvests large result sets page by page at constant memory.
+
+    At most ``buffer_size`` papers are held before being flushed to the sink,
+    and the cursor is persisted to ``state_dir`` after every flush. A harvest
+    interrupted by a crash restarts from the last persisted cursor; pages
+    fetched after that point but not yet flushed are fetched again.
+    """
+    def __init__(self,
+                 scraper: Optional[ResearchScraper] = None,
+                 state_dir: str = DEFAULT_STATE_DIR,
+                 page_size: int = 200,
+                 buffer_size: int = 1000,
+                 delay_seconds: float = 3.0):
+        self.scraper = scraper or ResearchScraper()
+        self.state_dir = state_dir
+        self.page_size = page_size
+        self.buffer_size = buffer_size
+        self.delay_seconds = delay_seconds
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(state_dir, exist_ok=True)
+
+    def _cursor_path(self, query: str, source: str) -> str:
+        digest = hashlib.sha1(f"{source}\n{query}".encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.state_dir, f"{digest}.cursor.json")
+
+    def load_cursor(self, query: str, source: str) -> HarvestCursor:
+        """
+        Load the persisted cursor for a query, or a fresh one
+        """
+        path = self._cursor_path(query, source)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return HarvestCursor(**json.load(f))
+        return HarvestCursor(query=query, source=source)
+
+    def save_cursor(self, cursor: HarvestCursor) -> None:
+        """
+        Persist a cursor atomically so a crash never leaves a torn file
+        """
+        path = self._cursor_path(cursor.query, cursor.source)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(cursor), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def reset(self, query: str, source: str) -> None:
+        """
+        Forget a harvest's cursor so the next run starts from the beginning
+        """
+        path = self._cursor_path(query, source)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _next_page(self, cursor: HarvestCursor) -> List[ResearchPaper]:
+        # Fetch the page at the cursor and advance it in place
+        if cursor.source == 'arXiv':
+            papers = self.scraper.fetch_arxiv_page(cursor.query, cursor.offset, self.page_size)
+            cursor.offset += self.page_size
+            cursor.done = len(papers) == 0
+        else:
+            papers, cursor.token = self.scraper.fetch_semantic_scholar_bulk_page(cursor.query, cursor.token)
+            cursor.offset += len(papers)
+            cursor.done = cursor.token is None
+        return papers
+
+    def harvest(self, query: str, sink, source: str = 'arXiv',
+                max_papers: Optional[int] = None, resume: bool = True) -> HarvestCursor:
+        """
+        Harvest every result for a query from one source into a sink.
+
+        ``sink`` is any object with ``write(papers)`` and ``flush()``. With
+        ``max_papers`` the harvest stops at the first page boundary at or
+        past that count, so the cursor always matches what the sink holds.
+        Returns the final cursor.
+        """
+        if source not in HARVEST_SOURCES:
+            raise ValueError(f"Unsupported harvest source: {source}")
+
+        cursor = self.load_cursor(query, source) if resume else HarvestCursor(query=query, source=source)
+        if cursor.done:
+            self.logger.info(f"Harvest of '{query}' from {source} already complete ({cursor.harvested} papers)")
+            return cursor
+
+        buffer: List[ResearchPaper] = []
+
+        def flush() -> None:
+            if buffer:
+                sink.write(buffer)
+                cursor.harvested += len(buffer)
+                buffer.clear()
+            sink.flush()
+            self.save_cursor(cursor)
+
+        while not cursor.done:
+            if max_papers is not None and cursor.harvested + len(buffer) >= max_papers:
+                break
+            buffer.extend(self._next_page(cursor))
+            if len(buffer) >= self.buffer_size or cursor.done:
+                flush()
+                self.logger.info(f"Harvested {cursor.harvested} papers for '{query}' from {source}")
+            if not cursor.done and self.delay_seconds:
+                # Both APIs ask clients to pace sequential requests
+                time.sleep(self.delay_seconds)
+
+        flush()
+        return cursor
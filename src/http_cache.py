@@ -0,0 +1,273 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_CACHE_PATH = os.path.join(project_root, 'cache', 'http_cache.sqlite3')
+
+# Response headers kept alongside a cached body
+STORED_HEADERS = ('content-type', 'etag', 'last-modified')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Cache hits whose LRU position is written back together
+TOUCH_BATCH = 256
+
+class CacheMissError(requests.exceptions.ConnectionError):
+    """
+    Raised in cache_only mode when a request has no cached response
+    """
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response body with the headers needed for revalidation
+    """
+    key: str
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = 0.0
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('last-modified')
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a canonical cache key from a URL and its query parameters.
+
+    Scheme and host are lower-cased, default ports and fragments dropped, and
+    query parameters from both the URL and ``params`` are merged and sorted.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for name, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        query.extend((name, str(v)) for v in values)
+
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(sorted(query)), ''))
+
+class HTTPCache:
+    """
+    Persistent, size-capped LRU cache of HTTP GET responses.
+
+    Entries live in a SQLite file. Fresh entries (younger than ``ttl`` seconds)
+    are served directly; stale entries are revalidated upstream with
+    If-None-Match / If-Modified-Since. With ``cache_only`` set no request ever
+    leaves the process and misses raise CacheMissError. Hits update their
+    LRU position in memory; the positions are written in batches, before
+    any eviction and on close, so a cache read is not a disk write.
+    """
+    def __init__(self,
+                 path: str = DEFAULT_CACHE_PATH,
+                 ttl: float = 24 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 cache_only: bool = False):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.cache_only = cache_only
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'evicted': 0}
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        # Last access time of entries hit since the last write-back
+        self._touched: Dict[str, float] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " body BLOB NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def key_for(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return normalize_url(url, params)
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the entry for a key, marking it most recently used
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, headers, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH:
+                self._write_touches()
+                self._conn.commit()
+        return CacheEntry(key=key, body=row[0], headers=json.loads(row[1]), stored_at=row[2])
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def can_serve(self, entry: Optional[CacheEntry]) -> bool:
+        """
+        Whether an entry may be returned without contacting upstream
+        """
+        if entry is None:
+            return False
+        if self.cache_only or self.is_fresh(entry):
+            self.stats['hits'] += 1
+            return True
+        return False
+
+    def conditional_headers(self, entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """
+        Request headers that revalidate a stale entry upstream
+        """
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, key: str, headers: Dict[str, str], body: bytes) -> None:
+        """
+        Store a response body and evict least recently used entries over the cap
+        """
+        kept = {name: value for name, value in
+                ((name.lower(), value) for name, value in headers.items())
+                if name in STORED_HEADERS}
+        size = len(body)
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, headers, size, stored_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(body), json.dumps(kept), size, now, now)
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._touched.pop(key, None)
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, key: str) -> None:
+        """
+        Mark an entry fresh again after a 304 Not Modified
+        """
+        self.stats['revalidated'] += 1
+        with self._lock:
+            self._touched.pop(key, None)
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, last_access = ? WHERE key = ?",
+                (time.time(), time.time(), key)
+            )
+            self._conn.commit()
+
+    def _write_touches(self) -> None:
+        # Called with the lock held; the caller commits
+        if self._touched:
+            self._conn.executemany("UPDATE responses SET last_access = ? WHERE key = ?",
+                                   [(accessed, key) for key, accessed in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        # Evict by up-to-date access times
+        self._write_touches()
+        cursor = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC")
+        doomed = []
+        for key, size in cursor:
+            if self._total_bytes <= self.max_bytes:
+                break
+            doomed.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self.stats['evicted'] += len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._touched.clear()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._write_touches()
+            self._conn.commit()
+            self._conn.close()
+
+class CachingAdapter(HTTPAdapter):
+    """
+    requests transport adapter that serves GET requests through an HTTPCache
+    """
+    def __init__(self, cache: HTTPCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        key = self.cache.key_for(request.url)
+        entry = self.cache.lookup(key)
+        if self.cache.can_serve(entry):
+            return self._cached_response(request, entry)
+        if self.cache.cache_only:
+            raise CacheMissError(f"No cached response for {request.url}", request=request)
+
+        request.headers.update(self.cache.conditional_headers(entry))
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key)
+            return self._cached_response(request, entry)
+        if response.status_code == 200:
+            self.cache.store(key, response.headers, response.content)
+        return response
+
+    def _cached_response(self, request, entry: CacheEntry) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry.body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
@@ -0,0 +1,187 @@
+import re
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, List, Pattern
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r'\w+')
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+EMPTY = np.zeros(0, dtype=np.int32)
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lower-case word tokens of a piece of text
+    """
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+def _phrase_pattern(phrase: List[str]) -> Pattern:
+    # Adjacent tokens are exactly those separated by non-word characters only.
+    # No leading \b, which would stop re from scanning for the literal prefix.
+    return re.compile(r'\W+'.join(map(re.escape, phrase)) + r'(?!\w)')
+
+def _has_phrase(pattern: Pattern, text: str) -> bool:
+    if not text:
+        return False
+    text = text.lower()
+    for match in pattern.finditer(text):
+        start = match.start()
+        if start == 0 or not TOKEN_PATTERN.match(text[start - 1]):
+            return True
+    return False
+
+class KeywordIndex:
+    """
+    Inverted index over paper titles and abstracts.
+
+    Each token maps to the ids of the papers containing it, appended as
+    papers arrive, so posting lists stay sorted and queries reduce to numpy
+    intersections and unions of them. Queries support implicit AND, AND/OR
+    operators (AND binds tighter), "quoted phrases" and trailing-* prefixes.
+    Phrases intersect the postings of their words and then check word order
+    with one compiled regex on the remaining candidates, so no positions
+    need to be stored.
+    """
+    def __init__(self):
+        self.papers: List[Any] = []
+        self._postings = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_stale = False
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    def add(self, papers: Iterable[Any]) -> None:
+        """
+        Index papers, giving each the next document id
+        """
+        postings = self._postings
+        for paper in papers:
+            doc_id = len(self.papers)
+            self.papers.append(paper)
+            for token in set(tokenize(paper.title)).union(tokenize(paper.abstract)):
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = array('i')
+                    self._vocabulary_stale = True
+                posting.append(doc_id)
+
+    def clear(self) -> None:
+        self.papers = []
+        self._postings = {}
+        self._vocabulary = []
+        self._vocabulary_stale = False
+
+    def _term(self, token: str) -> np.ndarray:
+        posting = self._postings.get(token)
+        # Copy so the array can keep growing while results are held
+        return np.frombuffer(posting, dtype=np.int32).copy() if posting else EMPTY
+
+    def _prefix(self, prefix: str) -> np.ndarray:
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_stale = False
+        postings = []
+        for i in range(bisect_left(self._vocabulary, prefix), len(self._vocabulary)):
+            token = self._vocabulary[i]
+            if not token.startswith(prefix):
+                break
+            postings.append(self._postings[token])
+        if not postings:
+            return EMPTY
+        if len(postings) == 1:
+            return np.frombuffer(postings[0], dtype=np.int32).copy()
+        return np.unique(np.concatenate([np.frombuffer(posting, dtype=np.int32) for posting in postings]))
+
+    def _phrase(self, phrase: List[str]) -> np.ndarray:
+        candidates = self._intersect([self._term(token) for token in phrase])
+        if len(phrase) < 2:
+            return candidates
+        pattern = _phrase_pattern(phrase)
+        papers = self.papers
+        return np.array([
+            doc_id for doc_id in candidates.tolist()
+            if _has_phrase(pattern, papers[doc_id].title) or _has_phrase(pattern, papers[doc_id].abstract)
+        ], dtype=np.int32)
+
+    @staticmethod
+    def _intersect(postings: List[np.ndarray]) -> np.ndarray:
+        if not postings:
+            return EMPTY
+        # Smallest list first keeps every intermediate result small
+        postings = sorted(postings, key=len)
+        result = postings[0]
+        for posting in postings[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, posting, assume_unique=True)
+        return result
+
+    def _clause(self, phrase: str, word: str) -> np.ndarray:
+        if phrase:
+            return self._phrase(tokenize(phrase))
+        if word.endswith('*'):
+            tokens = tokenize(word)
+            return self._prefix(tokens[0]) if len(tokens) == 1 else self._phrase(tokens)
+        return self._phrase(tokenize(word))
+
+    def search_ids(self, query: str) -> np.ndarray:
+        """
+        Sorted ids of the papers matching a query such as
+        ``"graph neural" AND attention OR transformer*``
+        """
+        groups = [[]]
+        for phrase, word in QUERY_PATTERN.findall(query):
+            if word == 'OR':
+                groups.append([])
+            elif word != 'AND':
+                groups[-1].append(self._clause(phrase, word))
+        results = [self._intersect(group) for group in groups if group]
+        if not results:
+            return EMPTY
+        return results[0] if len(results) == 1 else np.unique(np.concatenate(results))
+
+    def search(self, query: str) -> List[Any]:
+        """
+        Papers matching a query, in the order they were added
+        """
+        return [self.papers[doc_id] for doc_id in self.search_ids(query)]
+
+    def _containing(self, fragment: str) -> np.ndarray:
+        # Papers with a token that contains the fragment anywhere
+        postings = [posting for token, posting in self._postings.items() if fragment in token]
+        if not postings:
+            return EMPTY
+        return np.unique(np.concatenate([np.frombuffer(posting, dtype=np.int32) for posting in postings]))
+
+    def _substring(self, keyword: str) -> np.ndarray:
+        keyword = keyword.lower()
+        tokens = TOKEN_PATTERN.findall(keyword)
+        if not tokens:
+            candidates = np.arange(len(self.papers), dtype=np.int32)
+        else:
+            candidates = self._intersect([self._containing(token) for token in tokens])
+        # A run of word characters lies within one token, so only other
+        # keywords need checking against the text
+        if TOKEN_PATTERN.fullmatch(keyword):
+            return candidates
+        papers = self.papers
+        return np.array([
+            doc_id for doc_id in candidates.tolist()
+            if keyword in (papers[doc_id].title or '').lower() or keyword in (papers[doc_id].abstract or '').lower()
+        ], dtype=np.int32)
+
+    def match_any(self, keywords: Iterable[str]) -> List[Any]:
+        """
+        Papers whose title or abstract contains any keyword as a substring,
+        ignoring case: "earning" matches "reinforcement learning". Each word
+        of a keyword is looked up in the vocabulary rather than the text,
+        and only keywords spanning several words are checked against the
+        text of the candidates.
+        """
+        results = [self._substring(keyword) for keyword in keywords]
+        if not results:
+            return []
+        ids = results[0] if len(results) == 1 else np.unique(np.concatenate(results))
+        return [self.papers[doc_id] for doc_id in ids]
@@ -1,5 +1,5 @@
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 import logging
 from datetime import datetime
 import pandas as pd
@@ -13,12 +13,55 @@ sys.path.insert(0, project_root)
 
 # Conditional import with error handling
 try:
-    from src.research_scraper import ResearchScraper, ResearchPaper
+    from src.research_scraper import ResearchScraper, ResearchPaper, SearchEvent, append_papers_to_frame
+    # The scraper's paper record, which the local ResearchPaper below shadows
+    from src.research_scraper import ResearchPaper as ScrapedPaper
+    from src.http_cache import DEFAULT_CACHE_PATH, HTTPCache
+    from src.paper_identity import PaperIdentityIndex
+    from src.watch_queries import WatchQueryStore
+    from src.paper_library import DEFAULT_LIBRARY_PATH, PaperLibrary
+    from src.keyword_index import KeywordIndex
+    from src.bm25 import BM25Index
+    from src.corpus import iter_corpus_papers, load_corpus_categories
+    from src.paper_store import PaperStore
+    from src.related_papers import SCIPY_AVAILABLE, RelatedPapers
+    from src.paper_export import PaperExporter
+    from src.summarizer import PaperSummarizer, extractive_summary
+    from src.author_graph import AuthorGraph
+    from src.author_index import AuthorIndex
+    from src.bibtex import iter_bibtex_papers
+    from src.doi_resolver import DOIResolver, extract_dois
+    from src.dates import DateIndex
     RESEARCH_SCRAPER_AVAILABLE = True
 except ImportError as e:
     RESEARCH_SCRAPER_AVAILABLE = False
     ResearchScraper = None
     ResearchPaper = None
+    ScrapedPaper = None
+    SearchEvent = None
+    append_papers_to_frame = None
+    HTTPCache = None
+    DEFAULT_CACHE_PATH = None
+    PaperIdentityIndex = None
+    WatchQueryStore = None
+    PaperLibrary = None
+    DEFAULT_LIBRARY_PATH = None
+    KeywordIndex = None
+    BM25Index = None
+    iter_corpus_papers = None
+    PaperStore = None
+    load_corpus_categories = None
+    SCIPY_AVAILABLE = False
+    RelatedPapers = None
+    PaperExporter = None
+    PaperSummarizer = None
+    extractive_summary = None
+    AuthorGraph = None
+    AuthorIndex = None
+    iter_bibtex_papers = None
+    DOIResolver = None
+    extract_dois = None
+    DateIndex = None
     print(f"Warning: Research Scraper could not be imported: {e}. Research paper features will be limited.")
 
 @dataclass
@@ -46,16 +89,22 @@ class ResearchPaper:
         self.authors = self.authors or []
         self.keywords = self.keywords or []
         self.research_domains = self.research_domains or []
-        
-        # Set publication date if not provided
-        if not self.publication_date:
-            self.publication_date = datetime.now().strftime("%Y-%m-%d")
+
+        # An unknown publication date stays None rather than being guessed
+        self.publication_date = self.publication_date or None
 
 class PaperAgent:
     """
     Specialized agent for managing and analyzing research papers.
+
+    The HTTP response cache and the paper library are SQLite files, by
+    default under the project's cache/ and library/ directories;
+    ``cache_path`` and ``library_path`` put them elsewhere (':memory:'
+    keeps them off disk).
     """
-    def __init__(self, name: str = None):
+    def __init__(self, name: str = None, use_cache: bool = True, cache_only: bool = False,
+                 library_path: Optional[str] = None, llm_manager: Any = None,
+                 cache_path: Optional[str] = None):
         # Generate a unique ID and name if not provided
         self.id = str(uuid.uuid4())
         self.name = name or f"paper_agent_{self.id[:8]}"
@@ -73,10 +122,63 @@ class PaperAgent:
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
 
+        # Saved standing queries, created on first use
+        self._watch_store = None
+
+        # Per-source outcome of the most recent search
+        self.last_search_status: Dict[str, str] = {}
+
+        # Persistent library that accumulates papers across searches
+        self.library = None
+
+        # Response cache shared by the scraper's sources
+        self.http_cache = None
+
+        # Inverted, ranked and date indexes and the DataFrame of the collected
+        # papers. Each records the revision of the papers (bumped by
+        # papers_changed) it was built from and is rebuilt on use once that
+        # moves on; appended papers extend the indexes and frame in place.
+        self.keyword_index = KeywordIndex() if KeywordIndex else None
+        self.ranked_index = BM25Index() if BM25Index else None
+        self._papers_revision = 0
+        self._indexes_revision = 0
+        self._frame_revision = 0
+        self._date_index = None
+        self._date_index_revision = None
+
+        # papers.csv held once in a columnar store, and a ranked index over
+        # it, both built on first use
+        self._corpus_store = None
+        self._corpus_index = None
+
+        # TF-IDF models for related papers, rebuilt when their papers change
+        self._related = None
+        self._related_ids: Dict[int, int] = {}
+        self._related_revision = None
+        self._corpus_related = None
+
+        # Co-author graphs of the library (grown as papers are added) and papers.csv
+        self._author_graph = None
+        self._author_graph_last_id = 0
+        self._corpus_graph = None
+
+        # Author name variants in the library mapped to canonical authors
+        self._author_index = None
+        self._author_index_last_id = 0
+
+        # LLM used to summarize papers; summaries are cached across runs
+        self.llm_manager = llm_manager
+        self._summarizer = None
+
+        # DOI metadata lookups, cached across runs; created on first use
+        self._doi_resolver = None
+
         # Only initialize if ResearchScraper is available
         if RESEARCH_SCRAPER_AVAILABLE:
             try:
-                self.research_scraper = ResearchScraper()
+                if use_cache or cache_only:
+                    self.http_cache = HTTPCache(cache_path or DEFAULT_CACHE_PATH, cache_only=cache_only)
+                self.research_scraper = ResearchScraper(cache=self.http_cache)
                 self.collected_papers: List[ResearchPaper] = []
                 self.papers_dataframe: Optional[pd.DataFrame] = None
                 self.logger.info("Research scraper initialized successfully")
@@ -85,45 +187,263 @@ class PaperAgent:
                 self.research_scraper = None
                 self.collected_papers = []
                 self.papers_dataframe = None
+
+            # Searching works without the library, and the library without the sources
+            try:
+                self.library = PaperLibrary(library_path or DEFAULT_LIBRARY_PATH)
+            except Exception as e:
+                self.logger.error(f"Failed to open paper library: {e}")
+                self.library = None
         else:
             self.research_scraper = None
             self.collected_papers = []
             self.papers_dataframe = None
             self.logger.warning("Research scraper not available")
 
-    def search_papers(self, query: str) -> List[ResearchPaper]:
+    def search_papers_stream(self, query: str, deadline: Optional[float] = None) -> Iterator['SearchEvent']:
         """
-        Search and collect research papers from multiple sources
+        Search papers from multiple sources, yielding progress events and
+        deduplicated papers as each source completes. Sources that miss the
+        ``deadline`` (seconds) are abandoned; see ``last_search_status``.
         """
         if not RESEARCH_SCRAPER_AVAILABLE or not self.research_scraper:
             self.logger.warning("Research paper search is not available.")
-            return []
+            return
 
+        self.logger.info(f"Searching for papers with query: {query}")
+        self.collected_papers = []
+        self.papers_changed()
+        self._rebuild_indexes()
+        self._rebuild_frame()
+        self.last_search_status = {}
         try:
-            self.logger.info(f"Searching for papers with query: {query}")
-            self.collected_papers = self.research_scraper.scrape_all_sources(query)
-            self.logger.info(f"Found {len(self.collected_papers)} papers")
-            
-            if self.collected_papers:
-                self.papers_dataframe = self.research_scraper.to_dataframe(self.collected_papers)
-                return self.collected_papers
-            else:
-                self.logger.warning("No papers found for the given query")
-                return []
+            for event in self.research_scraper.iter_all_sources(query, deadline):
+                if event.enriched:
+                    # Duplicates filled in papers yielded earlier, which are already indexed
+                    self.papers_changed()
+                if event.papers:
+                    self.collected_papers.extend(event.papers)
+                    self._papers_appended(event.papers)
+                if event.status != 'papers':
+                    self.last_search_status[event.source] = event.status
+                yield event
         except Exception as e:
             self.logger.error(f"Error searching papers: {e}")
+            return
+
+        self.logger.info(f"Found {len(self.collected_papers)} papers")
+        if self.collected_papers:
+            self.store_papers(self.collected_papers)
+        else:
+            self.logger.warning("No papers found for the given query")
+
+    def search_papers(self, query: str, deadline: Optional[float] = None,
+                      from_library: bool = False) -> List[ResearchPaper]:
+        """
+        Search and collect research papers from multiple sources, falling
+        back to the local library when no source returns anything. With
+        ``from_library`` the library's full-text index is searched instead
+        of the sources.
+        """
+        if not from_library:
+            for _ in self.search_papers_stream(query, deadline):
+                pass
+        if (from_library or not self.collected_papers) and self.library is not None:
+            self.collected_papers = self.search_library(query)
+            self.papers_changed()
+            if self.collected_papers:
+                self.logger.info(f"Using {len(self.collected_papers)} papers from the local library")
+        return self.collected_papers
+
+    def store_papers(self, papers: List[ResearchPaper]) -> List[int]:
+        """
+        Add papers to the persistent library, merging duplicates, and return
+        their library ids
+        """
+        if self.library is None or not papers:
+            return []
+        try:
+            return self.library.upsert(papers)
+        except Exception as e:
+            self.logger.error(f"Error storing papers in library: {e}")
+            return []
+
+    def add_paper(self, paper: Any) -> Optional[int]:
+        """
+        Add a manually entered paper to the library and return its id
+        """
+        ids = self.store_papers([ScrapedPaper(
+            title=paper.title,
+            authors=list(paper.authors),
+            abstract=getattr(paper, 'abstract', '') or '',
+            url=getattr(paper, 'url', '') or '',
+            publication_date=getattr(paper, 'publication_date', None) or None,
+            source=getattr(paper, 'source', 'Manual')
+        )])
+        return ids[0] if ids else None
+
+    def import_bibtex(self, path: str, batch_size: int = 2000,
+                      progress: Optional[Callable[[int, int, int], None]] = None) -> Dict[str, int]:
+        """
+        Stream a BibTeX file into the library in transactions of
+        ``batch_size`` papers, merging entries already stored. ``progress``
+        is called with bytes read, file size and papers stored so far.
+        Returns stored and new-paper counts.
+        """
+        if self.library is None:
+            self.logger.warning("No paper library available for BibTeX import")
+            return {'stored': 0, 'added': 0}
+        total = os.path.getsize(path)
+        before = len(self.library)
+        stored = 0
+        bytes_read = 0
+
+        def report(position: int) -> None:
+            nonlocal bytes_read
+            bytes_read = position
+            if progress is not None:
+                progress(bytes_read, total, stored)
+
+        batch = []
+        with open(path, 'rb') as stream:
+            for paper in iter_bibtex_papers(stream, report):
+                batch.append(paper)
+                if len(batch) >= batch_size:
+                    stored += len(self.library.upsert(batch))
+                    batch = []
+                    if progress is not None:
+                        progress(bytes_read, total, stored)
+            if batch:
+                stored += len(self.library.upsert(batch))
+        if progress is not None:
+            progress(total, total, stored)
+
+        added = len(self.library) - before
+        self.logger.info(f"Imported {stored} BibTeX entries from {path} ({added} new)")
+        return {'stored': stored, 'added': added}
+
+    def import_dois(self, dois: Any, batch_size: int = 1000,
+                    progress: Optional[Callable[[int, int, int], None]] = None) -> Dict[str, Any]:
+        """
+        Resolve DOIs (a list, or text with DOIs anywhere in it) and add the
+        papers to the library, ``batch_size`` DOIs at a time. ``progress``
+        is called with DOIs done, DOIs in total and papers stored. Returns
+        totals over all batches.
+        """
+        if isinstance(dois, str):
+            dois = extract_dois(dois)
+        else:
+            dois = extract_dois('\n'.join(dois))
+        totals = {'requested': len(dois), 'stored': 0, 'added': 0, 'not_found': [], 'failed': [],
+                  'cache_hits': 0, 'fetched': 0, 'elapsed': 0.0}
+        if self.library is None or not dois:
+            return totals
+        if self._doi_resolver is None:
+            self._doi_resolver = DOIResolver()
+        before = len(self.library)
+
+        for start in range(0, len(dois), batch_size):
+            batch = dois[start:start + batch_size]
+            report = None
+            if progress is not None:
+                report = lambda done, _, offset=start: progress(offset + done, len(dois), totals['stored'])
+            result = self._doi_resolver.resolve(batch, report)
+            totals['stored'] += len(self.library.upsert(result.papers)) if result.papers else 0
+            totals['not_found'].extend(result.not_found)
+            totals['failed'].extend(result.failed)
+            totals['cache_hits'] += result.cache_hits
+            totals['fetched'] += result.fetched
+            totals['elapsed'] += result.elapsed
+            if progress is not None:
+                progress(start + len(batch), len(dois), totals['stored'])
+
+        totals['added'] = len(self.library) - before
+        totals['hit_rate'] = totals['cache_hits'] / totals['requested']
+        totals['throughput'] = totals['requested'] / totals['elapsed'] if totals['elapsed'] else 0.0
+        self.logger.info(f"Imported {totals['stored']} papers from {len(dois)} DOIs ({totals['added']} new, "
+                         f"{totals['throughput']:.0f} DOIs/s, cache hit rate {totals['hit_rate']:.0%})")
+        return totals
+
+    def search_library(self, query: str, limit: int = 100) -> List[ResearchPaper]:
+        """
+        Full-text search of every paper stored in the library
+        """
+        if self.library is None:
+            return []
+        return [paper for _, paper in self.library.search(query, limit)]
+
+    @property
+    def watch_store(self) -> Optional['WatchQueryStore']:
+        if self._watch_store is None and RESEARCH_SCRAPER_AVAILABLE and self.research_scraper:
+            self._watch_store = WatchQueryStore(scraper=self.research_scraper)
+        return self._watch_store
+
+    def watch_query(self, query: str) -> None:
+        """
+        Save a standing query to be refreshed incrementally
+        """
+        if not self.watch_store:
+            self.logger.warning("Watch queries are not available.")
+            return
+        self.watch_store.add(query)
+        self.logger.info(f"Watching query: {query}")
+
+    def refresh_watch_query(self, query: str) -> List[ResearchPaper]:
+        """
+        Fetch only papers newer than the last refresh of a watched query and
+        merge them into the collected papers
+        """
+        if not self.watch_store:
+            self.logger.warning("Watch queries are not available.")
+            return []
+
+        try:
+            new_papers = self.watch_store.refresh(query)
+        except Exception as e:
+            self.logger.error(f"Error refreshing watch query: {e}")
             return []
 
+        index = PaperIdentityIndex()
+        for paper in self.collected_papers:
+            index.add(paper)
+        merged = [paper for paper in new_papers if index.add(paper)[1]]
+        if index.enriched:
+            # Duplicates filled in papers that are already indexed
+            self.papers_changed()
+        if merged:
+            self.collected_papers.extend(merged)
+            self._papers_appended(merged)
+        self.store_papers(new_papers)
+        self.logger.info(f"Merged {len(merged)} new papers from watch query: {query}")
+        return merged
+
+    def source_health(self) -> List[Dict[str, Any]]:
+        """
+        Circuit breaker state of each paper source
+        """
+        if not self.research_scraper:
+            return []
+        return self.research_scraper.source_health()
+
     def get_papers_dataframe(self) -> pd.DataFrame:
         """
         Return collected papers as a DataFrame
         """
+        if self._frame_revision != self._papers_revision:
+            self._rebuild_frame()
         return self.papers_dataframe if self.papers_dataframe is not None else pd.DataFrame()
 
-    def filter_papers(self, keywords: List[str]) -> List[ResearchPaper]:
+    def filter_papers(self, keywords: List[str], from_library: bool = False) -> List[ResearchPaper]:
         """
-        Filter collected papers based on keywords
+        Filter collected papers on keywords in the title or abstract, or
+        with ``from_library`` every library paper, through its full-text
+        index
         """
+        if from_library:
+            return self.filter_library(keywords)
+        if self.keyword_index is not None:
+            self._update_indexes()
+            return self.keyword_index.match_any(keywords)
         if not self.collected_papers:
             return []
         
@@ -136,61 +456,323 @@ class PaperAgent:
         
         return filtered_papers
 
-    def export_papers_to_csv(self, papers: List[ResearchPaper] = None, filename: str = None):
+    def papers_between(self, start: Any = None, end: Any = None, overlap: bool = False) -> List[ResearchPaper]:
         """
-        Export collected papers to a CSV file
+        Collected papers published from ``start`` through ``end`` (e.g.
+        "2020", "2021-06" or "2021-06-15"; either may be None), oldest first
         """
-        papers_to_export = papers or self.collected_papers
-        
-        if not papers_to_export:
-            self.logger.warning("No papers to export.")
+        if DateIndex is None or not self.collected_papers:
+            return []
+        if self._date_index_revision != self._papers_revision:
+            self._date_index = DateIndex.from_dates(paper.publication_date for paper in self.collected_papers)
+            self._date_index_revision = self._papers_revision
+        return [self.collected_papers[i] for i in self._date_index.between(start, end, overlap)]
+
+    def papers_changed(self) -> None:
+        """
+        Mark the collected papers as changed, so that the indexes and the
+        DataFrame derived from them are rebuilt on next use; call it after
+        assigning or editing ``collected_papers``
+        """
+        self._papers_revision += 1
+
+    def _papers_appended(self, papers: List[Any]) -> None:
+        # collected_papers grew by ``papers``: whatever was current is extended in place
+        indexes_current = self._indexes_revision == self._papers_revision
+        frame_current = self._frame_revision == self._papers_revision
+        self.papers_changed()
+        if indexes_current and self.keyword_index is not None:
+            self.keyword_index.add(papers)
+            self.ranked_index.add(papers)
+            self._indexes_revision = self._papers_revision
+        if frame_current:
+            # The frame grows with each batch, so it is current while a search runs
+            self.papers_dataframe = append_papers_to_frame(self.papers_dataframe, papers)
+            self._frame_revision = self._papers_revision
+
+    def _rebuild_indexes(self) -> None:
+        if self.keyword_index is not None:
+            self.keyword_index.clear()
+            self.ranked_index.clear()
+            self.keyword_index.add(self.collected_papers)
+            self.ranked_index.add(self.collected_papers)
+        self._indexes_revision = self._papers_revision
+
+    def _rebuild_frame(self) -> None:
+        self.papers_dataframe = append_papers_to_frame(None, self.collected_papers) if self.collected_papers else None
+        self._frame_revision = self._papers_revision
+
+    def _update_indexes(self) -> None:
+        if self._indexes_revision != self._papers_revision:
+            self._rebuild_indexes()
+
+    def library_papers_between(self, start: Any = None, end: Any = None, overlap: bool = False,
+                               limit: Optional[int] = None) -> List[ResearchPaper]:
+        """
+        Library papers published from ``start`` through ``end``, oldest first
+        """
+        if self.library is None:
+            return []
+        return [paper for _, paper in self.library.published_between(start, end, overlap, limit)]
+
+    def query_papers(self, query: str) -> List[ResearchPaper]:
+        """
+        Collected papers matching a boolean query, e.g.
+        ``"graph neural" AND attention OR transformer*``
+        """
+        if self.keyword_index is None:
+            return []
+        self._update_indexes()
+        return self.keyword_index.search(query)
+
+    def rank_papers(self, query: str, k: int = 50) -> List[ResearchPaper]:
+        """
+        The ``k`` collected papers most relevant to a query, best first
+        """
+        if self.ranked_index is None:
+            return []
+        self._update_indexes()
+        return self.ranked_index.search(query, k)
+
+    def search_corpus(self, query: str, k: int = 50) -> List[ResearchPaper]:
+        """
+        The ``k`` papers in papers.csv most relevant to a query, best first
+        """
+        if BM25Index is None:
+            return []
+        if self._corpus_index is None:
+            try:
+                rows = self.corpus_store()
+            except Exception as e:
+                self.logger.error(f"Error loading papers.csv: {e}")
+                return []
+            self._corpus_index = BM25Index()
+            self._corpus_index.add(rows)
+        return [row.to_paper() for row in self._corpus_index.search(query, k)]
+
+    def corpus_store(self) -> 'PaperStore':
+        """
+        papers.csv in a compact columnar store, loaded once and shared by the
+        corpus search, clusters and author graph
+        """
+        if self._corpus_store is None:
+            self._corpus_store = PaperStore(iter_corpus_papers())
+        return self._corpus_store
+
+    def related_papers(self, paper_id: int, k: int = 10) -> List[ResearchPaper]:
+        """
+        The ``k`` library papers most similar to the library paper with id
+        ``paper_id`` ("more like this")
+        """
+        if self.library is None or not SCIPY_AVAILABLE:
+            return []
+        revision = self.library.revision()
+        if self._related is None or revision != self._related_revision:
+            self._update_related(revision)
+        doc_id = self._related_ids.get(paper_id)
+        if doc_id is None:
+            self.logger.warning(f"Paper {paper_id} is not in the library")
+            return []
+        return self._related.related(doc_id, k)
+
+    def _update_related(self, revision: Tuple[int, int, float]) -> None:
+        # Papers added since the model was built are added to it and merged
+        # ones re-read; deletions need a rebuild from the whole library
+        if self._related is not None:
+            _, last_id, updated_at = self._related_revision
+            changed = self.library.updated_since(updated_at, through_id=last_id)
+            added = list(self.library.iter_papers(after_id=last_id))
+            if len(self._related) + len(added) == revision[0]:
+                for library_id, paper in changed:
+                    doc_id = self._related_ids.get(library_id)
+                    if doc_id is not None:
+                        self._related.replace(doc_id, paper)
+                for library_id, _ in added:
+                    self._related_ids[library_id] = len(self._related_ids)
+                self._related.add(paper for _, paper in added)
+                last_id = added[-1][0] if added else last_id
+                self._related_revision = (len(self._related), last_id, revision[2])
+                return
+        rows = self.library.all()
+        self._related = RelatedPapers([paper for _, paper in rows])
+        self._related_ids = {library_id: doc_id for doc_id, (library_id, _) in enumerate(rows)}
+        self._related_revision = (len(rows), rows[-1][0] if rows else 0, revision[2])
+
+    def corpus_clusters(self, threshold: float = 0.3, k: int = 10) -> List[List[ResearchPaper]]:
+        """
+        Groups of similar papers in papers.csv, largest first
+        """
+        if not SCIPY_AVAILABLE:
+            return []
+        if self._corpus_related is None:
+            try:
+                self._corpus_related = RelatedPapers(self.corpus_store())
+            except Exception as e:
+                self.logger.error(f"Error loading papers.csv: {e}")
+                return []
+        papers = self._corpus_related.papers
+        return [[papers[doc_id].to_paper() for doc_id in group]
+                for group in self._corpus_related.clusters(threshold, k)]
+
+    def author_graph(self) -> Optional['AuthorGraph']:
+        """
+        Co-author graph of the library, tagged by source, brought up to date
+        with the papers added since the last call
+        """
+        if self.library is None or not SCIPY_AVAILABLE:
             return None
-        
+        try:
+            # Deleted papers are the one change that needs a rebuild
+            if self._author_graph is None or len(self._author_graph) > len(self.library):
+                self._author_graph = AuthorGraph()
+                self._author_graph_last_id = 0
+            rows = list(self.library.iter_papers(after_id=self._author_graph_last_id))
+            if rows:
+                self._author_graph.add([paper for _, paper in rows], tags=[[paper.source] for _, paper in rows],
+                                       keys=[library_id for library_id, _ in rows])
+                self._author_graph_last_id = rows[-1][0]
+        except Exception as e:
+            self.logger.error(f"Error updating author graph: {e}")
+        return self._author_graph
+
+    def central_authors(self, k: int = 10, source: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        The ``k`` most central library authors by co-authorship PageRank,
+        optionally among papers from one source
+        """
+        graph = self.author_graph()
+        if graph is None:
+            return []
+        return graph.central_authors(k, tag=source)
+
+    def corpus_central_authors(self, category: Optional[str] = None, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        The ``k`` most central authors in papers.csv, optionally within one
+        category such as "Communication"
+        """
+        if not SCIPY_AVAILABLE:
+            return []
+        if self._corpus_graph is None:
+            try:
+                graph = AuthorGraph()
+                graph.add(self.corpus_store(), tags=[[category] for category in load_corpus_categories()])
+                self._corpus_graph = graph
+            except Exception as e:
+                self.logger.error(f"Error loading papers.csv: {e}")
+                return []
+        return self._corpus_graph.central_authors(k, tag=category)
+
+    def author_index(self) -> Optional['AuthorIndex']:
+        """
+        Canonical authors of the library, brought up to date with the papers
+        added since the last call
+        """
+        if self.library is None:
+            return None
+        try:
+            if self._author_index is None or len(self._author_index.papers) > len(self.library):
+                self._author_index = AuthorIndex()
+                self._author_index_last_id = 0
+            rows = list(self.library.iter_papers(after_id=self._author_index_last_id))
+            if rows:
+                self._author_index.add(paper for _, paper in rows)
+                self._author_index_last_id = rows[-1][0]
+        except Exception as e:
+            self.logger.error(f"Error updating author index: {e}")
+        return self._author_index
+
+    def author_papers(self, name: str) -> List[ResearchPaper]:
+        """
+        Library papers by an author, whichever form of the name they used
+        """
+        index = self.author_index()
+        return index.author_papers(name) if index is not None else []
+
+    def filter_library(self, keywords: List[str]) -> List[ResearchPaper]:
+        """
+        Filter every paper in the library on keywords in the title or abstract
+        """
+        if self.library is None:
+            return []
+        return [paper for _, paper in self.library.filter(keywords)]
+
+    def export_papers(self,
+                      papers: Optional[Iterable[Any]] = None,
+                      filename: str = None,
+                      export_format: Optional[str] = None,
+                      compression: Optional[str] = None,
+                      from_library: bool = False,
+                      chunk_size: int = 10000) -> Optional[str]:
+        """
+        Stream papers to CSV, JSON Lines, Parquet or BibTeX under exports/, in
+        chunks of ``chunk_size``. Format and compression default to what the
+        file name implies. Exports the collected papers by default, or the
+        whole library with ``from_library``.
+        """
+        if from_library and self.library is not None:
+            papers_to_export = (paper for _, paper in self.library.iter_papers())
+        else:
+            papers_to_export = papers or self.collected_papers
+            if not papers_to_export:
+                self.logger.warning("No papers to export.")
+                return None
+
         # Generate a default filename if not provided
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"research_papers_{timestamp}.csv"
-        
+            suffix = {'gzip': '.gz', 'zstd': '.zst'}.get(compression, '')
+            filename = f"research_papers_{timestamp}.{export_format or 'csv'}{suffix}"
+
         # Ensure the exports directory exists
         export_dir = os.path.join(project_root, 'exports')
         os.makedirs(export_dir, exist_ok=True)
-        
+
         full_path = os.path.join(export_dir, filename)
-        
+
         try:
-            # Convert papers to DataFrame and export
-            df = pd.DataFrame([{
-                'title': p.title,
-                'authors': ', '.join(p.authors),
-                'abstract': p.abstract,
-                'url': p.url,
-                'source': p.venue,
-                'publication_date': p.publication_date
-            } for p in papers_to_export])
-            
-            df.to_csv(full_path, index=False, encoding='utf-8')
-            self.logger.info(f"Exported {len(papers_to_export)} papers to {full_path}")
+            with PaperExporter(full_path, export_format=export_format, compression=compression,
+                               chunk_size=chunk_size) as exporter:
+                exporter.write(papers_to_export)
+            self.logger.info(f"Exported {exporter.count} papers to {full_path}")
             return full_path
         except Exception as e:
-            self.logger.error(f"Error exporting papers to CSV: {e}")
+            self.logger.error(f"Error exporting papers: {e}")
             return None
 
+    def export_papers_to_csv(self, papers: List[ResearchPaper] = None, filename: str = None):
+        """
+        Export collected papers to a CSV file
+        """
+        return self.export_papers(papers, filename, export_format='csv')
+
+    def _paper_topics(self, papers: List[Any]) -> List[List[int]]:
+        return RelatedPapers(papers, max_df=0.5).clusters(threshold=0.2)
+
     def summarize_papers(self, papers: List[ResearchPaper]) -> str:
         """
-        Generate a summary of collected papers with web links
+        Summarize papers by topic with the selected LLM, with web links.
+        Without an LLM, list the opening sentence of the first few papers in
+        each topic instead.
         """
         if not papers:
             return "No papers to summarize."
-        
-        summary = "Research Paper Summary:\n\n"
-        for paper in papers[:10]:  # Limit to 10 papers
-            summary += f"Title: {paper.title}\n"
-            summary += f"Authors: {', '.join(paper.authors)}\n"
-            summary += f"Source: {paper.venue}\n"
-            summary += f"Web Link: {paper.url}\n"
-            summary += f"Abstract: {paper.abstract[:200]}...\n\n"
-        
-        return summary
+        if not RESEARCH_SCRAPER_AVAILABLE:
+            return "Paper summaries are not available."
+
+        if self.llm_manager is not None and self.llm_manager.get_current_llm_info():
+            try:
+                if self._summarizer is None:
+                    self._summarizer = PaperSummarizer(
+                        self.llm_manager, grouper=self._paper_topics if SCIPY_AVAILABLE else None
+                    )
+                summary = self._summarizer.summarize(papers)
+                self.logger.info(f"Summarized {len(papers)} papers "
+                                 f"({summary.llm_calls} LLM calls, {summary.cache_hits} cached)")
+                return summary.to_text()
+            except Exception as e:
+                self.logger.error(f"Error summarizing papers: {e}")
+
+        return extractive_summary(papers, grouper=self._paper_topics if SCIPY_AVAILABLE else None)
 
     def close(self):
         """
@@ -198,3 +780,11 @@ class PaperAgent:
         """
         if self.research_scraper:
             self.research_scraper.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
+        if self.library is not None:
+            self.library.close()
+        if self._summarizer is not None:
+            self._summarizer.cache.close()
+        if self._doi_resolver is not None:
+            self._doi_resolver.close()
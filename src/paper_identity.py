@@ -0,0 +1,253 @@
+import re
+import unicodedata
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+# Large prime for the universal hash family used by MinHash
+MERSENNE_PRIME = (1 << 31) - 1
+
+PLACEHOLDER_ABSTRACTS = {'', 'No abstract available'}
+PLACEHOLDER_AUTHORS = {'unknown author', 'unknown'}
+
+ARXIV_ID_PATTERN = re.compile(r'(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[a-z]{2})?/\d{7})(?:v\d+)?', re.IGNORECASE)
+DOI_PREFIX_PATTERN = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:)', re.IGNORECASE)
+VERSION_SUFFIX_PATTERN = re.compile(r'\s+\(?v\d+\)?$')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """
+    Canonical lower-case DOI without resolver prefixes
+    """
+    if not doi:
+        return None
+    doi = DOI_PREFIX_PATTERN.sub('', doi.strip()).lower()
+    return doi or None
+
+def normalize_arxiv_id(value: Optional[str]) -> Optional[str]:
+    """
+    Extract a version-less arXiv identifier from an id or arXiv URL
+    """
+    if not value:
+        return None
+    value = value.strip()
+    # Only search inside strings that are clearly arXiv URLs or arXiv:... ids
+    if 'arxiv' in value.lower():
+        match = ARXIV_ID_PATTERN.search(value)
+    else:
+        match = ARXIV_ID_PATTERN.fullmatch(value)
+    return match.group(1).lower() if match else None
+
+def _fold(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+
+def normalize_title(title: str) -> str:
+    """
+    Lower-case, accent- and punctuation-free title with any trailing version
+    marker such as "v2" removed
+    """
+    title = NON_WORD_PATTERN.sub(' ', _fold(title or ''))
+    title = ' '.join(title.split())
+    return VERSION_SUFFIX_PATTERN.sub('', title)
+
+def author_surname(name: str) -> str:
+    """
+    Surname from "Smith, J." or "John Smith" forms
+    """
+    name = _fold(name).strip()
+    if ',' in name:
+        name = name.split(',', 1)[0]
+    else:
+        parts = name.split()
+        name = parts[-1] if parts else ''
+    return NON_WORD_PATTERN.sub('', name)
+
+def paper_surnames(paper: Any) -> FrozenSet[str]:
+    return frozenset(
+        surname for surname in (author_surname(author) for author in (paper.authors or [])
+                                if author.strip().lower() not in PLACEHOLDER_AUTHORS)
+        if surname
+    )
+
+def paper_doi(paper: Any) -> Optional[str]:
+    return normalize_doi(getattr(paper, 'doi', None))
+
+def paper_arxiv_id(paper: Any) -> Optional[str]:
+    return normalize_arxiv_id(getattr(paper, 'arxiv_id', None)) or normalize_arxiv_id(getattr(paper, 'url', None))
+
+def merge_paper(target: Any, other: Any) -> bool:
+    """
+    Fill fields missing from ``target`` with values from a duplicate record,
+    returning whether anything was filled in
+    """
+    changed = False
+    for attr in ('doi', 'arxiv_id'):
+        if hasattr(target, attr) and not getattr(target, attr) and getattr(other, attr, None):
+            setattr(target, attr, getattr(other, attr))
+            changed = True
+    if (target.abstract or '') in PLACEHOLDER_ABSTRACTS and (other.abstract or '') not in PLACEHOLDER_ABSTRACTS:
+        target.abstract = other.abstract
+        changed = True
+    if not target.publication_date and other.publication_date:
+        target.publication_date = other.publication_date
+        changed = True
+    if not target.url and other.url:
+        target.url = other.url
+        changed = True
+    if not paper_surnames(target) and paper_surnames(other):
+        target.authors = list(other.authors)
+        changed = True
+    return changed
+
+class PaperIdentityIndex:
+    """
+    Incremental identity resolution for papers from multiple sources.
+
+    A paper is matched to an existing cluster by DOI, then arXiv id, then
+    normalized title, and finally by MinHash/LSH similarity over title
+    character shingles and author surnames. Title and fuzzy matches are
+    rejected when the records carry conflicting identifiers or share no
+    author, so distinct papers with the same title stay apart. Each lookup
+    only inspects the LSH buckets the paper hashes to, so building the index
+    is near-linear in the number of papers. ``enriched`` counts the
+    duplicates that filled in fields of a record already indexed.
+    """
+    def __init__(self,
+                 num_perm: int = 48,
+                 bands: int = 12,
+                 threshold: float = 0.7,
+                 max_candidates: int = 32,
+                 seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.enriched = 0
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.int64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.int64)
+
+        # One representative record per cluster
+        self.clusters: List[Any] = []
+        self._dois: List[Optional[str]] = []
+        self._arxiv_ids: List[Optional[str]] = []
+        self._surnames: List[FrozenSet[str]] = []
+        self._signatures = np.zeros((0, num_perm), dtype=np.uint32)
+
+        self._by_doi: Dict[str, int] = {}
+        self._by_arxiv_id: Dict[str, int] = {}
+        self._by_title: Dict[str, List[int]] = {}
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def signature(self, title: str, surnames: FrozenSet[str]) -> np.ndarray:
+        """
+        MinHash signature of a normalized title and author surnames
+        """
+        padded = f"  {title}  "
+        shingles = {padded[i:i + 3] for i in range(len(padded) - 2)}
+        shingles.update(f"@{surname}" for surname in surnames)
+        # The index lives in memory only, so the per-process string hash is stable enough
+        hashes = np.array([hash(shingle) & MERSENNE_PRIME for shingle in shingles], dtype=np.int64)
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _compatible(self, cluster_id: int, doi: Optional[str], arxiv_id: Optional[str],
+                    surnames: FrozenSet[str]) -> bool:
+        if doi and self._dois[cluster_id] and doi != self._dois[cluster_id]:
+            return False
+        if arxiv_id and self._arxiv_ids[cluster_id] and arxiv_id != self._arxiv_ids[cluster_id]:
+            return False
+        other = self._surnames[cluster_id]
+        return not surnames or not other or bool(surnames & other)
+
+    def _match(self, doi, arxiv_id, title, surnames, signature, band_keys) -> Optional[int]:
+        if doi and doi in self._by_doi:
+            return self._by_doi[doi]
+        if arxiv_id and arxiv_id in self._by_arxiv_id:
+            return self._by_arxiv_id[arxiv_id]
+
+        for cluster_id in self._by_title.get(title, ()):
+            if self._compatible(cluster_id, doi, arxiv_id, surnames):
+                return cluster_id
+
+        checked = set()
+        for band, key in enumerate(band_keys):
+            for cluster_id in self._buckets[band].get(key, ())[-self.max_candidates:]:
+                if cluster_id in checked:
+                    continue
+                checked.add(cluster_id)
+                similarity = float(np.mean(self._signatures[cluster_id] == signature))
+                if similarity >= self.threshold and self._compatible(cluster_id, doi, arxiv_id, surnames):
+                    return cluster_id
+        return None
+
+    def match(self, paper: Any) -> Optional[int]:
+        """
+        Cluster id of an already indexed record for the same paper, or None
+        """
+        title = normalize_title(paper.title)
+        surnames = paper_surnames(paper)
+        signature = self.signature(title, surnames)
+        return self._match(paper_doi(paper), paper_arxiv_id(paper), title, surnames,
+                           signature, self._band_keys(signature))
+
+    def add(self, paper: Any) -> Tuple[int, bool]:
+        """
+        Index a paper, merging it into an existing cluster when it is a
+        duplicate. Returns the cluster id and whether the cluster is new.
+        """
+        doi = paper_doi(paper)
+        arxiv_id = paper_arxiv_id(paper)
+        title = normalize_title(paper.title)
+        surnames = paper_surnames(paper)
+        signature = self.signature(title, surnames)
+        band_keys = self._band_keys(signature)
+
+        cluster_id = self._match(doi, arxiv_id, title, surnames, signature, band_keys)
+        if cluster_id is not None:
+            if merge_paper(self.clusters[cluster_id], paper):
+                self.enriched += 1
+            # Learn identifiers the duplicate contributed
+            if doi and not self._dois[cluster_id]:
+                self._dois[cluster_id] = doi
+                self._by_doi[doi] = cluster_id
+            if arxiv_id and not self._arxiv_ids[cluster_id]:
+                self._arxiv_ids[cluster_id] = arxiv_id
+                self._by_arxiv_id[arxiv_id] = cluster_id
+            if not self._surnames[cluster_id]:
+                self._surnames[cluster_id] = surnames
+            return cluster_id, False
+
+        cluster_id = len(self.clusters)
+        self.clusters.append(paper)
+        self._dois.append(doi)
+        self._arxiv_ids.append(arxiv_id)
+        self._surnames.append(surnames)
+
+        if cluster_id >= len(self._signatures):
+            grown = np.zeros((max(1024, 2 * len(self._signatures)), self.num_perm), dtype=np.uint32)
+            grown[:len(self._signatures)] = self._signatures
+            self._signatures = grown
+        self._signatures[cluster_id] = signature
+
+        if doi:
+            self._by_doi[doi] = cluster_id
+        if arxiv_id:
+            self._by_arxiv_id[arxiv_id] = cluster_id
+        self._by_title.setdefault(title, []).append(cluster_id)
+        for band, key in enumerate(band_keys):
+            self._buckets[band].setdefault(key, []).append(cluster_id)
+        return cluster_id, True
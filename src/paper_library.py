@@ -0,0 +1,387 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.dates import DATE_UNKNOWN, MAX_PERIOD_DAYS, parse_date, parse_dates, period_ends, range_bound
+from src.paper_identity import merge_paper, normalize_title, paper_arxiv_id, paper_doi, paper_surnames
+from src.research_scraper import ResearchPaper
+
+DEFAULT_LIBRARY_PATH = os.path.join(project_root, 'library', 'papers.sqlite3')
+
+PAPER_FIELDS = ('title', 'authors', 'abstract', 'url', 'publication_date', 'source', 'doi', 'arxiv_id')
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS papers ("
+    " id INTEGER PRIMARY KEY,"
+    " title TEXT NOT NULL,"
+    " authors TEXT NOT NULL,"
+    " abstract TEXT,"
+    " url TEXT,"
+    " publication_date TEXT,"
+    " pub_day INTEGER,"
+    " pub_end INTEGER,"
+    " pub_precision INTEGER NOT NULL DEFAULT 0,"
+    " source TEXT,"
+    " doi TEXT,"
+    " arxiv_id TEXT,"
+    " doi_key TEXT,"
+    " arxiv_key TEXT,"
+    " title_key TEXT NOT NULL,"
+    " surnames TEXT NOT NULL,"
+    " added_at REAL NOT NULL,"
+    " updated_at REAL NOT NULL)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS papers_doi ON papers (doi_key) WHERE doi_key IS NOT NULL",
+    "CREATE UNIQUE INDEX IF NOT EXISTS papers_arxiv ON papers (arxiv_key) WHERE arxiv_key IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS papers_title ON papers (title_key)",
+    "CREATE INDEX IF NOT EXISTS papers_pub_day ON papers (pub_day) WHERE pub_day IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS papers_updated ON papers (updated_at)",
+    # External-content index: the text lives once, in papers
+    "CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5("
+    " title, abstract, authors, content='papers', content_rowid='id',"
+    " tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN"
+    " INSERT INTO papers_fts (rowid, title, abstract, authors)"
+    " VALUES (new.id, new.title, new.abstract, new.authors); END",
+    "CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN"
+    " INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors)"
+    " VALUES ('delete', old.id, old.title, old.abstract, old.authors); END",
+    "CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE OF title, abstract, authors ON papers BEGIN"
+    " INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors)"
+    " VALUES ('delete', old.id, old.title, old.abstract, old.authors);"
+    " INSERT INTO papers_fts (rowid, title, abstract, authors)"
+    " VALUES (new.id, new.title, new.abstract, new.authors); END",
+)
+
+SELECT_PAPER = "SELECT id, title, authors, abstract, url, publication_date, source, doi, arxiv_id FROM papers"
+
+# Normalized publication date columns, added to libraries created before them
+DATE_COLUMNS = (('pub_day', 'INTEGER'), ('pub_end', 'INTEGER'), ('pub_precision', 'INTEGER NOT NULL DEFAULT 0'))
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+def fts_query(text: str) -> str:
+    """
+    FTS5 query matching every word of free text, the last one as a prefix
+    """
+    tokens = TOKEN_PATTERN.findall(text)
+    if not tokens:
+        return ''
+    return ' '.join([_quote(token) for token in tokens[:-1]] + [_quote(tokens[-1]) + '*'])
+
+def fts_keyword_query(keywords: Iterable[str], columns: Tuple[str, ...] = ('title', 'abstract')) -> str:
+    """
+    FTS5 query matching any keyword (multi-word keywords as phrases) in the
+    given columns
+    """
+    phrases = []
+    for keyword in keywords:
+        tokens = TOKEN_PATTERN.findall(keyword)
+        if tokens:
+            phrases.append(_quote(' '.join(tokens)) + '*')
+    if not phrases:
+        return ''
+    return '{' + ' '.join(columns) + '} : (' + ' OR '.join(phrases) + ')'
+
+def _row_to_paper(row: tuple) -> Tuple[int, ResearchPaper]:
+    return row[0], ResearchPaper(
+        title=row[1],
+        authors=json.loads(row[2]),
+        abstract=row[3] or '',
+        url=row[4] or '',
+        publication_date=row[5],
+        source=row[6] or 'Unknown',
+        doi=row[7],
+        arxiv_id=row[8]
+    )
+
+def _date_columns(publication_date: Any) -> Tuple[Optional[int], Optional[int], int]:
+    # First and last epoch day of the publication date, and its precision
+    day, precision = parse_date(publication_date)
+    if precision == DATE_UNKNOWN:
+        return None, None, DATE_UNKNOWN
+    end = int(period_ends([day], [precision])[0])
+    return day, end, precision
+
+class PaperLibrary:
+    """
+    Persistent paper library in SQLite with an FTS5 index over title,
+    abstract and authors.
+
+    Papers are upserted by identity: a record with the same DOI or arXiv id,
+    or the same normalized title and at least one shared author, is merged
+    into the stored row instead of added again. Lookups return
+    ``(library_id, ResearchPaper)`` pairs. Publication dates are also
+    stored normalized, as the first and last epoch day they cover, with an
+    index for date-range queries.
+    """
+    def __init__(self, path: str = DEFAULT_LIBRARY_PATH):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA[0])
+        self._add_date_columns()
+        for statement in SCHEMA[1:]:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def _add_date_columns(self) -> None:
+        # Libraries created before the normalized date columns get them, filled in
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(papers)")}
+        missing = [(name, definition) for name, definition in DATE_COLUMNS if name not in columns]
+        if not missing:
+            return
+        for name, definition in missing:
+            self._conn.execute(f"ALTER TABLE papers ADD COLUMN {name} {definition}")
+        rows = self._conn.execute(
+            "SELECT id, publication_date FROM papers WHERE publication_date IS NOT NULL").fetchall()
+        if rows:
+            days, precisions = parse_dates(publication_date for _, publication_date in rows)
+            ends = period_ends(days, precisions)
+            self._conn.executemany(
+                "UPDATE papers SET pub_day = ?, pub_end = ?, pub_precision = ? WHERE id = ?",
+                [(int(day), int(end), int(precision), paper_id)
+                 for (paper_id, _), day, end, precision in zip(rows, days, ends, precisions)
+                 if precision != DATE_UNKNOWN]
+            )
+        self.logger.info(f"Added normalized publication dates to {len(rows)} library papers")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def _find(self, doi_key: Optional[str], arxiv_key: Optional[str], title_key: str,
+              surnames: frozenset) -> Optional[int]:
+        # Called with the lock held
+        if doi_key:
+            row = self._conn.execute("SELECT id FROM papers WHERE doi_key = ?", (doi_key,)).fetchone()
+            if row:
+                return row[0]
+        if arxiv_key:
+            row = self._conn.execute("SELECT id FROM papers WHERE arxiv_key = ?", (arxiv_key,)).fetchone()
+            if row:
+                return row[0]
+        for paper_id, other_doi, other_arxiv, other_surnames in self._conn.execute(
+                "SELECT id, doi_key, arxiv_key, surnames FROM papers WHERE title_key = ?", (title_key,)):
+            if doi_key and other_doi and doi_key != other_doi:
+                continue
+            if arxiv_key and other_arxiv and arxiv_key != other_arxiv:
+                continue
+            other = frozenset(other_surnames.split())
+            if not surnames or not other or surnames & other:
+                return paper_id
+        return None
+
+    def upsert(self, papers: Iterable[ResearchPaper]) -> List[int]:
+        """
+        Insert or merge papers in one transaction, returning their library ids
+        """
+        ids = []
+        inserted = 0
+        now = time.time()
+        with self._lock, self._conn:
+            for paper in papers:
+                doi_key = paper_doi(paper)
+                arxiv_key = paper_arxiv_id(paper)
+                title_key = normalize_title(paper.title)
+                surnames = paper_surnames(paper)
+
+                paper_id = self._find(doi_key, arxiv_key, title_key, surnames)
+                if paper_id is None:
+                    paper_id = self._conn.execute(
+                        "INSERT INTO papers (title, authors, abstract, url, publication_date, pub_day, pub_end,"
+                        " pub_precision, source, doi, arxiv_id, doi_key, arxiv_key, title_key, surnames,"
+                        " added_at, updated_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (paper.title, json.dumps(list(paper.authors)), paper.abstract, paper.url,
+                         paper.publication_date, *_date_columns(paper.publication_date),
+                         paper.source, paper.doi, paper.arxiv_id,
+                         doi_key, arxiv_key, title_key, ' '.join(sorted(surnames)), now, now)
+                    ).lastrowid
+                    inserted += 1
+                else:
+                    self._merge(paper_id, paper)
+                ids.append(paper_id)
+        self.logger.info(f"Stored {len(ids)} papers in library ({inserted} new)")
+        return ids
+
+    def _merge(self, paper_id: int, paper: ResearchPaper) -> None:
+        # Called with the lock held, inside the upsert transaction
+        row = self._conn.execute(f"{SELECT_PAPER} WHERE id = ?", (paper_id,)).fetchone()
+        _, stored = _row_to_paper(row)
+        before = tuple(getattr(stored, name) for name in PAPER_FIELDS)
+        merge_paper(stored, paper)
+        if tuple(getattr(stored, name) for name in PAPER_FIELDS) == before:
+            return
+        doi_key = paper_doi(stored)
+        arxiv_key = paper_arxiv_id(stored)
+        # A key learned from the duplicate may already belong to another row
+        if doi_key and self._conn.execute("SELECT 1 FROM papers WHERE doi_key = ? AND id != ?",
+                                          (doi_key, paper_id)).fetchone():
+            doi_key = stored.doi = None
+        if arxiv_key and self._conn.execute("SELECT 1 FROM papers WHERE arxiv_key = ? AND id != ?",
+                                            (arxiv_key, paper_id)).fetchone():
+            arxiv_key = stored.arxiv_id = None
+        self._conn.execute(
+            "UPDATE papers SET authors = ?, abstract = ?, url = ?, publication_date = ?, pub_day = ?,"
+            " pub_end = ?, pub_precision = ?, doi = ?, arxiv_id = ?, doi_key = COALESCE(doi_key, ?),"
+            " arxiv_key = COALESCE(arxiv_key, ?), surnames = ?, updated_at = ? WHERE id = ?",
+            (json.dumps(list(stored.authors)), stored.abstract, stored.url, stored.publication_date,
+             *_date_columns(stored.publication_date), stored.doi, stored.arxiv_id, doi_key, arxiv_key,
+             ' '.join(sorted(paper_surnames(stored))), time.time(), paper_id)
+        )
+
+    def get(self, paper_id: int) -> Optional[ResearchPaper]:
+        with self._lock:
+            row = self._conn.execute(f"{SELECT_PAPER} WHERE id = ?", (paper_id,)).fetchone()
+        return _row_to_paper(row)[1] if row else None
+
+    def search(self, query: str, limit: int = 100, ranked: bool = True) -> List[Tuple[int, ResearchPaper]]:
+        """
+        Full-text search over title, abstract and authors. Ranked results are
+        ordered by BM25; unranked ones newest first, which stays fast for
+        very common terms.
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        order = "papers_fts.rank" if ranked else "papers_fts.rowid DESC"
+        return self._match(match, order, limit)
+
+    def filter(self, keywords: List[str], limit: Optional[int] = None) -> List[Tuple[int, ResearchPaper]]:
+        """
+        Papers whose title or abstract contains any of the keywords
+        (matched as word prefixes), newest first
+        """
+        match = fts_keyword_query(keywords)
+        if not match:
+            return []
+        return self._match(match, "papers_fts.rowid DESC", limit)
+
+    def _match(self, match: str, order: str, limit: Optional[int]) -> List[Tuple[int, ResearchPaper]]:
+        sql = (
+            "SELECT p.id, p.title, p.authors, p.abstract, p.url, p.publication_date, p.source, p.doi, p.arxiv_id"
+            " FROM papers_fts JOIN papers p ON p.id = papers_fts.rowid"
+            f" WHERE papers_fts MATCH ? ORDER BY {order} LIMIT ?"
+        )
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, (match, -1 if limit is None else limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            self.logger.error(f"Library search failed for {match!r}: {e}")
+            return []
+        return [_row_to_paper(row) for row in rows]
+
+    def published_between(self, start: Any = None, end: Any = None, overlap: bool = False,
+                          limit: Optional[int] = None) -> List[Tuple[int, ResearchPaper]]:
+        """
+        Papers published from ``start`` through ``end`` (dates in any
+        parseable form, or epoch days; either may be None), oldest first,
+        found through the publication date index. An end such as "2023"
+        includes its whole year; with ``overlap`` a paper dated only by year
+        or month counts when any part of that period is in the range.
+        """
+        start_day = range_bound(start)
+        end_day = range_bound(end, end=True)
+        conditions, params = ["pub_day IS NOT NULL"], []
+        if start_day is not None:
+            if overlap:
+                # Only dates starting up to a year earlier can reach into the range
+                conditions.append("pub_day >= ? AND pub_end >= ?")
+                params += [start_day - MAX_PERIOD_DAYS, start_day]
+            else:
+                conditions.append("pub_day >= ?")
+                params.append(start_day)
+        if end_day is not None:
+            conditions.append("pub_day <= ?")
+            params.append(end_day)
+        with self._lock:
+            rows = self._conn.execute(
+                f"{SELECT_PAPER} WHERE {' AND '.join(conditions)} ORDER BY pub_day, id LIMIT ?",
+                params + [-1 if limit is None else limit]
+            ).fetchall()
+        return [_row_to_paper(row) for row in rows]
+
+    def recent(self, limit: int = 500, offset: int = 0) -> List[Tuple[int, ResearchPaper]]:
+        """
+        Most recently added papers
+        """
+        with self._lock:
+            rows = self._conn.execute(f"{SELECT_PAPER} ORDER BY id DESC LIMIT ? OFFSET ?",
+                                      (limit, offset)).fetchall()
+        return [_row_to_paper(row) for row in rows]
+
+    def all(self) -> List[Tuple[int, ResearchPaper]]:
+        """
+        Every paper in the library, oldest first
+        """
+        with self._lock:
+            rows = self._conn.execute(f"{SELECT_PAPER} ORDER BY id").fetchall()
+        return [_row_to_paper(row) for row in rows]
+
+    def iter_papers(self, batch_size: int = 5000, after_id: int = 0) -> Iterator[Tuple[int, ResearchPaper]]:
+        """
+        Every paper in the library (or only those added after ``after_id``),
+        oldest first, fetched ``batch_size`` at a time so the whole library
+        is never held in memory
+        """
+        last_id = after_id
+        while True:
+            with self._lock:
+                rows = self._conn.execute(f"{SELECT_PAPER} WHERE id > ? ORDER BY id LIMIT ?",
+                                          (last_id, batch_size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_paper(row)
+            last_id = rows[-1][0]
+
+    def updated_since(self, updated_at: float, through_id: Optional[int] = None) -> List[Tuple[int, ResearchPaper]]:
+        """
+        Papers added or merged after ``updated_at`` (the last part of a
+        ``revision``), optionally only those with ids up to ``through_id``
+        """
+        sql, params = f"{SELECT_PAPER} WHERE updated_at > ?", [updated_at]
+        if through_id is not None:
+            sql += " AND id <= ?"
+            params.append(through_id)
+        with self._lock:
+            rows = self._conn.execute(f"{sql} ORDER BY id", params).fetchall()
+        return [_row_to_paper(row) for row in rows]
+
+    def revision(self) -> Tuple[int, int, float]:
+        """
+        Changes whenever papers are added, merged or deleted, for callers
+        that cache work derived from the library
+        """
+        with self._lock:
+            count, last_id, updated = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(id), 0), COALESCE(MAX(updated_at), 0) FROM papers"
+            ).fetchone()
+        return count, last_id, updated
+
+    def delete(self, paper_ids: Iterable[int]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM papers WHERE id = ?", [(paper_id,) for paper_id in paper_ids])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,282 @@
+import os
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.dates import DATE_UNKNOWN, NO_DAY, DateIndex, parse_date
+from src.research_scraper import ResearchPaper
+
+# Free-text fields kept in the shared text buffer, in storage order
+TEXT_FIELDS = ('title', 'abstract', 'url', 'doi', 'arxiv_id')
+
+class StringPool:
+    """
+    Interns repeated strings as small integer ids; id 0 stands for None
+    """
+    def __init__(self):
+        self.strings: List[Optional[str]] = [None]
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+class PaperRow:
+    """
+    Read-only view of one stored paper; fields are decoded on access
+    """
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: 'PaperStore', index: int):
+        self._store = store
+        self._index = index
+
+    def _text(self, field_number: int) -> str:
+        return self._store._text(self._index, field_number)
+
+    @property
+    def title(self) -> str:
+        return self._text(0)
+
+    @property
+    def abstract(self) -> str:
+        return self._text(1)
+
+    @property
+    def url(self) -> str:
+        return self._text(2)
+
+    @property
+    def doi(self) -> Optional[str]:
+        return self._text(3) or None
+
+    @property
+    def arxiv_id(self) -> Optional[str]:
+        return self._text(4) or None
+
+    @property
+    def authors(self) -> List[str]:
+        store = self._store
+        start = store._author_offsets[self._index]
+        end = store._author_offsets[self._index + 1]
+        names = store.authors.strings
+        return [names[author_id] for author_id in store._author_ids[start:end]]
+
+    @property
+    def publication_date(self) -> Optional[str]:
+        return self._store.dates.strings[self._store._date_ids[self._index]]
+
+    @property
+    def source(self) -> str:
+        return self._store.sources.strings[self._store._source_ids[self._index]] or 'Unknown'
+
+    @property
+    def venue(self) -> Optional[str]:
+        return self._store.venues.strings[self._store._venue_ids[self._index]]
+
+    def to_paper(self) -> ResearchPaper:
+        """
+        A full ResearchPaper copy of this row
+        """
+        return ResearchPaper(
+            title=self.title,
+            authors=self.authors,
+            abstract=self.abstract,
+            url=self.url,
+            publication_date=self.publication_date,
+            source=self.source,
+            doi=self.doi,
+            arxiv_id=self.arxiv_id
+        )
+
+    def __repr__(self) -> str:
+        return f"PaperRow({self._index}, title={self.title!r})"
+
+class PaperStore:
+    """
+    Append-only columnar store for large paper collections.
+
+    Free text (title, abstract, URL, DOI, arXiv id) is UTF-8 encoded into a
+    shared text buffer addressed by per-paper end offsets; author names,
+    dates, sources and venues are interned once and stored as integer ids
+    in typed arrays. The text buffer is split into blocks of ``block_size``
+    papers and every full block is zlib-compressed, which is where most of
+    the saving comes from since abstracts dominate a paper's size. Papers
+    are read back through ``PaperRow`` views, which decode only the fields
+    that are touched, or copied out with ``to_paper``; the last few
+    decompressed blocks are cached, so iterating in order decompresses each
+    block once. Dates are parsed once per distinct string into epoch days
+    with a precision flag, and a sorted ``DateIndex`` over them answers
+    date-range queries.
+    """
+    def __init__(self,
+                 papers: Optional[Iterable[Any]] = None,
+                 block_size: int = 64,
+                 compress: bool = True,
+                 cache_blocks: int = 4):
+        self.block_size = block_size
+        self.compress = compress
+        self.cache_blocks = cache_blocks
+
+        self.authors = StringPool()
+        self.dates = StringPool()
+        self.sources = StringPool()
+        self.venues = StringPool()
+
+        # Sealed blocks, plus the block still being filled
+        self._blocks: List[bytes] = []
+        self._text_buffer = bytearray()
+        self._block_cache: Dict[int, bytes] = {}
+        # End of each text field, relative to the start of its block
+        self._text_ends = array('I')
+        self._author_ids = array('I')
+        self._author_offsets = array('Q', [0])
+        self._date_ids = array('I')
+        self._source_ids = array('I')
+        self._venue_ids = array('I')
+        # Normalized date of each interned date string, by pool id
+        self._pool_days = array('i', [NO_DAY])
+        self._pool_precisions = array('b', [DATE_UNKNOWN])
+        self._date_index: Optional[DateIndex] = None
+
+        if papers is not None:
+            self.extend(papers)
+
+    def __len__(self) -> int:
+        return len(self._date_ids)
+
+    def append(self, paper: Any) -> int:
+        """
+        Store a paper (any object with ResearchPaper's fields) and return its
+        row index
+        """
+        # Encode and intern everything first, so a bad paper leaves every
+        # column as it was
+        texts = [(getattr(paper, field, None) or '').encode('utf-8') for field in TEXT_FIELDS]
+        intern = self.authors.intern
+        author_ids = [intern(author) for author in paper.authors or ()]
+        date = paper.publication_date
+        if date is not None and date not in self.dates._ids:
+            day, precision = parse_date(date)
+            self._pool_days.append(day)
+            self._pool_precisions.append(precision)
+        date_id = self.dates.intern(date)
+        source_id = self.sources.intern(getattr(paper, 'source', None))
+        venue_id = self.venues.intern(getattr(paper, 'venue', None) or None)
+
+        ends = self._text_ends
+        buffer = self._text_buffer
+        for text in texts:
+            buffer += text
+            ends.append(len(buffer))
+        self._author_ids.extend(author_ids)
+        self._author_offsets.append(len(self._author_ids))
+        self._date_ids.append(date_id)
+        self._date_index = None
+        self._source_ids.append(source_id)
+        self._venue_ids.append(venue_id)
+
+        if len(self) % self.block_size == 0:
+            self._seal_block()
+        return len(self) - 1
+
+    def _seal_block(self) -> None:
+        text = bytes(self._text_buffer)
+        self._blocks.append(zlib.compress(text) if self.compress else text)
+        self._text_buffer = bytearray()
+
+    def extend(self, papers: Iterable[Any]) -> None:
+        for paper in papers:
+            self.append(paper)
+
+    def _block(self, block: int) -> bytes:
+        if block == len(self._blocks):
+            return self._text_buffer
+        if not self.compress:
+            return self._blocks[block]
+        text = self._block_cache.get(block)
+        if text is None:
+            text = zlib.decompress(self._blocks[block])
+            if len(self._block_cache) >= self.cache_blocks:
+                self._block_cache.clear()
+            self._block_cache[block] = text
+        return text
+
+    def _text(self, index: int, field_number: int) -> str:
+        position = index * len(TEXT_FIELDS) + field_number
+        # Offsets restart at zero with every block
+        start = self._text_ends[position - 1] if position % (self.block_size * len(TEXT_FIELDS)) else 0
+        text = self._block(index // self.block_size)
+        return text[start:self._text_ends[position]].decode('utf-8')
+
+    def __getitem__(self, index: int) -> PaperRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("paper index out of range")
+        return PaperRow(self, index)
+
+    def __iter__(self) -> Iterator[PaperRow]:
+        for index in range(len(self)):
+            yield PaperRow(self, index)
+
+    def source_ids(self) -> np.ndarray:
+        """
+        Interned source id of every paper, for vectorised filtering
+        """
+        return np.frombuffer(self._source_ids, dtype=np.uint32).copy()
+
+    def rows_from_source(self, source: str) -> List[PaperRow]:
+        source_id = self.sources._ids.get(source)
+        if source_id is None:
+            return []
+        return [PaperRow(self, int(index)) for index in np.flatnonzero(self.source_ids() == source_id)]
+
+    def publication_days(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Epoch day and precision of every paper's publication date
+        """
+        date_ids = np.frombuffer(self._date_ids, dtype=np.uint32)
+        return (np.frombuffer(self._pool_days, dtype=np.int32)[date_ids],
+                np.frombuffer(self._pool_precisions, dtype=np.int8)[date_ids])
+
+    def date_index(self) -> DateIndex:
+        """
+        Sorted date index over the stored papers, rebuilt after appends
+        """
+        if self._date_index is None:
+            self._date_index = DateIndex(*self.publication_days())
+        return self._date_index
+
+    def rows_between(self, start: Any = None, end: Any = None, overlap: bool = False) -> List[PaperRow]:
+        """
+        Papers published from ``start`` through ``end``, oldest first; see
+        ``DateIndex.between``
+        """
+        return [PaperRow(self, int(index)) for index in self.date_index().between(start, end, overlap)]
+
+    def memory_usage(self) -> int:
+        """
+        Approximate bytes held by the columns and string pools
+        """
+        columns = (self._text_ends, self._author_ids, self._author_offsets,
+                   self._date_ids, self._source_ids, self._venue_ids, self._pool_days, self._pool_precisions)
+        total = len(self._text_buffer) + sum(map(len, self._blocks)) + sum(column.itemsize * len(column) for column in columns)
+        for pool in (self.authors, self.dates, self.sources, self.venues):
+            total += sum(sys.getsizeof(string) for string in pool.strings[1:])
+        return total
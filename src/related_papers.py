@@ -0,0 +1,206 @@
+import logging
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    logging.warning("scipy not available. Related paper recommendations will be disabled.")
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.keyword_index import tokenize
+
+class RelatedPapers:
+    """
+    "More like this" recommendations from TF-IDF cosine similarity.
+
+    Titles and abstracts are turned into an L2-normalised sparse TF-IDF
+    matrix (sublinear term frequency, smoothed IDF, title terms counted
+    ``title_weight`` times). Papers can be added or replaced after
+    construction: only those are tokenized again, and the weighting, which
+    every document frequency feeds into, is redone from the stored term
+    counts when the matrix is next needed. Neighbours of one paper come
+    from a single sparse row product and are cached; all-pairs neighbours
+    are computed ``block_size`` rows at a time as sparse products, so
+    memory stays at one block of similarities however large the corpus is.
+    Dropping very common terms with ``max_df`` (e.g. 0.1) makes those
+    blocks much sparser and all-pairs several times faster.
+    """
+    def __init__(self,
+                 papers: Sequence[Any],
+                 title_weight: int = 2,
+                 min_df: int = 1,
+                 max_df: float = 1.0,
+                 block_size: int = 256):
+        self.title_weight = title_weight
+        self.min_df = min_df
+        self.max_df = max_df
+        self.block_size = block_size
+        self.logger = logging.getLogger(__name__)
+        self.papers: List[Any] = []
+        self._vocabulary: Dict[str, int] = {}
+        # Term ids and counts of every paper
+        self._terms: List[np.ndarray] = []
+        self._counts: List[np.ndarray] = []
+        self._matrix = None
+        self._cache: Dict[int, List[Tuple[int, float]]] = {}
+        self._top_ids: Optional[np.ndarray] = None
+        self._top_scores: Optional[np.ndarray] = None
+        self.add(papers)
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    def _term_counts(self, paper: Any) -> Tuple[np.ndarray, np.ndarray]:
+        vocabulary = self._vocabulary
+        row: Dict[int, int] = {}
+        for token in tokenize(paper.title) * self.title_weight + tokenize(paper.abstract):
+            term = vocabulary.setdefault(token, len(vocabulary))
+            row[term] = row.get(term, 0) + 1
+        return np.fromiter(row, dtype=np.int32, count=len(row)), np.fromiter(row.values(), dtype=np.float32,
+                                                                              count=len(row))
+
+    def _changed(self) -> None:
+        self._matrix = None
+        self._cache.clear()
+        self._top_ids = self._top_scores = None
+
+    def add(self, papers: Iterable[Any]) -> None:
+        """
+        Add papers, giving each the next document id
+        """
+        for paper in papers:
+            terms, counts = self._term_counts(paper)
+            self.papers.append(paper)
+            self._terms.append(terms)
+            self._counts.append(counts)
+        self._changed()
+
+    def replace(self, doc_id: int, paper: Any) -> None:
+        """
+        Swap in a new version of a paper (e.g. one with its abstract filled in)
+        """
+        self.papers[doc_id] = paper
+        self._terms[doc_id], self._counts[doc_id] = self._term_counts(paper)
+        self._changed()
+
+    @property
+    def matrix(self):
+        if self._matrix is None:
+            self._matrix = self._tfidf()
+        return self._matrix
+
+    def _tfidf(self):
+        n_docs = len(self.papers)
+        lengths = np.fromiter((len(terms) for terms in self._terms), dtype=np.int64, count=n_docs)
+        indptr = np.zeros(n_docs + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        matrix = sp.csr_matrix(
+            (np.concatenate(self._counts) if n_docs else np.zeros(0, dtype=np.float32),
+             np.concatenate(self._terms) if n_docs else np.zeros(0, dtype=np.int32), indptr),
+            shape=(n_docs, len(self._vocabulary))
+        )
+        df = np.bincount(matrix.indices, minlength=len(self._vocabulary))
+        # Terms in too few or too many documents carry no signal for similarity
+        keep = (df >= self.min_df) & (df <= max(self.max_df * n_docs, self.min_df))
+        idf = np.log((1 + n_docs) / (1 + df)).astype(np.float32) + 1
+        idf[~keep] = 0
+
+        matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+        matrix.eliminate_zeros()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sp.csr_matrix(sp.diags(1 / norms).astype(np.float32) @ matrix)
+
+    def _top_k(self, similarities: np.ndarray, rows: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Row-wise top k of a dense block, excluding each row's own paper
+        similarities[np.arange(len(rows)), rows] = -1
+        k = min(k, similarities.shape[1] - 1)
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-scores, axis=1, kind='stable')
+        return np.take_along_axis(top, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+    def precompute(self, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top ``k`` neighbour ids and similarities for every paper, as two
+        N x k arrays; missing neighbours have id -1 and similarity 0
+        """
+        n_docs = len(self.papers)
+        top_ids = np.full((n_docs, k), -1, dtype=np.int32)
+        top_scores = np.zeros((n_docs, k), dtype=np.float32)
+        transposed = self.matrix.T.tocsc()
+        for start in range(0, n_docs, self.block_size):
+            # Sparse block product: only papers sharing a term are scored
+            block = (self.matrix[start:start + self.block_size] @ transposed).tocsr()
+            for offset in range(block.shape[0]):
+                doc_id = start + offset
+                lo, hi = block.indptr[offset], block.indptr[offset + 1]
+                others = block.indices[lo:hi]
+                scores = block.data[lo:hi]
+                # A paper is never its own neighbour
+                keep = others != doc_id
+                others, scores = others[keep], scores[keep]
+                if len(scores) > k:
+                    best = np.argpartition(-scores, k - 1)[:k]
+                else:
+                    best = np.arange(len(scores))
+                best = best[np.argsort(-scores[best], kind='stable')]
+                top_ids[doc_id, :len(best)] = others[best]
+                top_scores[doc_id, :len(best)] = scores[best]
+        self._top_ids, self._top_scores = top_ids, top_scores
+        self._cache.clear()
+        return top_ids, top_scores
+
+    def neighbours(self, doc_id: int, k: int = 10) -> List[Tuple[int, float]]:
+        """
+        ``(doc_id, similarity)`` of the ``k`` papers most similar to one
+        paper, best first, leaving out papers with nothing in common
+        """
+        if self._top_ids is not None and k <= self._top_ids.shape[1]:
+            pairs = zip(self._top_ids[doc_id, :k].tolist(), self._top_scores[doc_id, :k].tolist())
+            return [(other, score) for other, score in pairs if score > 0]
+
+        cached = self._cache.get(doc_id)
+        if cached is None or len(cached) < k:
+            if len(self.papers) < 2:
+                return []
+            similarities = (self.matrix[doc_id] @ self.matrix.T).toarray()
+            top, scores = self._top_k(similarities, np.array([doc_id]), k)
+            cached = [(other, score) for other, score in zip(top[0].tolist(), scores[0].tolist()) if score > 0]
+            self._cache[doc_id] = cached
+        return cached[:k]
+
+    def related(self, doc_id: int, k: int = 10) -> List[Any]:
+        """
+        The ``k`` papers most similar to one paper
+        """
+        return [self.papers[other] for other, _ in self.neighbours(doc_id, k)]
+
+    def clusters(self, threshold: float = 0.3, k: int = 10) -> List[List[int]]:
+        """
+        Groups of papers linked by a top-``k`` similarity of at least
+        ``threshold``, largest first; papers similar to nothing are left out
+        """
+        if self._top_ids is None or self._top_ids.shape[1] < k:
+            self.precompute(k)
+        n_docs = len(self.papers)
+        sources, slots = np.nonzero(self._top_scores[:, :k] >= threshold)
+        graph = sp.csr_matrix(
+            (np.ones(len(sources), dtype=np.int8), (sources, self._top_ids[sources, slots])),
+            shape=(n_docs, n_docs)
+        )
+        _, labels = connected_components(graph, directed=False)
+        groups: Dict[int, List[int]] = {}
+        for doc_id, label in enumerate(labels.tolist()):
+            groups.setdefault(label, []).append(doc_id)
+        return sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
@@ -0,0 +1,194 @@
+import base64
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.http_cache import STORED_HEADERS, normalize_url
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """
+    Raised on replay when a request has no recorded interaction
+    """
+
+class Cassette:
+    """
+    Recorded HTTP and scholarly interactions stored as a JSON fixture file.
+
+    HTTP interactions are keyed on the normalized request URL; scholarly
+    searches on "scholarly:<query>". Each interaction keeps the latency that
+    was observed when it was recorded.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.http: Dict[str, List[Dict[str, Any]]] = {}
+        self.scholarly: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._cursors: Dict[str, int] = {}
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def load(self, path: str) -> None:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.http = data.get('http', {})
+        self.scholarly = data.get('scholarly', {})
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._lock:
+            data = {'http': self.http, 'scholarly': self.scholarly}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, default=str)
+        os.replace(tmp_path, path)
+
+    def add_http(self, url: str, status: int, headers: Dict[str, str], body: bytes, latency: float) -> None:
+        interaction = {
+            'status': status,
+            'headers': {k.lower(): v for k, v in headers.items() if k.lower() in STORED_HEADERS},
+            'body': base64.b64encode(body).decode('ascii'),
+            'latency': latency
+        }
+        with self._lock:
+            self.http.setdefault(normalize_url(url), []).append(interaction)
+
+    def find_http(self, url: str, strict: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Next recorded interaction for a URL. Repeated requests cycle through
+        the recordings. With ``strict`` off, a request whose exact key is
+        missing falls back to any recording for the same host and path.
+        """
+        key = normalize_url(url)
+        with self._lock:
+            interactions = self.http.get(key)
+            if interactions is None and not strict:
+                parts = urlsplit(key)
+                for recorded_key, recorded in self.http.items():
+                    recorded_parts = urlsplit(recorded_key)
+                    if (recorded_parts.netloc, recorded_parts.path) == (parts.netloc, parts.path):
+                        key, interactions = recorded_key, recorded
+                        break
+            if not interactions:
+                return None
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = position + 1
+            return interactions[position % len(interactions)]
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Transport adapter that forwards requests and records the responses
+    """
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        if request.method == 'GET':
+            self.cassette.add_http(request.url, response.status_code, response.headers,
+                                   response.content, time.perf_counter() - started)
+        return response
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter that answers GET requests from a cassette.
+
+    Responses are delayed by the recorded latency times ``latency_scale``,
+    or by a fixed synthetic ``latency`` when one is given.
+    """
+    def __init__(self, cassette: Cassette, latency: Optional[float] = None,
+                 latency_scale: float = 1.0, strict: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.strict = strict
+
+    def send(self, request, **kwargs):
+        interaction = self.cassette.find_http(request.url, strict=self.strict)
+        if interaction is None:
+            raise CassetteMissError(f"No recorded response for {request.url}", request=request)
+
+        delay = self.latency if self.latency is not None else interaction['latency'] * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = base64.b64decode(interaction['body'])
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+def recording_scholar_search(cassette: Cassette, search: Callable[..., Iterator]) -> Callable[..., Iterator]:
+    """
+    Wrap a scholarly search function so the results it yields are recorded
+    """
+    def _search(query: str, *args, **kwargs) -> Iterator:
+        started = time.perf_counter()
+        results = []
+        try:
+            for result in search(query, *args, **kwargs):
+                results.append(json.loads(json.dumps(dict(result), default=str)))
+                yield result
+        finally:
+            with cassette._lock:
+                cassette.scholarly[f"scholarly:{query}"] = {
+                    'results': results,
+                    'latency': time.perf_counter() - started
+                }
+    return _search
+
+def replay_scholar_search(cassette: Cassette, latency: Optional[float] = None,
+                          latency_scale: float = 1.0) -> Callable[..., Iterator]:
+    """
+    Replacement for scholarly.search_pubs that yields recorded results
+    """
+    def _search(query: str, *args, **kwargs) -> Iterator:
+        recorded = cassette.scholarly.get(f"scholarly:{query}")
+        if recorded is None:
+            raise CassetteMissError(f"No recorded scholarly results for {query!r}")
+        results = recorded['results']
+        total = latency if latency is not None else recorded['latency'] * latency_scale
+        # Spread the recorded latency over the results, as scholarly pages lazily
+        step = total / max(len(results), 1)
+        for result in results:
+            if step > 0:
+                time.sleep(step)
+            yield result
+    return _search
+
+def record_scraper(scraper, cassette: Cassette) -> None:
+    """
+    Route a ResearchScraper's traffic through recording transports
+    """
+    scraper.mount_transport(RecordingAdapter(cassette))
+    scraper.scholar_search = recording_scholar_search(cassette, scraper.scholar_search)
+
+def replay_scraper(scraper, cassette: Cassette, latency: Optional[float] = None,
+                   latency_scale: float = 1.0, strict: bool = True) -> None:
+    """
+    Serve a ResearchScraper entirely from a cassette, with no network access
+    """
+    scraper.mount_transport(ReplayAdapter(cassette, latency=latency, latency_scale=latency_scale, strict=strict))
+    scraper.scholar_search = replay_scholar_search(cassette, latency=latency, latency_scale=latency_scale)
+    logging.getLogger(__name__).info(f"Replaying scraper traffic from {cassette.path or 'in-memory cassette'}")
@@ -1,34 +1,34 @@
 import requests
-import arxiv
+from requests.adapters import HTTPAdapter
 from scholarly import scholarly
 import pandas as pd
 import logging
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import Iterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field, fields
 import os
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import asyncio
+import xml.etree.ElementTree as ET
+import numpy as np
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 
 # Add project root to path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
+from src.http_cache import HTTPCache, CachingAdapter
+from src.paper_identity import PaperIdentityIndex, normalize_arxiv_id
+from src.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError, default_registry
+from src.browser_pool import BrowserPool, SELENIUM_AVAILABLE, get_browser_pool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Optional WebDriver imports with error handling
-try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
-    from webdriver_manager.chrome import ChromeDriverManager
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.chrome.options import Options
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    SELENIUM_AVAILABLE = False
-    logging.warning("Selenium or WebDriver not available. Some web scraping features will be limited.")
+SEMANTIC_SCHOLAR_FIELDS = "title,authors,abstract,url,venue,year,externalIds"
 
 @dataclass
 class ResearchPaper:
@@ -41,193 +41,607 @@ class ResearchPaper:
     url: str
     publication_date: Optional[str] = None
     source: str = 'Unknown'
+    doi: Optional[str] = None
+    arxiv_id: Optional[str] = None
+
+def paper_from_semantic_scholar(paper_data: Dict) -> Optional[ResearchPaper]:
+    """
+    Build a ResearchPaper from one Semantic Scholar search hit, or None if it
+    lacks a title or authors
+    """
+    if not (paper_data.get('title') and paper_data.get('authors')):
+        return None
+    external_ids = paper_data.get('externalIds') or {}
+    return ResearchPaper(
+        title=paper_data.get('title', ''),
+        authors=[author.get('name', '') for author in paper_data.get('authors', [])],
+        abstract=paper_data.get('abstract') or 'No abstract available',
+        url=paper_data.get('url') or f"https://www.semanticscholar.org/paper/{paper_data.get('paperId', '')}",
+        # The full date where it was asked for (bulk search), the year otherwise
+        publication_date=paper_data.get('publicationDate') or str(paper_data.get('year') or ''),
+        source='Semantic Scholar',
+        doi=external_ids.get('DOI'),
+        arxiv_id=normalize_arxiv_id(external_ids.get('ArXiv'))
+    )
+
+ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom', 'arxiv': 'http://arxiv.org/schemas/atom'}
+
+def parse_arxiv_feed(feed_text: str) -> List[ResearchPaper]:
+    """
+    Parse an arXiv API Atom feed into ResearchPaper objects
+    """
+    papers = []
+    root = ET.fromstring(feed_text)
+    for entry in root.findall('atom:entry', ATOM_NS):
+        title = entry.findtext('atom:title', default='', namespaces=ATOM_NS)
+        if not title.strip():
+            continue
+
+        pdf_url = ''
+        for link in entry.findall('atom:link', ATOM_NS):
+            if link.get('title') == 'pdf':
+                pdf_url = link.get('href', '')
+                break
+
+        entry_id = entry.findtext('atom:id', default='', namespaces=ATOM_NS)
+        published = entry.findtext('atom:published', default='', namespaces=ATOM_NS)
+        try:
+            # Same form as str(arxiv.Result.published), as the arxiv client gives it
+            published = str(datetime.fromisoformat(published.replace('Z', '+00:00')))
+        except ValueError:
+            pass
+
+        papers.append(ResearchPaper(
+            title=' '.join(title.split()),
+            authors=[
+                author.findtext('atom:name', default='', namespaces=ATOM_NS)
+                for author in entry.findall('atom:author', ATOM_NS)
+            ],
+            abstract=entry.findtext('atom:summary', default='', namespaces=ATOM_NS).strip(),
+            url=pdf_url or entry_id,
+            publication_date=published,
+            source='arXiv',
+            doi=entry.findtext('arxiv:doi', default=None, namespaces=ATOM_NS),
+            arxiv_id=normalize_arxiv_id(entry_id)
+        ))
+    return papers
+
+@dataclass
+class SearchEvent:
+    """
+    Progress event emitted while a search streams results.
+
+    ``status`` is one of 'started', 'papers', 'completed', 'failed',
+    'timed_out' or 'skipped' (circuit open); 'papers' events carry only
+    papers not already yielded earlier in the same search, and ``enriched``
+    counts the papers yielded earlier that this batch's duplicates filled
+    in (DOI, abstract, ...). ``elapsed`` is seconds since the search started.
+    """
+    source: str
+    status: str
+    papers: List[ResearchPaper] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    enriched: int = 0
+
+@dataclass
+class SourceStatus:
+    """
+    How one source fared in a search: 'completed', 'failed', 'timed_out' or
+    'skipped'
+    """
+    source: str
+    status: str = 'started'
+    papers: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+@dataclass
+class SearchResult:
+    """
+    Papers found by a deadline-bounded search and per-source status
+    """
+    papers: List[ResearchPaper] = field(default_factory=list)
+    sources: Dict[str, SourceStatus] = field(default_factory=dict)
+
+    @property
+    def partial(self) -> bool:
+        """
+        True when at least one source did not complete
+        """
+        return any(status.status != 'completed' for status in self.sources.values())
+
+def _past(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.monotonic() >= deadline
+
+def _start_daemon(func, *args) -> Future:
+    # Run func on a daemon thread, so a source abandoned at its deadline
+    # never keeps the interpreter from exiting
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name="paper-source", daemon=True).start()
+    return future
+
+def _timeout(deadline: Optional[float], default: float) -> float:
+    # HTTP timeout bounded by what is left of a monotonic deadline
+    if deadline is None:
+        return default
+    return max(0.1, min(default, deadline - time.monotonic()))
+
+class PaperDeduplicator:
+    """
+    Incremental duplicate filter backed by a PaperIdentityIndex.
+
+    Duplicates are merged into the record that was returned first, so papers
+    already handed to the caller are enriched in place (DOI, abstract, ...);
+    ``enriched`` counts those of the last ``add``.
+    """
+    def __init__(self, index: Optional[PaperIdentityIndex] = None):
+        self.index = index or PaperIdentityIndex()
+        self.enriched = 0
+
+    def add(self, papers: List[ResearchPaper]) -> List[ResearchPaper]:
+        """
+        Return the papers not seen before, in order, and remember them
+        """
+        unique_papers = []
+        enriched = self.index.enriched
+        for paper in papers:
+            _, is_new = self.index.add(paper)
+            if is_new:
+                unique_papers.append(paper)
+        self.enriched = self.index.enriched - enriched
+        return unique_papers
+
+def deduplicate_papers(papers: List[ResearchPaper]) -> List[ResearchPaper]:
+    """
+    Remove duplicate papers by identity (DOI, arXiv id, normalized title or
+    near-duplicate title and authors), keeping and enriching the first
+    """
+    return PaperDeduplicator().add(papers)
+
+# DataFrame columns, in ResearchPaper field order
+PAPER_COLUMNS = [f.name for f in fields(ResearchPaper)]
+
+class PaperFrameBuilder:
+    """
+    Builds the to_dataframe frame column by column.
+
+    Papers are read straight into one list per column, with authors joined
+    and sources stored as categorical codes, instead of going through a
+    deep-copied dict per paper. Batches can be added as they arrive and the
+    frame is materialized once by ``build``.
+    """
+    def __init__(self):
+        self._columns: Dict[str, List] = {name: [] for name in PAPER_COLUMNS if name != 'source'}
+        self._source_codes: List[int] = []
+        self._sources: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._source_codes)
+
+    def add(self, papers: List[ResearchPaper]) -> None:
+        columns = self._columns
+        columns['title'].extend([paper.title for paper in papers])
+        columns['authors'].extend([', '.join(paper.authors) for paper in papers])
+        columns['abstract'].extend([paper.abstract for paper in papers])
+        columns['url'].extend([paper.url for paper in papers])
+        columns['publication_date'].extend([paper.publication_date for paper in papers])
+        columns['doi'].extend([paper.doi for paper in papers])
+        columns['arxiv_id'].extend([paper.arxiv_id for paper in papers])
+        sources = self._sources
+        self._source_codes.extend([sources.setdefault(paper.source, len(sources)) for paper in papers])
+
+    def build(self) -> pd.DataFrame:
+        """
+        DataFrame of every paper added so far, with a categorical source column
+        """
+        data = dict(self._columns)
+        data['source'] = pd.Categorical.from_codes(
+            np.asarray(self._source_codes, dtype=np.int32), categories=list(self._sources)
+        )
+        return pd.DataFrame(data, columns=PAPER_COLUMNS)
+
+    def clear(self) -> None:
+        for values in self._columns.values():
+            values.clear()
+        self._source_codes.clear()
+        self._sources.clear()
+
+def append_papers_to_frame(frame: Optional[pd.DataFrame], papers: List[ResearchPaper]) -> pd.DataFrame:
+    """
+    Append a batch of papers to a frame built by PaperFrameBuilder, merging
+    the categories of the source column
+    """
+    builder = PaperFrameBuilder()
+    builder.add(papers)
+    batch = builder.build()
+    if frame is None or frame.empty:
+        return batch
+    combined = pd.concat([frame, batch], ignore_index=True)
+    combined['source'] = pd.api.types.union_categoricals(
+        [frame['source'].astype('category'), batch['source']], ignore_order=True
+    )
+    return combined
 
 class ResearchScraper:
     """
     A class to scrape research papers from multiple academic sources
     """
-    def __init__(self, max_results: int = 10):
+    arxiv_url = "http://export.arxiv.org/api/query"
+    semantic_scholar_url = "https://api.semanticscholar.org/graph/v1/paper/search"
+    semantic_scholar_bulk_url = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
+
+    # Longest wait for a pooled browser when no search deadline applies
+    browser_timeout = 30.0
+
+    def __init__(self, max_results: int = 10, pool_size: int = 10, cache: Optional[HTTPCache] = None,
+                 browser_pool: Optional[BrowserPool] = None, search_deadline: Optional[float] = 30.0,
+                 breakers: Optional[CircuitBreakerRegistry] = None):
         self.max_results = max_results
+        # Circuit breakers are shared process-wide unless a registry is given
+        self.breakers = breakers or default_registry
+        self.cache = cache
+        self.search_deadline = search_deadline
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
+
+        # Pooled keep-alive HTTP session so repeated searches reuse connections
+        self.session = requests.Session()
+        self._mount_adapters(self.session, pool_size)
+
+        # Google Scholar search function; swapped out by the replay layer
+        self.scholar_search = scholarly.search_pubs
         
-        # WebDriver initialization with fallback
-        self.driver = None
-        if SELENIUM_AVAILABLE:
+        # Headless browsers come from a shared pool and are only launched on first use
+        self._browser_pool = browser_pool
+        self._driver = None
+
+    @property
+    def browser_pool(self) -> BrowserPool:
+        if self._browser_pool is None:
+            self._browser_pool = get_browser_pool()
+        return self._browser_pool
+
+    @property
+    def driver(self):
+        """
+        WebDriver checked out from the browser pool on first access, or None
+        if no browser can be had within ``browser_timeout``
+        """
+        if self._driver is None and SELENIUM_AVAILABLE:
             try:
-                # Setup Chrome options for headless browsing
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                
-                # Initialize WebDriver
-                self.driver = webdriver.Chrome(
-                    service=Service(ChromeDriverManager().install()), 
-                    options=chrome_options
-                )
+                self.get_driver()
             except Exception as e:
                 self.logger.error(f"Could not initialize WebDriver: {e}")
-                self.driver = None
+        return self._driver
 
-    def scrape_arxiv(self, query: str) -> List[ResearchPaper]:
+    def get_driver(self, deadline: Optional[float] = None):
+        """
+        WebDriver checked out from the browser pool on first call, waiting
+        for a free browser until the monotonic ``deadline`` (or for
+        ``browser_timeout`` seconds). Raises TimeoutError when the pool
+        stays exhausted, so a source that needs a browser fails instead of
+        hanging.
+        """
+        if self._driver is None:
+            if not SELENIUM_AVAILABLE:
+                raise RuntimeError("Selenium is not available")
+            timeout = self.browser_timeout if deadline is None else max(0.0, deadline - time.monotonic())
+            self._driver = self.browser_pool.acquire(timeout)
+        return self._driver
+
+    def warm_browser(self) -> None:
+        """
+        Start a browser in the background without blocking the caller
+        """
+        if SELENIUM_AVAILABLE:
+            self.browser_pool.warm_up()
+
+    def _mount_adapters(self, session: requests.Session, pool_size: int) -> None:
+        if self.cache is not None:
+            adapter = CachingAdapter(self.cache, pool_connections=pool_size, pool_maxsize=pool_size)
+        else:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    def mount_transport(self, adapter: HTTPAdapter) -> None:
+        """
+        Route all HTTP traffic through ``adapter``
+        """
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def scrape_arxiv(self, query: str, deadline: Optional[float] = None) -> List[ResearchPaper]:
         """
         Scrape research papers from arXiv
         """
         try:
-            # Configure arXiv client
-            search = arxiv.Search(
-                query=query,
-                max_results=self.max_results,
-                sort_by=arxiv.SortCriterion.Relevance
-            )
-            
-            papers = []
-            for result in search.results():
-                try:
-                    paper = ResearchPaper(
-                        title=result.title,
-                        authors=[str(author) for author in result.authors],
-                        abstract=result.summary,
-                        url=result.pdf_url,  # Use the direct PDF URL
-                        publication_date=str(result.published),
-                        source='arXiv'
-                    )
-                    papers.append(paper)
-                    if len(papers) >= self.max_results:
-                        break
-                except Exception as e:
-                    self.logger.warning(f"Error processing arXiv result: {e}")
-                    continue
-            
-            self.logger.info(f"Found {len(papers)} papers from arXiv")
-            return papers
+            return self.breakers.get('arXiv').call(self._search_arxiv, query, deadline)
+        except CircuitOpenError:
+            self.logger.debug("Skipping arXiv: circuit open")
+            return []
         except Exception as e:
             self.logger.error(f"Error scraping arXiv: {e}")
             return []
 
-    def scrape_semantic_scholar(self, query: str) -> List[ResearchPaper]:
+    def _search_arxiv(self, query: str, deadline: Optional[float] = None) -> List[ResearchPaper]:
+        # One page through the pooled session: unlike the arxiv client's
+        # requests, it can be given a timeout that ends with the deadline
+        papers = self.fetch_arxiv_page(query, 0, self.max_results, deadline=deadline)[:self.max_results]
+        self.logger.info(f"Found {len(papers)} papers from arXiv")
+        return papers
+
+    def scrape_semantic_scholar(self, query: str, deadline: Optional[float] = None) -> List[ResearchPaper]:
         """
         Scrape research papers from Semantic Scholar
         """
         try:
-            # Use the Semantic Scholar API
-            url = f"https://api.semanticscholar.org/graph/v1/paper/search"
-            params = {
-                "query": query,
-                "limit": self.max_results,
-                "fields": "title,authors,abstract,url,venue,year"
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            papers = []
-            
-            for paper_data in data.get('data', []):
-                try:
-                    if paper_data.get('title') and paper_data.get('authors'):
-                        paper = ResearchPaper(
-                            title=paper_data.get('title', ''),
-                            authors=[author.get('name', '') for author in paper_data.get('authors', [])],
-                            abstract=paper_data.get('abstract', 'No abstract available'),
-                            url=paper_data.get('url') or f"https://www.semanticscholar.org/paper/{paper_data.get('paperId', '')}",
-                            publication_date=str(paper_data.get('year', '')),
-                            source='Semantic Scholar'
-                        )
-                        papers.append(paper)
-                except Exception as e:
-                    self.logger.warning(f"Error processing Semantic Scholar result: {e}")
-                    continue
-            
-            self.logger.info(f"Found {len(papers)} papers from Semantic Scholar")
-            return papers
+            return self.breakers.get('Semantic Scholar').call(self._search_semantic_scholar, query, deadline)
+        except CircuitOpenError:
+            self.logger.debug("Skipping Semantic Scholar: circuit open")
+            return []
         except Exception as e:
             self.logger.error(f"Error scraping Semantic Scholar: {e}")
             return []
 
-    def scrape_google_scholar(self, query: str) -> List[ResearchPaper]:
+    def _search_semantic_scholar(self, query: str, deadline: Optional[float] = None) -> List[ResearchPaper]:
+        # Use the Semantic Scholar API
+        url = self.semantic_scholar_url
+        params = {
+            "query": query,
+            "limit": self.max_results,
+            "fields": SEMANTIC_SCHOLAR_FIELDS
+        }
+        
+        response = self.session.get(url, params=params, timeout=_timeout(deadline, 10))
+        response.raise_for_status()
+        
+        data = response.json()
+        papers = []
+        
+        for paper_data in data.get('data', []):
+            try:
+                paper = paper_from_semantic_scholar(paper_data)
+                if paper:
+                    papers.append(paper)
+            except Exception as e:
+                self.logger.warning(f"Error processing Semantic Scholar result: {e}")
+                continue
+        
+        self.logger.info(f"Found {len(papers)} papers from Semantic Scholar")
+        return papers
+
+    def scrape_google_scholar(self, query: str, deadline: Optional[float] = None) -> List[ResearchPaper]:
         """
         Scrape research papers from Google Scholar
         """
         try:
-            # Configure scholarly
-            scholarly.configure_logger(level=logging.WARNING)
-            
-            # Search for papers
-            search_query = scholarly.search_pubs(query)
-            papers = []
-            count = 0
-            
-            for result in search_query:
-                try:
-                    # Extract paper details
-                    bib = result.get('bib', {})
-                    paper = ResearchPaper(
-                        title=bib.get('title', 'Unknown Title'),
-                        authors=bib.get('author', ['Unknown Author']),
-                        abstract=bib.get('abstract', 'No abstract available'),
-                        url=result.get('pub_url', ''),
-                        publication_date=str(bib.get('year', '')),
-                        source='Google Scholar'
-                    )
-                    papers.append(paper)
-                    
-                    count += 1
-                    if count >= self.max_results:
-                        break
-                except Exception as e:
-                    self.logger.warning(f"Error processing Google Scholar result: {e}")
-                    continue
-            
-            self.logger.info(f"Found {len(papers)} papers from Google Scholar")
-            return papers
+            return self.breakers.get('Google Scholar').call(self._search_google_scholar, query, deadline)
+        except CircuitOpenError:
+            self.logger.debug("Skipping Google Scholar: circuit open")
+            return []
         except Exception as e:
             self.logger.error(f"Error scraping Google Scholar: {e}")
             return []
 
-    def scrape_all_sources(self, query: str) -> List[ResearchPaper]:
+    def _search_google_scholar(self, query: str, deadline: Optional[float] = None) -> List[ResearchPaper]:
+        # Quieten scholarly; it has no configure_logger in current releases
+        logging.getLogger('scholarly').setLevel(logging.WARNING)
+        
+        # Search for papers
+        search_query = self.scholar_search(query)
+        papers = []
+        count = 0
+        
+        for result in search_query:
+            try:
+                # Extract paper details
+                bib = result.get('bib', {})
+                paper = ResearchPaper(
+                    title=bib.get('title', 'Unknown Title'),
+                    authors=bib.get('author', ['Unknown Author']),
+                    abstract=bib.get('abstract', 'No abstract available'),
+                    url=result.get('pub_url', ''),
+                    publication_date=str(bib.get('year', '')),
+                    source='Google Scholar'
+                )
+                papers.append(paper)
+                
+                count += 1
+                if count >= self.max_results:
+                    break
+            except Exception as e:
+                self.logger.warning(f"Error processing Google Scholar result: {e}")
+                continue
+            if _past(deadline):
+                # scholarly has no timeout; stop paging once the budget is spent
+                break
+        
+        self.logger.info(f"Found {len(papers)} papers from Google Scholar")
+        return papers
+
+    def fetch_arxiv_page(self, query: str, start: int, page_size: int,
+                         sort_by: str = 'relevance', sort_order: str = 'descending',
+                         deadline: Optional[float] = None) -> List[ResearchPaper]:
         """
-        Scrape research papers from multiple sources using parallel execution
+        Fetch one page of arXiv results through the pooled session, timing
+        out no later than the monotonic ``deadline``
         """
-        all_papers = []
-        
+        params = {
+            'search_query': f'all:{query}',
+            'start': start,
+            'max_results': page_size,
+            'sortBy': sort_by,
+            'sortOrder': sort_order
+        }
+        response = self.session.get(self.arxiv_url, params=params, timeout=_timeout(deadline, 30))
+        response.raise_for_status()
+        return parse_arxiv_feed(response.text)
+
+    def fetch_semantic_scholar_bulk_page(self, query: str,
+                                         token: Optional[str] = None,
+                                         year: Optional[str] = None,
+                                         published: Optional[str] = None,
+                                         sort: Optional[str] = None) -> Tuple[List[ResearchPaper], Optional[str]]:
+        """
+        Fetch one page of the Semantic Scholar bulk search, returning the
+        papers and the continuation token for the next page (None at the end).
+        ``year`` is an optional filter such as "2024-" or "2020-2022",
+        ``published`` a publication date range such as "2024-05-01:", and
+        ``sort`` an order such as "publicationDate:desc".
+        """
+        params = {
+            "query": query,
+            "fields": f"{SEMANTIC_SCHOLAR_FIELDS},publicationDate"
+        }
+        if token:
+            params["token"] = token
+        if year:
+            params["year"] = year
+        if published:
+            params["publicationDateOrYear"] = published
+        if sort:
+            params["sort"] = sort
+
+        response = self.session.get(self.semantic_scholar_bulk_url, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+
+        papers = []
+        for paper_data in data.get('data', []):
+            paper = paper_from_semantic_scholar(paper_data)
+            if paper:
+                papers.append(paper)
+        return papers, data.get('token')
+
+    def iter_all_sources(self, query: str, deadline: Optional[float] = None) -> Iterator[SearchEvent]:
+        """
+        Scrape all sources in parallel, yielding deduplicated papers from each
+        source as soon as it finishes.
+
+        ``deadline`` is a budget in seconds for the whole search (defaults to
+        ``search_deadline``). The sources run side by side, each on a daemon
+        thread with its HTTP timeouts cut short at the deadline; a source
+        still running then is abandoned with a 'timed_out' event and the
+        search returns without it.
+        """
+        dedupe = PaperDeduplicator()
+        budget = self.search_deadline if deadline is None else deadline
+        started_at = time.monotonic()
+
         # Define scraping functions to run in parallel
         scraping_functions = [
-            (self.scrape_arxiv, "arXiv"),
-            (self.scrape_semantic_scholar, "Semantic Scholar"),
-            (self.scrape_google_scholar, "Google Scholar")
+            (self._search_arxiv, "arXiv"),
+            (self._search_semantic_scholar, "Semantic Scholar"),
+            (self._search_google_scholar, "Google Scholar")
         ]
-        
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_source = {
-                executor.submit(func, query): source_name
-                for func, source_name in scraping_functions
-            }
-            
-            for future in as_completed(future_to_source):
+
+        expires_at = None if budget is None else started_at + budget
+
+        future_to_source = {}
+        for func, source_name in scraping_functions:
+            # Sources with an open circuit are skipped without a request
+            if not self.breakers.get(source_name).allow():
+                yield SearchEvent(source=source_name, status='skipped', error='circuit open')
+                continue
+            future_to_source[_start_daemon(func, query, expires_at)] = source_name
+            yield SearchEvent(source=source_name, status='started')
+
+        pending = set(future_to_source)
+        while pending:
+            timeout = None if expires_at is None else max(0.0, expires_at - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
                 source_name = future_to_source[future]
+                elapsed = time.monotonic() - started_at
                 try:
                     papers = future.result()
-                    self.logger.info(f"Retrieved {len(papers)} papers from {source_name}")
-                    all_papers.extend(papers)
                 except Exception as e:
+                    self.breakers.get(source_name).record_failure()
                     self.logger.error(f"Error retrieving papers from {source_name}: {e}")
-        
-        # Remove duplicates based on title (case-insensitive)
-        seen_titles = {}
-        unique_papers = []
-        for paper in all_papers:
-            title_lower = paper.title.lower()
-            if title_lower not in seen_titles:
-                seen_titles[title_lower] = True
-                unique_papers.append(paper)
+                    yield SearchEvent(source=source_name, status='failed', error=str(e), elapsed=elapsed)
+                    continue
+                self.breakers.get(source_name).record_success()
+
+                self.logger.info(f"Retrieved {len(papers)} papers from {source_name}")
+                new_papers = dedupe.add(papers)
+                if new_papers or dedupe.enriched:
+                    yield SearchEvent(source=source_name, status='papers', papers=new_papers, elapsed=elapsed,
+                                      enriched=dedupe.enriched)
+                yield SearchEvent(source=source_name, status='completed', elapsed=elapsed)
+
+            now = time.monotonic()
+            if pending and expires_at is not None and now >= expires_at:
+                # Abandoned: their threads end on their own, at the latest when an HTTP timeout fires
+                for future in pending:
+                    source_name = future_to_source[future]
+                    self.breakers.get(source_name).record_failure()
+                    self.logger.warning(f"{source_name} missed its search deadline; returning partial results")
+                    yield SearchEvent(source=source_name, status='timed_out', elapsed=now - started_at)
+                pending = set()
+
+    def source_health(self) -> List[Dict]:
+        """
+        Circuit breaker state of every source seen so far
+        """
+        return self.breakers.states()
+
+    def search(self, query: str, deadline: Optional[float] = None) -> SearchResult:
+        """
+        Scrape all sources within a deadline, returning the papers found in
+        time together with each source's completion status
+        """
+        result = SearchResult()
+        for event in self.iter_all_sources(query, deadline):
+            result.papers.extend(event.papers)
+            status = result.sources.setdefault(event.source, SourceStatus(source=event.source))
+            status.papers += len(event.papers)
+            if event.status != 'papers':
+                status.status = event.status
+                status.elapsed = event.elapsed
+                status.error = event.error
+        return result
+
+    def scrape_all_sources(self, query: str, deadline: Optional[float] = None) -> List[ResearchPaper]:
+        """
+        Scrape research papers from multiple sources using parallel execution
+        """
+        unique_papers = self.search(query, deadline).papers
         
         self.logger.info(f"Total unique papers found: {len(unique_papers)}")
         return unique_papers
 
+    def scrape_many(self, queries: List[str], page_size: int = 100,
+                    include_google_scholar: bool = False) -> Dict[str, List[ResearchPaper]]:
+        """
+        Scrape many queries concurrently on the asyncio engine, sharing one
+        pooled connection set instead of spawning threads per query
+        """
+        from src.async_scraper import AsyncResearchScraper
+
+        async def _run():
+            async with AsyncResearchScraper(max_results=self.max_results,
+                                            page_size=page_size,
+                                            include_google_scholar=include_google_scholar,
+                                            cache=self.cache,
+                                            scraper=self) as engine:
+                return await engine.search_many(queries)
+
+        return asyncio.run(_run())
+
     def to_dataframe(self, papers: List[ResearchPaper]) -> pd.DataFrame:
         """
         Convert list of ResearchPaper to pandas DataFrame
@@ -236,21 +650,18 @@ class ResearchScraper:
             if not papers:
                 return pd.DataFrame()
             
-            # Convert papers to list of dictionaries
-            paper_dicts = []
-            for paper in papers:
-                paper_dict = asdict(paper)
-                paper_dict['authors'] = ', '.join(paper_dict['authors'])
-                paper_dicts.append(paper_dict)
-            
-            return pd.DataFrame(paper_dicts)
+            builder = PaperFrameBuilder()
+            builder.add(papers)
+            return builder.build()
         except Exception as e:
             self.logger.error(f"Error converting papers to DataFrame: {e}")
             return pd.DataFrame()
 
     def close(self):
         """
-        Close WebDriver
+        Return the WebDriver to the pool and close the HTTP session
         """
-        if self.driver:
-            self.driver.quit()
+        if self._driver is not None:
+            self.browser_pool.release(self._driver)
+            self._driver = None
+        self.session.close()
@@ -0,0 +1,327 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_SUMMARY_CACHE_PATH = os.path.join(project_root, 'cache', 'summaries.sqlite3')
+
+# Bump when the prompts change so old cached summaries are not reused
+PROMPT_VERSION = 1
+
+PAPER_PROMPT = (
+    "Summarize the following research paper in two or three sentences, "
+    "stating the problem, the approach and the main result.\n\n"
+    "Title: {title}\nAuthors: {authors}\nAbstract: {abstract}\n\nSummary:"
+)
+
+REDUCE_PROMPT = (
+    "The following are summaries of related research papers{topic}. Write one "
+    "concise paragraph describing the common themes, the main approaches and "
+    "how the papers differ.\n\n{summaries}\n\nCombined summary:"
+)
+
+OVERVIEW_PROMPT = (
+    "The following are summaries of research topics in one paper collection. "
+    "Write a short overview of the collection as a whole.\n\n{summaries}\n\nOverview:"
+)
+
+TITLE_WORD_PATTERN = re.compile(r'[a-z][a-z-]{2,}')
+STOPWORDS = frozenset(
+    'the and for with from via using towards toward into over under between based '
+    'are its their our new study analysis approach method methods model models '
+    'learning data paper system systems'.split()
+)
+
+@dataclass
+class TopicSummary:
+    """
+    Summary of one group of related papers
+    """
+    label: str
+    summary: str
+    papers: List[Any] = field(default_factory=list)
+
+@dataclass
+class CollectionSummary:
+    """
+    Overview, per-topic and per-paper summaries of a paper collection
+    """
+    overview: str
+    topics: List[TopicSummary] = field(default_factory=list)
+    paper_summaries: List[str] = field(default_factory=list)
+    llm_calls: int = 0
+    cache_hits: int = 0
+
+    def to_text(self) -> str:
+        parts = [f"Research Paper Summary:\n\n{self.overview}"]
+        for topic in self.topics:
+            links = '\n'.join(f"  - {paper.title} ({paper.url})" for paper in topic.papers)
+            parts.append(f"{topic.label} ({len(topic.papers)} papers):\n{topic.summary}\n{links}")
+        return '\n\n'.join(parts) + '\n'
+
+def content_key(*parts: str) -> str:
+    """
+    Cache key for a prompt's content
+    """
+    digest = hashlib.sha256(str(PROMPT_VERSION).encode('utf-8'))
+    for part in parts:
+        digest.update(b'\x00')
+        digest.update((part or '').encode('utf-8'))
+    return digest.hexdigest()
+
+def topic_label(papers: Sequence[Any], words: int = 3) -> str:
+    """
+    Most frequent informative title words of a group of papers
+    """
+    counts = Counter()
+    for paper in papers:
+        counts.update(set(TITLE_WORD_PATTERN.findall(paper.title.lower())) - STOPWORDS)
+    common = [word for word, _ in counts.most_common(words)]
+    return ', '.join(common).capitalize() if common else 'Other'
+
+def first_sentence(text: str, limit: int = 300) -> str:
+    text = ' '.join((text or '').split())
+    end = text.find('. ')
+    return text[:end + 1] if 0 <= end < limit else text[:limit]
+
+def group_topics(papers: Sequence[Any],
+                 grouper: Optional[Callable[[List[Any]], List[List[int]]]] = None,
+                 max_topics: int = 10,
+                 min_topic_size: int = 3) -> Dict[str, List[int]]:
+    """
+    Papers' positions grouped into labelled topics: the ``max_topics``
+    largest groups found by ``grouper``, with everything else under "Other"
+    """
+    papers = list(papers)
+    if grouper is None or len(papers) < 2:
+        return {'All papers': list(range(len(papers)))}
+    groups = sorted(grouper(papers), key=len, reverse=True)
+    groups = [group for group in groups[:max_topics] if len(group) >= min_topic_size]
+    grouped = {doc_id for group in groups for doc_id in group}
+    rest = [doc_id for doc_id in range(len(papers)) if doc_id not in grouped]
+    if not groups:
+        return {'All papers': rest}
+    topics = {}
+    for group in groups:
+        label = topic_label([papers[i] for i in group])
+        # Distinct groups can share their most common title words
+        topics[label if label not in topics else f"{label} ({len(topics) + 1})"] = group
+    if rest:
+        topics['Other'] = rest
+    return topics
+
+def extractive_summary(papers: Sequence[Any],
+                       grouper: Optional[Callable[[List[Any]], List[List[int]]]] = None,
+                       per_topic: int = 10,
+                       max_topics: int = 10,
+                       min_topic_size: int = 3) -> str:
+    """
+    LLM-free summary: the details and the opening sentence of the abstract
+    of at most ``per_topic`` papers in each topic, with a count of the rest
+    """
+    papers = list(papers)
+    topics = group_topics(papers, grouper, max_topics, min_topic_size)
+    parts = []
+    for label, topic in topics.items():
+        entries = [
+            f"Title: {paper.title}\n"
+            f"Authors: {', '.join(paper.authors or [])}\n"
+            f"Source: {getattr(paper, 'source', None) or getattr(paper, 'venue', '')}\n"
+            f"Web Link: {paper.url}\n"
+            f"Abstract: {first_sentence(paper.abstract)}\n"
+            for paper in (papers[i] for i in topic[:per_topic])
+        ]
+        if len(topic) > per_topic:
+            entries.append(f"... and {len(topic) - per_topic} more papers\n")
+        text = '\n'.join(entries)
+        parts.append(text if len(topics) == 1 else f"{label} ({len(topic)} papers):\n\n{text}")
+    return "Research Paper Summary:\n\n" + '\n'.join(parts)
+
+class SummaryCache:
+    """
+    Persistent map from prompt content hash to the LLM's summary
+    """
+    def __init__(self, path: str = DEFAULT_SUMMARY_CACHE_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            " key TEXT PRIMARY KEY, summary TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                found.update(self._conn.execute(
+                    f"SELECT key, summary FROM summaries WHERE key IN ({placeholders})", batch
+                ).fetchall())
+        return found
+
+    def put(self, key: str, summary: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO summaries (key, summary, created_at) VALUES (?, ?, ?)",
+                               (key, summary, time.time()))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class PaperSummarizer:
+    """
+    Map-reduce summarization of paper collections through an LLMManager.
+
+    Every paper is summarized on its own (map), ``max_workers`` LLM calls
+    at a time. Papers are then grouped into topics by ``grouper`` (ids of
+    related papers, e.g. ``RelatedPapers.clusters``), and each topic's
+    summaries are combined ``fanout`` at a time, level by level, until one
+    summary per topic remains (reduce), so no prompt grows with the size of
+    the collection; the topic summaries are reduced once more into an
+    overview. Every LLM result is cached under a hash of its prompt
+    content and the model, so summarizing an updated collection only calls
+    the LLM for new papers and for the topics they changed.
+    """
+    def __init__(self,
+                 llm_manager: Any,
+                 cache: Optional[SummaryCache] = None,
+                 max_workers: int = 4,
+                 fanout: int = 8,
+                 paper_max_tokens: int = 150,
+                 reduce_max_tokens: int = 400,
+                 grouper: Optional[Callable[[List[Any]], List[List[int]]]] = None,
+                 max_topics: int = 10,
+                 min_topic_size: int = 3):
+        self.llm_manager = llm_manager
+        self.cache = cache if cache is not None else SummaryCache()
+        self.max_workers = max_workers
+        self.fanout = max(fanout, 2)
+        self.paper_max_tokens = paper_max_tokens
+        self.reduce_max_tokens = reduce_max_tokens
+        self.grouper = grouper
+        self.max_topics = max_topics
+        self.min_topic_size = min_topic_size
+        self.logger = logging.getLogger(__name__)
+
+        self._stats_lock = threading.Lock()
+        self.llm_calls = 0
+        self.cache_hits = 0
+
+    def _model(self) -> str:
+        llm = self.llm_manager.get_current_llm_info()
+        if not llm:
+            raise ValueError("No LLM selected. Please select an LLM first.")
+        return f"{llm['provider']}/{llm['model']}"
+
+    def _generate_all(self, prompts: List[str], max_tokens: int, fallbacks: List[str]) -> List[str]:
+        """
+        Responses for many prompts, served from the cache where possible and
+        otherwise generated ``max_workers`` at a time
+        """
+        model = self._model()
+        keys = [content_key(model, str(max_tokens), prompt) for prompt in prompts]
+        cached = self.cache.get_many(keys)
+        # Identical prompts (e.g. duplicate papers) are generated once
+        missing = list({key: i for i, key in reversed(list(enumerate(keys))) if key not in cached}.values())
+
+        def generate(i: int) -> str:
+            try:
+                response = self.llm_manager.generate_response(prompts[i], max_tokens=max_tokens).strip()
+            except Exception as e:
+                self.logger.error(f"Error generating summary: {e}")
+                return fallbacks[i]
+            self.cache.put(keys[i], response)
+            return response
+
+        results = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = dict(zip((keys[i] for i in missing), executor.map(generate, missing)))
+        with self._stats_lock:
+            self.llm_calls += len(missing)
+            self.cache_hits += len(prompts) - len(missing)
+        return [cached[key] if key in cached else results[key] for key in keys]
+
+    def summarize_each(self, papers: Sequence[Any]) -> List[str]:
+        """
+        One short summary per paper, in order
+        """
+        prompts = [
+            PAPER_PROMPT.format(title=paper.title, authors=', '.join(paper.authors or []),
+                                abstract=' '.join((paper.abstract or '').split()))
+            for paper in papers
+        ]
+        fallbacks = [first_sentence(paper.abstract) or paper.title for paper in papers]
+        return self._generate_all(prompts, self.paper_max_tokens, fallbacks)
+
+    def _reduce(self, groups: List[List[str]], labels: List[str], template: str) -> List[str]:
+        """
+        Reduce every group of summaries to one, all groups level by level
+        together so each level is one parallel batch of LLM calls
+        """
+        while any(len(group) > 1 for group in groups):
+            prompts, fallbacks, owners = [], [], []
+            for index, group in enumerate(groups):
+                if len(group) == 1:
+                    continue
+                for start in range(0, len(group), self.fanout):
+                    chunk = group[start:start + self.fanout]
+                    summaries = '\n\n'.join(f"{n}. {summary}" for n, summary in enumerate(chunk, 1))
+                    prompts.append(template.format(summaries=summaries, topic=labels[index]))
+                    fallbacks.append(' '.join(chunk))
+                    owners.append(index)
+            responses = self._generate_all(prompts, self.reduce_max_tokens, fallbacks)
+            reduced = [group if len(group) == 1 else [] for group in groups]
+            for owner, response in zip(owners, responses):
+                reduced[owner].append(response)
+            groups = reduced
+        return [group[0] if group else '' for group in groups]
+
+    def _topics(self, papers: List[Any]) -> Dict[str, List[int]]:
+        return group_topics(papers, self.grouper, self.max_topics, self.min_topic_size)
+
+    def summarize(self, papers: Sequence[Any]) -> CollectionSummary:
+        """
+        Per-paper, per-topic and overall summaries of a collection
+        """
+        papers = list(papers)
+        calls, hits = self.llm_calls, self.cache_hits
+        paper_summaries = self.summarize_each(papers)
+
+        topic_groups = self._topics(papers)
+        labels, topics = list(topic_groups), list(topic_groups.values())
+        topic_summaries = self._reduce(
+            [[paper_summaries[i] for i in topic] for topic in topics],
+            [f" on {label.lower()}" if label not in ('All papers', 'Other') else '' for label in labels],
+            REDUCE_PROMPT
+        )
+        if len(topics) > 1:
+            overview = self._reduce([topic_summaries], [''], OVERVIEW_PROMPT)[0]
+        else:
+            overview = topic_summaries[0]
+
+        return CollectionSummary(
+            overview=overview,
+            topics=[TopicSummary(label, summary, [papers[i] for i in topic])
+                    for label, summary, topic in zip(labels, topic_summaries, topics)],
+            paper_summaries=paper_summaries,
+            llm_calls=self.llm_calls - calls,
+            cache_hits=self.cache_hits - hits
+        )
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.harvest import JSONLinesSink
+from src.paper_identity import PaperIdentityIndex
+from src.research_scraper import ResearchPaper, ResearchScraper
+
+DEFAULT_WATCH_DIR = os.path.join(project_root, 'watches')
+
+WATCH_SOURCES = ('arXiv', 'Semantic Scholar')
+
+@dataclass
+class WatchQuery:
+    """
+    A saved query and the newest publication date seen per source
+    """
+    query: str
+    high_water: Dict[str, str] = field(default_factory=dict)
+    paper_count: int = 0
+    last_refreshed: Optional[str] = None
+
+class WatchQueryStore:
+    """
+    Standing queries refreshed incrementally.
+
+    Each refresh asks a source only for results newer than its high-water
+    mark: both sources are walked newest first (arXiv by submittedDate,
+    Semantic Scholar bulk search by publicationDate, filtered to dates from
+    the mark's day onwards) and paging stops at the first result older than
+    the mark. New results are deduplicated against the stored set and
+    appended to it, so a refresh costs roughly the size of the delta. A
+    mark only moves once a walk has reached it: when ``max_pages`` runs out
+    first, the papers fetched are kept but the mark stays, so the next
+    refresh reads the rest of the gap. The first refresh of a query, with
+    no mark yet, reads ``initial_pages`` pages per source.
+    """
+    def __init__(self,
+                 scraper: Optional[ResearchScraper] = None,
+                 state_dir: str = DEFAULT_WATCH_DIR,
+                 page_size: int = 100,
+                 max_pages: int = 10,
+                 initial_pages: int = 1):
+        self.scraper = scraper or ResearchScraper()
+        self.state_dir = state_dir
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.initial_pages = initial_pages
+        self.logger = logging.getLogger(__name__)
+
+        os.makedirs(state_dir, exist_ok=True)
+        self._index_path = os.path.join(state_dir, 'watches.json')
+        self.watches: Dict[str, WatchQuery] = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                for data in json.load(f):
+                    watch = WatchQuery(**data)
+                    self.watches[watch.query] = watch
+
+    def _save(self) -> None:
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([asdict(watch) for watch in self.watches.values()], f, indent=2)
+        os.replace(tmp_path, self._index_path)
+
+    def _papers_path(self, query: str) -> str:
+        digest = hashlib.sha1(query.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.state_dir, f"{digest}.jsonl")
+
+    def add(self, query: str) -> WatchQuery:
+        """
+        Start watching a query
+        """
+        if query not in self.watches:
+            self.watches[query] = WatchQuery(query=query)
+            self._save()
+        return self.watches[query]
+
+    def remove(self, query: str) -> None:
+        """
+        Stop watching a query and drop its stored papers
+        """
+        if self.watches.pop(query, None) is not None:
+            self._save()
+        path = self._papers_path(query)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def papers(self, query: str) -> List[ResearchPaper]:
+        """
+        All papers stored for a watched query
+        """
+        path = self._papers_path(query)
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r', encoding='utf-8') as f:
+            return [ResearchPaper(**json.loads(line)) for line in f if line.strip()]
+
+    def _pages(self, mark: Optional[str]) -> int:
+        return self.max_pages if mark else min(self.initial_pages, self.max_pages)
+
+    def _newer_arxiv(self, query: str, mark: Optional[str]) -> Tuple[List[ResearchPaper], bool]:
+        # Returns the papers and whether the walk got back to the mark
+        papers = []
+        for page in range(self._pages(mark)):
+            batch = self.scraper.fetch_arxiv_page(query, page * self.page_size, self.page_size,
+                                                  sort_by='submittedDate', sort_order='descending')
+            for paper in batch:
+                if mark and (paper.publication_date or '') <= mark:
+                    return papers, True
+                papers.append(paper)
+            if len(batch) < self.page_size:
+                return papers, True
+        return papers, not mark
+
+    def _newer_semantic_scholar(self, query: str, mark: Optional[str]) -> Tuple[List[ResearchPaper], bool]:
+        # Dates are days (years for some papers, and for marks saved before
+        # dates were requested), so the mark's own day is re-read and its
+        # already-stored papers are dropped by deduplication
+        day = mark[:10] if mark else None
+        papers = []
+        token = None
+        for _ in range(self._pages(mark)):
+            batch, token = self.scraper.fetch_semantic_scholar_bulk_page(
+                query, token, published=f"{day}:" if day else None, sort='publicationDate:desc'
+            )
+            for paper in batch:
+                if day and (paper.publication_date or '') < day:
+                    return papers, True
+                papers.append(paper)
+            if token is None:
+                return papers, True
+        return papers, not mark
+
+    def refresh(self, query: str) -> List[ResearchPaper]:
+        """
+        Fetch papers newer than each source's high-water mark, merge them
+        into the stored set and return only the new ones
+        """
+        watch = self.add(query)
+        index = PaperIdentityIndex()
+        for paper in self.papers(query):
+            index.add(paper)
+
+        fetchers = {'arXiv': self._newer_arxiv, 'Semantic Scholar': self._newer_semantic_scholar}
+        new_papers = []
+        for source_name in WATCH_SOURCES:
+            mark = watch.high_water.get(source_name)
+            try:
+                fetched, reached_mark = self.scraper.breakers.get(source_name).call(fetchers[source_name], query, mark)
+            except Exception as e:
+                self.logger.error(f"Error refreshing '{query}' from {source_name}: {e}")
+                continue
+
+            dates = [paper.publication_date for paper in fetched
+                     if paper.publication_date and paper.publication_date[:4].isdigit()]
+            if not reached_mark:
+                # Moving the mark now would skip the papers past the last page read
+                self.logger.warning(f"Refresh of '{query}' from {source_name} stopped after {self.max_pages} "
+                                    f"pages before reaching {mark}; the mark stays until a refresh gets there")
+            elif dates:
+                watch.high_water[source_name] = max(dates + ([mark] if mark else []))
+            for paper in fetched:
+                _, is_new = index.add(paper)
+                if is_new:
+                    new_papers.append(paper)
+
+        if new_papers:
+            sink = JSONLinesSink(self._papers_path(query))
+            try:
+                sink.write(new_papers)
+                sink.flush()
+            finally:
+                sink.close()
+
+        watch.paper_count += len(new_papers)
+        watch.last_refreshed = datetime.now().isoformat(timespec='seconds')
+        self._save()
+        self.logger.info(f"Refreshed watch '{query}': {len(new_papers)} new papers")
+        return new_papers
+
+    def refresh_all(self) -> Dict[str, List[ResearchPaper]]:
+        """
+        Refresh every watched query
+        """
+        return {query: self.refresh(query) for query in list(self.watches)}
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import sys
+from xml.sax.saxutils import escape
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+
+from src.async_scraper import AsyncResearchScraper
+from src.circuit_breaker import CircuitBreakerRegistry
+
+TOTAL_RESULTS = 200
+
+def arxiv_feed(start: int, count: int) -> str:
+    entries = ''.join(
+        f"<entry><id>http://arxiv.org/abs/2401.{i:05d}v1</id>"
+        f"<title>{escape(f'arXiv paper {i}')}</title>"
+        f"<summary>Abstract {i}</summary>"
+        f"<published>2024-01-{i % 28 + 1:02d}T00:00:00Z</published>"
+        f"<author><name>Author {i}</name></author></entry>"
+        for i in range(start, min(start + count, TOTAL_RESULTS))
+    )
+    return f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+
+def semantic_scholar_page(offset: int, limit: int) -> dict:
+    return {'data': [
+        {'paperId': f"s2-{i}", 'title': f"Semantic Scholar paper {i}", 'authors': [{'name': f"Writer {i}"}],
+         'abstract': f"Abstract {i}", 'year': 2023, 'externalIds': {}}
+        for i in range(offset, min(offset + limit, TOTAL_RESULTS))
+    ]}
+
+class StandInSources:
+    """
+    Local aiohttp server answering like the arXiv and Semantic Scholar
+    search APIs, with a fixed latency per request; it records how many
+    requests were in flight at once
+    """
+    def __init__(self, latency: float = 0.02, semantic_scholar_status: int = 200):
+        self.latency = latency
+        self.semantic_scholar_status = semantic_scholar_status
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = web.Application()
+        self.app.router.add_get('/arxiv', self.arxiv)
+        self.app.router.add_get('/s2', self.semantic_scholar)
+
+    async def _enter(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+
+    async def arxiv(self, request: web.Request) -> web.Response:
+        await self._enter()
+        try:
+            feed = arxiv_feed(int(request.query['start']), int(request.query['max_results']))
+            return web.Response(text=feed, content_type='application/atom+xml')
+        finally:
+            self.in_flight -= 1
+
+    async def semantic_scholar(self, request: web.Request) -> web.Response:
+        await self._enter()
+        try:
+            if self.semantic_scholar_status != 200:
+                return web.Response(status=self.semantic_scholar_status)
+            return web.json_response(semantic_scholar_page(int(request.query['offset']),
+                                                           int(request.query['limit'])))
+        finally:
+            self.in_flight -= 1
+
+    async def __aenter__(self) -> 'StandInSources':
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.runner.cleanup()
+
+def engine(sources: StandInSources, **kwargs) -> AsyncResearchScraper:
+    return AsyncResearchScraper(arxiv_url=f"{sources.url}/arxiv", semantic_scholar_url=f"{sources.url}/s2",
+                                breakers=CircuitBreakerRegistry(), **kwargs)
+
+def test_search_all_collects_every_page():
+    async def run():
+        async with StandInSources() as sources:
+            async with engine(sources, max_results=45, page_size=10) as scraper:
+                return await scraper.search_all('agents'), sources.requests
+
+    papers, requests = asyncio.run(run())
+    titles = {paper.title for paper in papers}
+    assert titles == ({f"arXiv paper {i}" for i in range(45)} |
+                      {f"Semantic Scholar paper {i}" for i in range(45)})
+    # Five pages of ten (the last one of five) per source
+    assert requests == 10
+    arxiv_paper = next(paper for paper in papers if paper.title == 'arXiv paper 7')
+    assert arxiv_paper.authors == ['Author 7']
+    assert arxiv_paper.arxiv_id == '2401.00007'
+
+def test_concurrency_is_bounded_per_host():
+    async def run():
+        async with StandInSources(latency=0.05) as sources:
+            async with engine(sources, max_results=TOTAL_RESULTS, page_size=10, limit_per_host=3) as scraper:
+                await scraper.search_many(['agents', 'swarms'])
+            return sources
+
+    sources = asyncio.run(run())
+    assert sources.requests == 2 * 2 * 20
+    # Both sources share the stand-in's host, and so its limit
+    assert sources.max_in_flight == 3
+
+def test_stream_all_reports_a_failing_source_and_keeps_the_others():
+    async def run():
+        async with StandInSources(semantic_scholar_status=500) as sources:
+            async with engine(sources, max_results=30, page_size=10) as scraper:
+                return [event async for event in scraper.stream_all('agents')]
+
+    events = asyncio.run(run())
+    statuses = {(event.source, event.status) for event in events}
+    assert ('Semantic Scholar', 'failed') in statuses
+    assert ('Semantic Scholar', 'completed') not in statuses
+    assert ('arXiv', 'completed') in statuses
+    papers = [paper for event in events for paper in event.papers]
+    assert sorted(paper.title for paper in papers) == sorted(f"arXiv paper {i}" for i in range(30))
+
+def test_stream_all_skips_google_scholar_with_an_open_circuit():
+    async def run():
+        async with StandInSources() as sources:
+            scraper = engine(sources, max_results=10, include_google_scholar=True)
+            breaker = scraper.breakers.get('Google Scholar')
+            for _ in range(breaker.min_calls):
+                breaker.record_failure()
+            async with scraper:
+                return [event async for event in scraper.stream_all('agents')], scraper.scraper
+
+    events, blocking_scraper = asyncio.run(run())
+    statuses = {(event.source, event.status) for event in events}
+    assert ('Google Scholar', 'skipped') in statuses
+    assert ('Google Scholar', 'started') not in statuses
+    assert ('Google Scholar', 'completed') not in statuses
+    # No blocking scraper was started for it
+    assert blocking_scraper is None
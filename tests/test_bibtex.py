@@ -0,0 +1,82 @@
+import io
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.bibtex import citation_key, iter_bibtex, iter_bibtex_papers, latex_to_text, paper_to_bibtex, split_authors
+from src.research_scraper import ResearchPaper
+
+def parse(text: str, read_size: int = 1 << 20):
+    return list(iter_bibtex(io.BytesIO(text.encode('utf-8')), read_size=read_size))
+
+def round_trip(papers):
+    used = set()
+    text = ''.join(paper_to_bibtex(paper, citation_key(paper, used)) for paper in papers)
+    return list(iter_bibtex_papers(io.BytesIO(text.encode('utf-8'))))
+
+def test_parser_reads_strings_macros_and_accents():
+    entries = parse("""
+        @string{ proc = "Proceedings of " # "AAMAS" }
+        @comment{ ignored }
+        @InProceedings{ smith2020,
+          title = {{Multi-Agent} Systems \\& {B}argaining},
+          author = "Smith, John and M{\\"u}ller, J{\\"o}rg and others",
+          booktitle = proc,
+          month = mar,
+          year = 2020,
+        }
+        Email me @ home
+        @article(paren, title = {In parentheses})
+    """)
+    assert [(entry.entry_type, entry.key) for entry in entries] == [('inproceedings', 'smith2020'),
+                                                                     ('article', 'paren')]
+    fields = entries[0].fields
+    assert fields['title'] == 'Multi-Agent Systems & Bargaining'
+    assert fields['booktitle'] == 'Proceedings of AAMAS'
+    assert (fields['month'], fields['year']) == ('3', '2020')
+    assert split_authors(fields['author']) == ['John Smith', 'Jörg Müller']
+    assert latex_to_text(r'\L{}ukasz \c{c} \ss') == 'Łukasz ç ß'
+
+def test_parser_survives_block_boundaries_and_malformed_entries():
+    text = ''.join(f"@misc{{k{i}, title = {{Title {i} é}}}}\n" for i in range(200))
+    text += '@misc{broken, title = {never closed\n'
+    entries = parse(text, read_size=17)
+    assert [entry.fields['title'] for entry in entries] == [f"Title {i} é" for i in range(200)]
+
+def test_papers_round_trip_through_bibtex():
+    papers = [
+        ResearchPaper(title='Auctions & Agents: 100% of $5_000 #1', authors=['Ada Lovelace', 'Émile Borel'],
+                      abstract='Agents bid {fairly}.', url='https://example.org/a', publication_date='2021-06-15',
+                      doi='10.1000/a'),
+        ResearchPaper(title='Language agents', authors=['Grace Hopper'], abstract='Unbalanced { brace.',
+                      url='https://arxiv.org/abs/2301.00001', publication_date='2023', arxiv_id='2301.00001'),
+    ]
+    parsed = round_trip(papers)
+    assert [paper.title for paper in parsed] == [paper.title for paper in papers]
+    assert [paper.authors for paper in parsed] == [paper.authors for paper in papers]
+    assert parsed[0].abstract == 'Agents bid fairly.'
+    assert parsed[1].abstract == 'Unbalanced brace.'
+    assert [paper.publication_date for paper in parsed] == ['2021', '2023']
+    assert (parsed[0].doi, parsed[0].arxiv_id) == ('10.1000/a', None)
+    assert (parsed[1].doi, parsed[1].arxiv_id) == (None, '2301.00001')
+
+def test_blank_author_names_are_skipped():
+    paper = ResearchPaper(title='Swarm robotics', authors=['', '  ', 'Grace Hopper'], abstract='',
+                          url='', publication_date='2020')
+    assert citation_key(paper, set()) == 'hopper2020swarm'
+    assert [parsed.authors for parsed in round_trip([paper])] == [['Grace Hopper']]
+
+    nameless = ResearchPaper(title='Swarm robotics', authors=[''], abstract='', url='')
+    assert citation_key(nameless, set()) == 'anonswarm'
+    assert [parsed.authors for parsed in round_trip([nameless])] == [[]]
+
+def test_citation_keys_are_ascii_and_unique():
+    used = set()
+    paper = ResearchPaper(title='Über die Ökonomie', authors=['Jörg Łukasiewicz'], abstract='', url='',
+                          publication_date='1999-01-01')
+    keys = [citation_key(paper, used) for _ in range(3)]
+    assert keys == ['lukasiewicz1999uber', 'lukasiewicz1999ubera', 'lukasiewicz1999uberb']
+    assert citation_key(ResearchPaper(title='', authors=[], abstract='', url=''), used) == 'anon'
@@ -0,0 +1,94 @@
+import math
+import os
+import random
+import sys
+from collections import Counter
+from typing import Dict, List
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.bm25 import BM25Index
+from src.keyword_index import tokenize
+from src.research_scraper import ResearchPaper
+
+WORDS = ('agent', 'swarm', 'graph', 'language', 'model', 'robot', 'planning', 'auction', 'debate', 'memory',
+         'reward', 'policy', 'tool', 'search', 'vision')
+
+def paper(title: str, abstract: str = '') -> ResearchPaper:
+    return ResearchPaper(title=title, authors=[], abstract=abstract, url='')
+
+def reference_scores(index: BM25Index, papers: List[ResearchPaper], query: str) -> Dict[int, float]:
+    """
+    BM25F scores computed directly from the definition
+    """
+    titles = [tokenize(p.title) for p in papers]
+    abstracts = [tokenize(p.abstract) for p in papers]
+    n = len(papers)
+    title_avg = max(sum(map(len, titles)) / n, 1.0)
+    abstract_avg = max(sum(map(len, abstracts)) / n, 1.0)
+    scores = {}
+    for token in dict.fromkeys(tokenize(query)):
+        df = sum(1 for t, a in zip(titles, abstracts) if token in t or token in a)
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for doc_id, (t, a) in enumerate(zip(titles, abstracts)):
+            tf = (Counter(t)[token] * index.title_weight
+                  / (1 - index.title_b + index.title_b * len(t) / title_avg)
+                  + Counter(a)[token] * index.abstract_weight
+                  / (1 - index.abstract_b + index.abstract_b * len(a) / abstract_avg))
+            if tf:
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf / (index.k1 + tf)
+    return scores
+
+def test_scores_match_the_bm25f_definition():
+    rng = random.Random(7)
+    papers = [paper(' '.join(rng.choices(WORDS, k=rng.randint(2, 6))),
+                    ' '.join(rng.choices(WORDS, k=rng.randint(0, 40)))) for _ in range(300)]
+    index = BM25Index()
+    # Added in batches, as search results arrive
+    for start in range(0, len(papers), 70):
+        index.add(papers[start:start + 70])
+
+    for query in ('swarm', 'graph language', 'auction debate memory', 'robot robot'):
+        expected = reference_scores(index, papers, query)
+        results = index.search_ids(query, k=len(papers))
+        assert {doc_id for doc_id, _ in results} == set(expected)
+        for doc_id, score in results:
+            assert score == pytest.approx(expected[doc_id], rel=1e-4)
+        assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+
+def test_title_matches_outrank_abstract_matches():
+    index = BM25Index()
+    index.add([
+        paper('Planning with tools', 'We study swarm coordination.'),
+        paper('Swarm coordination', 'We study planning with tools.'),
+        paper('Unrelated', 'Nothing here.'),
+    ])
+    assert [p.title for p in index.search('swarm')] == ['Swarm coordination', 'Planning with tools']
+
+def test_rare_terms_and_short_fields_score_higher():
+    index = BM25Index()
+    index.add([paper('Agents', 'agent ' * 5 + 'debate')] + [paper('Agents', 'agent ' * 6) for _ in range(8)])
+    # "debate" is rarer than "agent", so one occurrence outweighs the extra "agent"
+    assert index.search('agent debate', k=1)[0].abstract.endswith('debate')
+
+    index = BM25Index()
+    index.add([paper('Long', 'memory ' + 'filler ' * 30), paper('Short', 'memory filler')])
+    # Equal term frequency: the shorter abstract ranks first
+    assert [p.title for p in index.search('memory')] == ['Short', 'Long']
+
+def test_top_k_search_and_clear():
+    index = BM25Index()
+    index.add([paper(f"Robot {i}", 'robot ' * i) for i in range(1, 21)])
+    top = index.search_ids('robot', k=5)
+    assert len(top) == 5
+    assert top == index.search_ids('robot', k=20)[:5]
+    assert index.search('') == [] and index.search('nonexistent') == []
+
+    index.clear()
+    assert len(index) == 0 and index.search('robot') == []
+    index.add([paper('Robot swarm')])
+    assert [p.title for p in index.search('robot')] == ['Robot swarm']
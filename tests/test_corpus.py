@@ -0,0 +1,110 @@
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+pytest.importorskip('pyarrow')
+
+from src import corpus
+from src.corpus import CORPUS_SCHEMA, load_corpus
+
+def rows(abstract: str = 'An abstract.'):
+    return [{'Title': f"Paper {i}", 'Authors': 'Ada Lovelace', 'Date': '2024.5.20' if i else '',
+             'Abstract': abstract, 'Url': f"https://example.org/{i}",
+             'AwesomeListCategory': 'Communication' if i % 2 else 'Simulation', 'Categories': '',
+             'PaperIndex': str(i), 'Affiliation': ''}
+            for i in range(4)]
+
+def write_corpus(path, records, mtime_ns=None):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(CORPUS_SCHEMA))
+        writer.writeheader()
+        writer.writerows(records)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+@pytest.fixture
+def parses(monkeypatch):
+    """
+    Paths the CSV parser was called with
+    """
+    calls = []
+    parse = corpus.parse_corpus_csv
+
+    def counting_parse(path, columns=None):
+        calls.append(path)
+        return parse(path, columns)
+
+    monkeypatch.setattr(corpus, 'parse_corpus_csv', counting_parse)
+    return calls
+
+def sidecar_meta(cache_dir):
+    name, = [name for name in os.listdir(cache_dir) if name.endswith('.json')]
+    with open(os.path.join(cache_dir, name), encoding='utf-8') as f:
+        return json.load(f)
+
+def test_warm_loads_read_the_sidecar(tmp_path, parses):
+    path, cache_dir = str(tmp_path / 'papers.csv'), str(tmp_path / 'cache')
+    write_corpus(path, rows())
+    cold = load_corpus(path, cache_dir=cache_dir)
+    assert len(parses) == 1
+    data, meta = sorted(os.listdir(cache_dir))
+    assert data.startswith('papers-') and data.endswith('.feather') and meta == data[:-len('feather')] + 'json'
+    assert sidecar_meta(cache_dir)['size'] == os.path.getsize(path)
+
+    warm = load_corpus(path, cache_dir=cache_dir)
+    assert len(parses) == 1
+    assert warm.equals(cold)
+    assert str(warm['AwesomeListCategory'].dtype) == 'category'
+    assert warm['Date'].tolist()[0] == ''
+
+    titles = load_corpus(path, columns=['Title', 'DateDay'], cache_dir=cache_dir)
+    assert list(titles.columns) == ['Title', 'DateDay']
+    assert titles['Title'].tolist() == cold['Title'].tolist()
+    assert len(parses) == 1
+
+def test_changed_content_rebuilds_the_sidecar(tmp_path, parses):
+    path, cache_dir = str(tmp_path / 'papers.csv'), str(tmp_path / 'cache')
+    write_corpus(path, rows(), mtime_ns=10 ** 18)
+    load_corpus(path, cache_dir=cache_dir)
+
+    # Same size, new content and mtime
+    write_corpus(path, rows('Another one.'), mtime_ns=10 ** 18 + 10 ** 9)
+    assert load_corpus(path, cache_dir=cache_dir)['Abstract'].tolist() == ['Another one.'] * 4
+    assert len(parses) == 2
+    assert load_corpus(path, cache_dir=cache_dir)['Abstract'].tolist() == ['Another one.'] * 4
+    assert len(parses) == 2
+
+    # A different size is caught even if the mtime is restored
+    write_corpus(path, rows('Short.'), mtime_ns=10 ** 18 + 10 ** 9)
+    assert load_corpus(path, cache_dir=cache_dir)['Abstract'].tolist() == ['Short.'] * 4
+    assert len(parses) == 3
+
+def test_touched_file_is_rehashed_not_reparsed(tmp_path, parses):
+    path, cache_dir = str(tmp_path / 'papers.csv'), str(tmp_path / 'cache')
+    write_corpus(path, rows(), mtime_ns=10 ** 18)
+    load_corpus(path, cache_dir=cache_dir)
+
+    os.utime(path, ns=(2 * 10 ** 18, 2 * 10 ** 18))
+    assert load_corpus(path, cache_dir=cache_dir)['Title'].tolist() == [f"Paper {i}" for i in range(4)]
+    assert len(parses) == 1
+    # The new mtime is recorded, so the next load skips the hash
+    assert sidecar_meta(cache_dir)['mtime_ns'] == 2 * 10 ** 18
+
+def test_stale_version_and_disabled_cache_parse_the_csv(tmp_path, parses, monkeypatch):
+    path, cache_dir = str(tmp_path / 'papers.csv'), str(tmp_path / 'cache')
+    write_corpus(path, rows())
+    load_corpus(path, cache_dir=cache_dir)
+    load_corpus(path, cache_dir=cache_dir, use_cache=False)
+    assert len(parses) == 2
+
+    monkeypatch.setattr(corpus, 'CORPUS_CACHE_VERSION', corpus.CORPUS_CACHE_VERSION + 1)
+    load_corpus(path, cache_dir=cache_dir)
+    assert len(parses) == 3
+    assert sidecar_meta(cache_dir)['version'] == corpus.CORPUS_CACHE_VERSION
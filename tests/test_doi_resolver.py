@@ -0,0 +1,128 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import unquote
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.doi_resolver import DOICache, DOIResolver, HTTPDOIFetcher, extract_dois
+
+SICI_DOI = '10.1002/(sici)1097-4636(199706)35:4<>3.0.co;2-k'
+
+class StandInResolver:
+    """
+    Local HTTP server answering DOI content negotiation like doi.org; DOIs
+    under 10.5555/missing get a 404 and those under 10.5555/broken a 500.
+    It records the DOI of every request.
+    """
+    def __init__(self):
+        self.requested: List[str] = []
+        resolver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                doi = unquote(self.path.lstrip('/'))
+                resolver.requested.append(doi)
+                if doi.startswith(('10.5555/missing', '10.5555/broken')):
+                    self.send_response(404 if 'missing' in doi else 500)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = json.dumps({
+                    'DOI': doi,
+                    'title': f"Paper {doi}",
+                    'author': [{'given': 'Ada', 'family': 'Lovelace'}],
+                    'issued': {'date-parts': [[2021, 3]]},
+                    'abstract': '<jats:p>An abstract.</jats:p>',
+                }).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/vnd.citationstyles.csl+json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> 'StandInResolver':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def stand_in():
+    with StandInResolver() as server:
+        yield server
+
+@pytest.fixture
+def resolver(stand_in):
+    resolver = DOIResolver(fetch=HTTPDOIFetcher(base_url=stand_in.url), cache=DOICache(':memory:'), max_workers=4)
+    yield resolver
+    resolver.close()
+
+def test_second_resolve_is_served_from_the_cache(stand_in, resolver):
+    dois = [f"10.5555/paper.{i}" for i in range(10)]
+    first = resolver.resolve(dois)
+    assert first.fetched == 10 and first.cache_hits == 0
+    assert sorted(stand_in.requested) == sorted(dois)
+
+    second = resolver.resolve(dois + ['https://doi.org/10.5555/PAPER.3'])
+    assert second.cache_hits == 10 and second.fetched == 0
+    assert len(stand_in.requested) == 10
+    assert [paper.doi for paper in second.papers] == dois
+    paper = second.papers[0]
+    assert paper.title == 'Paper 10.5555/paper.0'
+    assert paper.authors == ['Ada Lovelace']
+    assert paper.publication_date == '2021-03'
+    assert paper.abstract == 'An abstract.'
+
+def test_not_found_is_cached(stand_in, resolver):
+    first = resolver.resolve(['10.5555/missing.1', '10.5555/paper.1'])
+    assert first.not_found == ['10.5555/missing.1']
+    assert [paper.doi for paper in first.papers] == ['10.5555/paper.1']
+
+    second = resolver.resolve(['10.5555/missing.1'])
+    assert second.not_found == ['10.5555/missing.1']
+    assert second.cache_hits == 1 and second.fetched == 0
+    assert stand_in.requested.count('10.5555/missing.1') == 1
+
+def test_failures_are_reported_and_retried(stand_in, resolver):
+    first = resolver.resolve(['10.5555/broken.1', '10.5555/paper.1'])
+    assert first.failed == ['10.5555/broken.1']
+    assert first.not_found == []
+    assert [paper.doi for paper in first.papers] == ['10.5555/paper.1']
+
+    second = resolver.resolve(['10.5555/broken.1'])
+    assert second.failed == ['10.5555/broken.1']
+    assert second.cache_hits == 0
+    assert stand_in.requested.count('10.5555/broken.1') == 2
+
+def test_sici_doi_is_extracted_whole_and_resolved(stand_in, resolver):
+    text = f"See doi:{SICI_DOI.upper()}, and <a href=\"#\">10.5555/paper.7</a>."
+    dois = extract_dois(text)
+    assert dois == [SICI_DOI, '10.5555/paper.7']
+
+    result = resolver.resolve(dois)
+    assert [paper.doi for paper in result.papers] == dois
+    assert SICI_DOI in stand_in.requested
+
+def test_reserved_characters_in_dois_are_encoded(stand_in, resolver):
+    dois = ['10.5555/a#b', '10.5555/what?now', '10.5555/100%25', '10.5555/with space']
+    result = resolver.resolve(dois)
+    assert sorted(stand_in.requested) == sorted(dois)
+    assert [paper.title for paper in result.papers] == [f"Paper {doi}" for doi in dois]
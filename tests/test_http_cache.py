@@ -0,0 +1,124 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+import pytest
+import requests
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.http_cache import CacheMissError, CachingAdapter, HTTPCache, normalize_url
+
+class StandInOrigin:
+    """
+    Local HTTP server returning a body with an ETag, and 304 Not Modified
+    when the request's If-None-Match still matches it. It records the
+    If-None-Match header of every request (None when absent).
+    """
+    def __init__(self):
+        self.body = b'version 1'
+        self.etag = '"v1"'
+        self.conditions: List[Optional[str]] = []
+        origin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                condition = self.headers.get('If-None-Match')
+                origin.conditions.append(condition)
+                if condition == origin.etag:
+                    self.send_response(304)
+                    self.send_header('ETag', origin.etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; charset=utf-8')
+                self.send_header('ETag', origin.etag)
+                self.send_header('Content-Length', str(len(origin.body)))
+                self.end_headers()
+                self.wfile.write(origin.body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/search?q=agents"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> 'StandInOrigin':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def origin():
+    with StandInOrigin() as server:
+        yield server
+
+def cached_session(cache: HTTPCache) -> requests.Session:
+    session = requests.Session()
+    session.mount('http://', CachingAdapter(cache))
+    return session
+
+def test_normalize_url_is_canonical():
+    assert (normalize_url('HTTP://Example.org:80/api?b=2&a=1#top')
+            == normalize_url('http://example.org/api', {'a': 1, 'b': '2'})
+            == 'http://example.org/api?a=1&b=2')
+
+def test_fresh_entries_are_served_without_upstream_requests(origin):
+    cache = HTTPCache(':memory:', ttl=3600)
+    session = cached_session(cache)
+    assert session.get(origin.url).text == 'version 1'
+    assert session.get(origin.url).text == 'version 1'
+    assert origin.conditions == [None]
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+
+def test_stale_entries_are_revalidated_with_their_etag(origin):
+    cache = HTTPCache(':memory:', ttl=0)
+    session = cached_session(cache)
+    session.get(origin.url)
+
+    response = session.get(origin.url)
+    assert response.status_code == 200 and response.text == 'version 1'
+    assert origin.conditions == [None, '"v1"']
+    assert cache.stats['revalidated'] == 1
+
+    # A changed resource replaces the cached body
+    origin.body, origin.etag = b'version 2', '"v2"'
+    assert session.get(origin.url).text == 'version 2'
+    assert cache.lookup(cache.key_for(origin.url)).etag == '"v2"'
+
+def test_cache_only_serves_stale_entries_and_refuses_misses(origin):
+    cache = HTTPCache(':memory:', ttl=0)
+    cached_session(cache).get(origin.url)
+    cache.cache_only = True
+    session = cached_session(cache)
+    assert session.get(origin.url).text == 'version 1'
+    with pytest.raises(CacheMissError):
+        session.get(origin.url + '&page=2')
+    assert len(origin.conditions) == 1
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    cache = HTTPCache(path, max_bytes=25)
+    for name in ('a', 'b'):
+        cache.store(name, {}, b'x' * 10)
+    # Reading "a" makes "b" the least recently used
+    assert cache.lookup('a') is not None
+    cache.store('c', {}, b'x' * 10)
+    assert cache.lookup('b') is None
+    assert cache.lookup('a') is not None and cache.lookup('c') is not None
+    assert cache.stats['evicted'] == 1
+    cache.close()
+
+    reopened = HTTPCache(path, max_bytes=25)
+    assert reopened.lookup('a').body == b'x' * 10
+    reopened.close()
@@ -0,0 +1,126 @@
+import os
+import sys
+from typing import Iterator, List
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_agent import PaperAgent
+from src.paper_agent import ResearchPaper as ManualPaper
+from src.research_scraper import PaperDeduplicator, ResearchPaper, SearchEvent
+
+def semantic_scholar_record() -> ResearchPaper:
+    return ResearchPaper(title='Negotiating Agents', authors=['Ada Lovelace'], abstract='No abstract available',
+                         url='https://www.semanticscholar.org/paper/1', publication_date='2023',
+                         source='Semantic Scholar')
+
+def arxiv_record() -> ResearchPaper:
+    return ResearchPaper(title='Negotiating agents', authors=['Ada Lovelace'],
+                         abstract='Agents bargain over auctions.', url='https://arxiv.org/abs/2301.00001v1',
+                         publication_date='2023-01-02', source='arXiv', arxiv_id='2301.00001')
+
+class StandInScraper:
+    """
+    Streams Semantic Scholar's placeholder record, then arXiv's full record
+    of the same paper, through the scraper's deduplicator
+    """
+    def iter_all_sources(self, query: str, deadline=None) -> Iterator[SearchEvent]:
+        dedupe = PaperDeduplicator()
+        for source, papers in (('Semantic Scholar', [semantic_scholar_record()]), ('arXiv', [arxiv_record()])):
+            new_papers = dedupe.add(papers)
+            if new_papers or dedupe.enriched:
+                yield SearchEvent(source=source, status='papers', papers=new_papers, enriched=dedupe.enriched)
+            yield SearchEvent(source=source, status='completed')
+
+    def close(self) -> None:
+        pass
+
+@pytest.fixture
+def agent(tmp_path):
+    agent = PaperAgent(library_path=str(tmp_path / 'papers.sqlite3'), cache_path=':memory:')
+    agent.research_scraper = StandInScraper()
+    yield agent
+    agent.close()
+
+def titles(papers: List[ResearchPaper]) -> List[str]:
+    return [paper.title for paper in papers]
+
+def test_deduplicator_reports_enriched_papers():
+    dedupe = PaperDeduplicator()
+    first = semantic_scholar_record()
+    assert dedupe.add([first]) == [first] and dedupe.enriched == 0
+    assert dedupe.add([arxiv_record()]) == [] and dedupe.enriched == 1
+    assert first.abstract == 'Agents bargain over auctions.'
+    assert dedupe.add([arxiv_record()]) == [] and dedupe.enriched == 0
+
+def test_merged_fields_reach_the_indexes_and_frame(agent):
+    events = list(agent.search_papers_stream('negotiation'))
+    assert [event.enriched for event in events if event.status == 'papers'] == [0, 1]
+    assert titles(agent.collected_papers) == ['Negotiating Agents']
+
+    assert titles(agent.filter_papers(['auction'])) == ['Negotiating Agents']
+    assert titles(agent.query_papers('bargain AND auctions')) == ['Negotiating Agents']
+    assert titles(agent.rank_papers('auctions')) == ['Negotiating Agents']
+    frame = agent.get_papers_dataframe()
+    assert frame['abstract'].tolist() == ['Agents bargain over auctions.']
+    assert frame['arxiv_id'].tolist() == ['2301.00001']
+
+def test_papers_changed_rebuilds_the_indexes(agent):
+    agent.search_papers('negotiation')
+    assert titles(agent.filter_papers(['swarm'])) == []
+
+    agent.collected_papers[0] = ResearchPaper(title='Swarm robotics', authors=['Grace Hopper'],
+                                              abstract='Robots in swarms.', url='', publication_date='2020-05-01')
+    agent.papers_changed()
+    assert titles(agent.filter_papers(['swarm'])) == ['Swarm robotics']
+    assert titles(agent.filter_papers(['auction'])) == []
+    assert titles(agent.rank_papers('robots')) == ['Swarm robotics']
+    assert titles(agent.papers_between('2020', '2020')) == ['Swarm robotics']
+    assert agent.get_papers_dataframe()['title'].tolist() == ['Swarm robotics']
+
+    agent.collected_papers = []
+    agent.papers_changed()
+    assert agent.filter_papers(['swarm']) == []
+    assert agent.get_papers_dataframe().empty
+
+def test_related_papers_follow_library_changes(agent):
+    library = agent.library
+    ids = library.upsert([
+        ResearchPaper(title='Swarm robots', authors=['A One'], abstract='Swarm robots flock.', url=''),
+        ResearchPaper(title='Flocking drones', authors=['B Two'], abstract='Drones flock like a swarm.', url=''),
+        ResearchPaper(title='Auction design', authors=['C Three'], abstract='Bidding agents.', url=''),
+    ])
+    assert titles(agent.related_papers(ids[0], k=1)) == ['Flocking drones']
+    model = agent._related
+
+    # New papers and a merged abstract update the same model
+    new_id, = library.upsert([ResearchPaper(title='Robot swarm control', authors=['D Four'],
+                                            abstract='Swarm robots flock together.', url='')])
+    library.upsert([ResearchPaper(title='Auction design', authors=['C Three'], abstract='', url='',
+                                  doi='10.1000/auction')])
+    assert titles(agent.related_papers(ids[0], k=1)) == ['Robot swarm control']
+    assert agent._related is model
+    assert titles(agent.related_papers(new_id, k=1)) == ['Swarm robots']
+
+    # A deleted paper needs a rebuild
+    library.delete([new_id])
+    assert titles(agent.related_papers(ids[0], k=1)) == ['Flocking drones']
+    assert agent._related is not model
+    assert agent.related_papers(new_id) == []
+
+def test_manual_papers_without_a_date_stay_undated(agent):
+    undated = ManualPaper(title='Hand-entered notes', authors=['Ada Lovelace'])
+    assert undated.publication_date is None
+    dated = ManualPaper(title='Dated notes', authors=['Grace Hopper'], publication_date='2021-06-15')
+    undated_id, dated_id = agent.add_paper(undated), agent.add_paper(dated)
+
+    assert agent.library.get(undated_id).publication_date is None
+    assert titles(agent.library_papers_between()) == ['Dated notes']
+    assert titles(agent.library_papers_between('2021', '2021')) == ['Dated notes']
+
+    agent.collected_papers = [undated, dated]
+    agent.papers_changed()
+    assert titles(agent.papers_between()) == ['Dated notes']
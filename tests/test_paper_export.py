@@ -0,0 +1,125 @@
+import csv
+import gzip
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src import paper_export
+from src.paper_export import EXPORT_COLUMNS, PaperExporter, export_papers, infer_format
+from src.research_scraper import ResearchPaper
+
+def papers(n: int):
+    return [ResearchPaper(title=f"Paper {i}, \"quoted\"", authors=['Ada Lovelace', 'Grace Hopper'],
+                          abstract=f"Line one\nline two ü {i}", url=f"https://example.org/{i}",
+                          publication_date='2023-01-02', source='arXiv', doi=f"10.1000/{i}")
+            for i in range(n)]
+
+class FailingStream:
+    """
+    Stands in for the output stream and fails on the first write
+    """
+    def write(self, data: bytes) -> None:
+        raise OSError('disk full')
+
+    def close(self) -> None:
+        pass
+
+def test_infer_format():
+    assert infer_format('out/papers.jsonl.gz') == {'format': 'jsonl', 'compression': 'gzip'}
+    assert infer_format('papers.bib') == {'format': 'bibtex', 'compression': None}
+    assert infer_format('papers.txt') == {'format': 'csv', 'compression': None}
+
+def test_export_is_renamed_into_place_on_close(tmp_path):
+    path = str(tmp_path / 'papers.csv')
+    exporter = PaperExporter(path, chunk_size=7)
+    exporter.write(papers(20))
+    # Full chunks are written to the temporary file only
+    assert not os.path.exists(path)
+    assert os.path.exists(path + '.tmp')
+    assert exporter.close() == path
+    assert not os.path.exists(path + '.tmp')
+    assert exporter.count == 20
+
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['title'] for row in rows] == [paper.title for paper in papers(20)]
+    assert rows[3]['abstract'] == 'Line one\nline two ü 3'
+    assert rows[0]['authors'] == 'Ada Lovelace, Grace Hopper'
+
+def test_compressed_jsonl_round_trip(tmp_path):
+    path = str(tmp_path / 'papers.jsonl.gz')
+    assert export_papers(papers(25), path, chunk_size=10) == 25
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert list(records[0]) == EXPORT_COLUMNS
+    assert [record['doi'] for record in records] == [f"10.1000/{i}" for i in range(25)]
+
+def test_bibtex_keys_stay_unique_across_chunks(tmp_path):
+    path = str(tmp_path / 'papers.bib')
+    export_papers(papers(5), path, chunk_size=2)
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    keys = [line.split('{', 1)[1].rstrip(',') for line in text.splitlines() if line.startswith('@')]
+    assert len(keys) == len(set(keys)) == 5
+
+def test_failed_write_removes_the_partial_file(tmp_path):
+    path = str(tmp_path / 'papers.csv')
+    exporter = PaperExporter(path, chunk_size=5)
+    exporter._stream = FailingStream()
+    exporter.write(papers(5))
+    with pytest.raises(OSError, match='disk full'):
+        exporter.close()
+    assert not os.path.exists(path)
+    assert not os.path.exists(path + '.tmp')
+
+def test_failed_rename_keeps_the_previous_export(tmp_path, monkeypatch):
+    path = tmp_path / 'papers.jsonl'
+    path.write_text('previous export\n', encoding='utf-8')
+
+    def failing_replace(source, target):
+        raise PermissionError('target is locked')
+
+    monkeypatch.setattr(paper_export.os, 'replace', failing_replace)
+    exporter = PaperExporter(str(path))
+    exporter.write(papers(3))
+    with pytest.raises(PermissionError):
+        exporter.close()
+    assert path.read_text(encoding='utf-8') == 'previous export\n'
+    assert not os.path.exists(str(path) + '.tmp')
+
+def test_abort_and_exceptions_discard_the_export(tmp_path):
+    path = str(tmp_path / 'papers.csv')
+    exporter = PaperExporter(path, chunk_size=2)
+    exporter.write(papers(5))
+    exporter.abort()
+    assert os.listdir(tmp_path) == []
+
+    with pytest.raises(RuntimeError):
+        with PaperExporter(path, chunk_size=2) as exporter:
+            exporter.write(papers(5))
+            raise RuntimeError('interrupted')
+    assert os.listdir(tmp_path) == []
+
+def test_parquet_round_trip(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'papers.parquet')
+    assert export_papers(papers(25), path, chunk_size=10) == 25
+    parquet_file = pq.ParquetFile(path)
+    # One row group per chunk
+    assert parquet_file.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.column_names == EXPORT_COLUMNS
+    assert table.column('title').to_pylist() == [paper.title for paper in papers(25)]
+
+def test_unsupported_options_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        PaperExporter(str(tmp_path / 'papers.csv'), export_format='xml')
+    with pytest.raises(ValueError):
+        PaperExporter(str(tmp_path / 'papers.csv'), compression='bz2')
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,64 @@
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_identity import PaperIdentityIndex, normalize_arxiv_id, normalize_doi, normalize_title
+from src.research_scraper import ResearchPaper
+
+def paper(title, authors=('Ada Lovelace',), abstract='No abstract available', **fields) -> ResearchPaper:
+    return ResearchPaper(title=title, authors=list(authors), abstract=abstract, url=fields.pop('url', ''), **fields)
+
+def test_normalizers():
+    assert normalize_doi('https://doi.org/10.1000/ABC') == '10.1000/abc'
+    assert normalize_doi('doi:10.1000/abc') == '10.1000/abc'
+    assert normalize_arxiv_id('http://arxiv.org/abs/2401.01234v3') == '2401.01234'
+    assert normalize_arxiv_id('2401.01234') == '2401.01234'
+    assert normalize_arxiv_id('not an id') is None
+    assert normalize_title('Attention Is All You Need (v2)') == 'attention is all you need'
+    assert normalize_title('Großer Überblick v3') == 'großer uberblick'
+    # A version glued to a word is part of the name
+    assert normalize_title('MobileNetV2') == 'mobilenetv2'
+    assert normalize_title('MobileNetV2') != normalize_title('MobileNet')
+
+def test_doi_tier_merges_and_fills_missing_fields():
+    index = PaperIdentityIndex()
+    first = paper('Graph Agents', doi='10.1000/graph')
+    assert index.add(first) == (0, True)
+    duplicate = paper('Graph agents for planning', abstract='A real abstract.',
+                      doi='https://doi.org/10.1000/GRAPH', arxiv_id='2401.00001')
+    assert index.add(duplicate) == (0, False)
+    assert first.abstract == 'A real abstract.'
+    assert first.arxiv_id == '2401.00001'
+    # The identifier the duplicate contributed now matches on its own
+    assert index.add(paper('Something else', arxiv_id='2401.00001v2')) == (0, False)
+
+def test_arxiv_tier_matches_ids_and_urls():
+    index = PaperIdentityIndex()
+    index.add(paper('Swarm Learning', arxiv_id='2401.01234'))
+    assert index.add(paper('Swarm learning (preprint)', url='https://arxiv.org/abs/2401.01234v2')) == (0, False)
+
+def test_title_tier_keeps_distinct_authors_and_identifiers_apart():
+    index = PaperIdentityIndex()
+    index.add(paper('Attention Is All You Need', authors=['Ashish Vaswani', 'Noam Shazeer']))
+    assert index.add(paper('Attention is all you need v2', authors=['Vaswani, A.'])) == (0, False)
+    # Same title, different people
+    assert index.add(paper('Attention Is All You Need', authors=['Jane Doe'])) == (1, True)
+    # Same title and author, conflicting DOIs
+    index.add(paper('Survey of Agents', doi='10.1000/one'))
+    assert index.add(paper('Survey of Agents', doi='10.1000/two'))[1]
+
+def test_versioned_model_names_stay_distinct():
+    index = PaperIdentityIndex()
+    index.add(paper('MobileNet', authors=['Andrew Howard']))
+    assert index.add(paper('MobileNetV2', authors=['Mark Sandler'])) == (1, True)
+
+def test_minhash_tier_matches_near_duplicate_titles():
+    index = PaperIdentityIndex()
+    title = 'Communicative agents for software development with large language models'
+    index.add(paper(title, authors=['Chen Qian', 'Wei Liu']))
+    assert index.match(paper(title.replace('software', 'sofware'), authors=['Chen Qian'])) == 0
+    assert index.match(paper(title.replace('software', 'sofware'), authors=['Somebody Else'])) is None
+    assert index.match(paper('Reinforcement learning for robot locomotion', authors=['Chen Qian'])) is None
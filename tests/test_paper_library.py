@@ -0,0 +1,103 @@
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_library import PaperLibrary, fts_keyword_query, fts_query
+from src.research_scraper import ResearchPaper
+
+def paper(title, authors=('Ada Lovelace',), abstract='No abstract available', **fields) -> ResearchPaper:
+    return ResearchPaper(title=title, authors=list(authors), abstract=abstract, url=fields.pop('url', ''),
+                         **fields)
+
+@pytest.fixture
+def library():
+    library = PaperLibrary(':memory:')
+    yield library
+    library.close()
+
+def test_fts_queries_quote_terms():
+    assert fts_query('multi-agent "debate"') == '"multi" "agent" "debate"*'
+    assert fts_query('...') == ''
+    assert fts_keyword_query(['swarm', 'large language']) == '{title abstract} : ("swarm"* OR "large language"*)'
+
+def test_upsert_merges_records_of_the_same_paper(library):
+    first, = library.upsert([paper('Graph Agents', doi='10.1000/graph', source='Semantic Scholar')])
+    # Same DOI, filling in the abstract and arXiv id
+    again, = library.upsert([paper('Graph agents (extended)', abstract='Agents on graphs.',
+                                   doi='https://doi.org/10.1000/GRAPH', arxiv_id='2401.00001')])
+    # Same arXiv id in a URL
+    third, = library.upsert([paper('Graph Agents', url='https://arxiv.org/abs/2401.00001v2')])
+    # Same normalized title and a shared author
+    fourth, = library.upsert([paper('GRAPH AGENTS v2', authors=['Lovelace, A.'], publication_date='2024-01-02')])
+    assert first == again == third == fourth
+    assert len(library) == 1
+
+    stored = library.get(first)
+    assert stored.title == 'Graph Agents'
+    assert stored.abstract == 'Agents on graphs.'
+    assert stored.arxiv_id == '2401.00001'
+    assert stored.publication_date == '2024-01-02'
+    assert stored.source == 'Semantic Scholar'
+
+def test_upsert_keeps_distinct_papers_apart(library):
+    ids = library.upsert([
+        paper('Survey of Agents', authors=['Jane Doe']),
+        paper('Survey of Agents', authors=['John Roe']),
+        paper('Survey of Agents', authors=['Jane Doe'], doi='10.1000/other'),
+    ])
+    # Different authors stay apart; a DOI on only one side does not
+    assert ids[0] != ids[1]
+    assert ids[2] == ids[0]
+    assert library.upsert([paper('Survey of Agents', authors=['Jane Doe'], doi='10.1000/third')]) != [ids[0]]
+    assert len(library) == 3
+
+def test_search_ranks_and_follows_merges(library):
+    ids = library.upsert([
+        paper('Swarm robotics', abstract='Robots in swarms.'),
+        paper('Language agents', abstract='Large language models acting as agents.', authors=['Grace Hopper']),
+        paper('Agents agents agents', abstract='Language agents everywhere.', authors=['Alan Turing']),
+    ])
+    assert [library_id for library_id, _ in library.search('swarm')] == [ids[0]]
+    # Prefix match on the last word
+    assert {library_id for library_id, _ in library.search('lang')} == {ids[1], ids[2]}
+    assert [library_id for library_id, _ in library.search('hopper')] == [ids[1]]
+    # Newest first when unranked
+    assert [library_id for library_id, _ in library.search('agents', ranked=False)] == [ids[2], ids[1]]
+    assert library.search('') == []
+
+    # Merges keep the stored abstract but learn identifiers, and deleted papers are gone
+    library.upsert([paper('Swarm robotics', abstract='Robots in swarms negotiate with auctions.')])
+    assert library.search('swarm')[0][1].abstract == 'Robots in swarms.'
+    assert library.search('auctions') == []
+    library.upsert([paper('Swarm Robotics', authors=['Ada Lovelace'], doi='10.1000/swarm')])
+    assert library.search('swarm')[0][1].doi == '10.1000/swarm'
+    library.delete([ids[0]])
+    assert library.search('swarm') == []
+
+def test_filter_matches_keywords_in_title_or_abstract(library):
+    ids = library.upsert([
+        paper('Negotiation', abstract='Agents bargain.'),
+        paper('Planning', abstract='Tree search for robots.', authors=['Negotiation Expert']),
+    ])
+    assert [library_id for library_id, _ in library.filter(['negotiat'])] == [ids[0]]
+    assert [library_id for library_id, _ in library.filter(['tree search', 'bargain'])] == [ids[1], ids[0]]
+    assert library.filter(['  ']) == []
+
+def test_library_persists_and_reports_revisions(tmp_path):
+    path = str(tmp_path / 'papers.sqlite3')
+    library = PaperLibrary(path)
+    library.upsert([paper('Swarm robotics', publication_date='2021-06')])
+    revision = library.revision()
+    library.upsert([paper('Swarm robotics', abstract='Now with an abstract.')])
+    assert library.revision() != revision
+    library.close()
+
+    reopened = PaperLibrary(path)
+    assert [stored.abstract for _, stored in reopened.all()] == ['Now with an abstract.']
+    assert len(reopened.published_between('2021', '2021')) == 1
+    reopened.close()
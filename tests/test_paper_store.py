@@ -0,0 +1,82 @@
+import os
+import random
+import sys
+from dataclasses import asdict
+
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.paper_store import PaperStore
+from src.research_scraper import ResearchPaper
+
+def synthetic_papers(n: int, seed: int = 5):
+    rng = random.Random(seed)
+    names = ['Ada Lovelace', 'Grace Hopper', 'Alan Turing', 'Émile Borel', '李 明']
+    dates = ['2021-06-15', '2020', 'Mar 2019', None, '2022-01-01 12:00:00+00:00']
+    return [
+        ResearchPaper(
+            title=f"Paper {i} über agents",
+            authors=rng.sample(names, rng.randint(0, 3)),
+            abstract=' '.join(rng.choices(['swarm', 'debate', 'auction', 'ünïcode', ''], k=rng.randint(0, 50))),
+            url=f"https://example.org/{i}",
+            publication_date=rng.choice(dates),
+            source=rng.choice(['arXiv', 'Semantic Scholar', 'Unknown']),
+            doi=f"10.1000/{i}" if i % 3 else None,
+            arxiv_id=f"2401.{i:05d}" if i % 4 == 0 else None
+        )
+        for i in range(n)
+    ]
+
+@pytest.mark.parametrize('compress', [True, False])
+def test_papers_round_trip(compress):
+    papers = synthetic_papers(300)
+    store = PaperStore(block_size=16, compress=compress, cache_blocks=2)
+    assert [store.append(paper) for paper in papers[:10]] == list(range(10))
+    store.extend(papers[10:])
+    assert len(store) == len(papers)
+
+    assert [asdict(row.to_paper()) for row in store] == [asdict(paper) for paper in papers]
+    # Random access across sealed and open blocks
+    for index in (299, 0, 150, 17, -1):
+        assert asdict(store[index].to_paper()) == asdict(papers[index])
+    with pytest.raises(IndexError):
+        store[300]
+
+def test_columns_answer_source_and_date_queries():
+    papers = synthetic_papers(200)
+    store = PaperStore(papers, block_size=32)
+    arxiv = [row.title for row in store.rows_from_source('arXiv')]
+    assert arxiv == [paper.title for paper in papers if paper.source == 'arXiv']
+    assert store.rows_from_source('Google Scholar') == []
+
+    in_2021 = {row.title for row in store.rows_between('2021', '2021')}
+    assert in_2021 == {paper.title for paper in papers if (paper.publication_date or '').startswith('2021')}
+    # The index follows appends
+    store.append(ResearchPaper(title='Late', authors=[], abstract='', url='', publication_date='2021-12-31'))
+    assert 'Late' in {row.title for row in store.rows_between('2021-12', '2021-12')}
+
+def test_many_sources_and_failed_appends_keep_columns_aligned():
+    store = PaperStore(block_size=8)
+    for i in range(70000):
+        store.append(ResearchPaper(title=f"t{i}", authors=['a'], abstract='', url='', source=f"source {i}"))
+    assert store[69999].source == 'source 69999'
+    assert [row.title for row in store.rows_from_source('source 65540')] == ['t65540']
+
+    class Broken:
+        title, abstract, url, publication_date = 'broken', '', '', None
+        authors = [{'unhashable': True}]
+
+    with pytest.raises(TypeError):
+        store.append(Broken())
+    assert len(store) == 70000
+    store.append(ResearchPaper(title='after', authors=['b'], abstract='', url='', source='x'))
+    assert (store[70000].title, store[70000].authors, store[70000].source) == ('after', ['b'], 'x')
+
+def test_compressed_store_is_smaller_than_its_text():
+    papers = synthetic_papers(1000)
+    store = PaperStore(papers)
+    text_bytes = sum(len((paper.title + paper.abstract + paper.url).encode('utf-8')) for paper in papers)
+    assert store.memory_usage() < text_bytes
@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+pytest.importorskip('scipy')
+
+from src.related_papers import RelatedPapers
+from src.research_scraper import ResearchPaper
+
+TOPICS = {
+    'swarm': 'swarm robots coordinate flocking drones',
+    'debate': 'language models debate argue persuade judges',
+    'auction': 'auction bidding mechanism prices agents',
+}
+
+def corpus(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    papers = []
+    for i in range(n):
+        topic = rng.choice(sorted(TOPICS))
+        words = TOPICS[topic].split()
+        papers.append(ResearchPaper(title=f"{topic} study {i}", authors=[],
+                                    abstract=' '.join(rng.choices(words, k=12)), url=''))
+    return papers
+
+def similarities(model: RelatedPapers) -> np.ndarray:
+    return (model.matrix @ model.matrix.T).toarray()
+
+def test_added_papers_give_the_same_model_as_a_rebuild():
+    papers = corpus(60)
+    grown = RelatedPapers(papers[:20], max_df=0.5)
+    grown.neighbours(0)
+    grown.add(papers[20:45])
+    grown.add(papers[45:])
+    rebuilt = RelatedPapers(papers, max_df=0.5)
+    assert np.allclose(similarities(grown), similarities(rebuilt), atol=1e-6)
+    assert grown.neighbours(0, 5) == rebuilt.neighbours(0, 5)
+    assert grown.clusters(0.2) == rebuilt.clusters(0.2)
+
+def test_replaced_paper_is_reweighted():
+    papers = corpus(30)
+    model = RelatedPapers(papers)
+    swarm = next(i for i, paper in enumerate(papers) if paper.title.startswith('swarm'))
+    model.precompute(5)
+    changed = ResearchPaper(title='auction study', authors=[], abstract=TOPICS['auction'], url='')
+    model.replace(swarm, changed)
+    assert model.papers[swarm] is changed
+    rebuilt = RelatedPapers(papers[:swarm] + [changed] + papers[swarm + 1:])
+    assert np.allclose(similarities(model), similarities(rebuilt), atol=1e-6)
+    assert all(model.papers[other].title.startswith('auction') for other, _ in model.neighbours(swarm, 3))
+
+def test_neighbours_stay_within_a_topic():
+    papers = corpus(40)
+    model = RelatedPapers(papers)
+    for doc_id in (0, 11, 29):
+        topic = papers[doc_id].title.split()[0]
+        assert all(paper.title.startswith(topic) for paper in model.related(doc_id, 3))
+    assert len(RelatedPapers([])) == 0
+    assert RelatedPapers(papers[:1]).neighbours(0) == []
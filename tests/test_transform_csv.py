@@ -0,0 +1,78 @@
+import csv
+import functools
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import transform_csv
+from src.corpus import CORPUS_SCHEMA, load_corpus
+
+CATEGORIES = ['Communication', 'Organization', 'Evolution', 'Simulation']
+
+def corpus_rows():
+    return [{'Title': f"{cat} paper {i}", 'Authors': f"Author {i}", 'Date': f"2024.{i + 1}.1",
+             'Abstract': f"Line one\nline two of {cat} {i}", 'Url': f"https://example.org/{cat}/{i}",
+             'AwesomeListCategory': cat, 'Categories': '', 'PaperIndex': f"{cat.lower()}{i}",
+             'Affiliation': 'Somewhere'}
+            for cat in CATEGORIES for i in range(3)]
+
+def write_corpus(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(CORPUS_SCHEMA))
+        writer.writeheader()
+        writer.writerows(rows)
+    # A clearly newer mtime, so a rewrite within the same clock tick still counts as one
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Books and the hash file are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(transform_csv, 'load_corpus',
+                        functools.partial(load_corpus, cache_dir=str(tmp_path / 'corpus-cache')))
+    for cat in CATEGORIES:
+        os.makedirs(f"book_{cat.lower()}")
+    write_corpus('papers.csv', corpus_rows())
+    return tmp_path
+
+def test_books_have_a_cover_and_closing_page(workdir):
+    assert sorted(transform_csv.transform('papers.csv')) == sorted(CATEGORIES)
+    book = pd.read_csv(transform_csv.output_path('Simulation'), index_col=0, keep_default_na=False)
+    assert list(book.columns) == transform_csv.OUTPUT_COLUMNS
+    assert book['image_path'].tolist() == ['./images/4d.png'] + [f"./images/simulation{i}.png" for i in range(3)]
+    assert book['title'].tolist() == [f"Simulation paper {i}" for i in range(3)] + ['To be Continued...']
+    assert book['summary'].tolist()[0] == 'Line oneline two of Simulation 0'
+    assert book['summary'].tolist()[-1] == ''
+
+def test_only_changed_books_are_rebuilt(workdir):
+    transform_csv.transform('papers.csv')
+    assert transform_csv.transform('papers.csv') == []
+
+    rows = corpus_rows()
+    rows[0]['Abstract'] = 'A revised abstract'
+    # Columns the books are not built from do not count as changes
+    rows[4]['Date'] = '2020.1.1'
+    write_corpus('papers.csv', rows)
+    assert transform_csv.transform('papers.csv') == ['Communication']
+    book = pd.read_csv(transform_csv.output_path('Communication'), index_col=0, keep_default_na=False)
+    assert book['summary'].tolist()[0] == 'A revised abstract'
+
+    # A missing book is rebuilt even though its rows are unchanged
+    os.remove(transform_csv.output_path('Evolution'))
+    assert transform_csv.transform('papers.csv') == ['Evolution']
+    assert sorted(transform_csv.transform('papers.csv', force=True)) == sorted(CATEGORIES)
+
+def test_content_hash_follows_rows_and_order():
+    df = pd.DataFrame(corpus_rows())
+    digest = transform_csv.content_hash(df)
+    assert transform_csv.content_hash(df.copy()) == digest
+    assert transform_csv.content_hash(df.assign(Date='unrelated')) == digest
+    assert transform_csv.content_hash(df.iloc[::-1]) != digest
+    assert transform_csv.content_hash(df.assign(Affiliation='Elsewhere')) != digest
@@ -0,0 +1,69 @@
+import os
+import sys
+from typing import List, Optional
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.circuit_breaker import CircuitBreakerRegistry
+from src.research_scraper import ResearchPaper
+from src.watch_queries import WatchQueryStore
+
+def dated_paper(day: int) -> ResearchPaper:
+    return ResearchPaper(title=f"Paper from day {day}", authors=[f"Author {day}"], abstract='',
+                         url=f"https://arxiv.org/abs/2401.{day:05d}", publication_date=f"2024-01-{day:02d}",
+                         source='arXiv', arxiv_id=f"2401.{day:05d}")
+
+class StandInScraper:
+    """
+    Serves a fixed arXiv listing newest first; Semantic Scholar has nothing
+    """
+    def __init__(self, days: List[int]):
+        self.papers = [dated_paper(day) for day in sorted(days, reverse=True)]
+        self.breakers = CircuitBreakerRegistry()
+        self.arxiv_pages = 0
+
+    def fetch_arxiv_page(self, query: str, start: int, max_results: int, **kwargs) -> List[ResearchPaper]:
+        self.arxiv_pages += 1
+        return self.papers[start:start + max_results]
+
+    def fetch_semantic_scholar_bulk_page(self, query: str, token: Optional[str] = None, **kwargs):
+        return [], None
+
+def test_refresh_fetches_only_papers_newer_than_the_mark(tmp_path):
+    scraper = StandInScraper(range(1, 6))
+    store = WatchQueryStore(scraper, state_dir=str(tmp_path), page_size=2, initial_pages=3)
+    assert len(store.refresh('agents')) == 5
+    assert store.watches['agents'].high_water['arXiv'] == '2024-01-05'
+
+    scraper.papers[:0] = [dated_paper(7), dated_paper(6)]
+    scraper.arxiv_pages = 0
+    assert [paper.publication_date for paper in store.refresh('agents')] == ['2024-01-07', '2024-01-06']
+    assert store.watches['agents'].high_water['arXiv'] == '2024-01-07'
+    # The walk stops on the page holding the mark
+    assert scraper.arxiv_pages == 2
+    assert len(store.papers('agents')) == 7
+
+def test_mark_stays_until_a_refresh_reaches_it(tmp_path):
+    scraper = StandInScraper([1])
+    store = WatchQueryStore(scraper, state_dir=str(tmp_path), page_size=2, max_pages=2)
+    store.refresh('agents')
+    assert store.watches['agents'].high_water['arXiv'] == '2024-01-01'
+
+    # Six new papers, but a refresh reads only four
+    scraper.papers[:0] = [dated_paper(day) for day in range(7, 1, -1)]
+    first = store.refresh('agents')
+    assert [paper.publication_date[-2:] for paper in first] == ['07', '06', '05', '04']
+    assert store.watches['agents'].high_water['arXiv'] == '2024-01-01'
+
+    # A larger budget reaches the mark: the gap is filled and the mark moves
+    store.max_pages = 5
+    second = store.refresh('agents')
+    assert [paper.publication_date[-2:] for paper in second] == ['03', '02']
+    assert store.watches['agents'].high_water['arXiv'] == '2024-01-07'
+
+    # Reloaded state keeps the mark
+    reloaded = WatchQueryStore(scraper, state_dir=str(tmp_path))
+    assert reloaded.watches['agents'].high_water['arXiv'] == '2024-01-07'
+    assert len(reloaded.papers('agents')) == 7
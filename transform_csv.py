@@ -1,36 +1,89 @@
+import argparse
+import hashlib
+import json
+import os
+
 import pandas as pd
 
+from src.corpus import load_corpus
+
 input_file = 'papers.csv'
-df_raw = pd.read_csv(input_file, on_bad_lines='warn')
+
+# Content hashes of each category's input rows, to skip unchanged books
+HASH_FILE = os.path.join('cache', 'transform_csv_hashes.json')
+# Bump when the output layout changes, so every book is rebuilt
+TRANSFORM_VERSION = 1
+
+INPUT_COLUMNS = ['Title', 'Authors', 'Abstract', 'PaperIndex', 'Affiliation']
+OUTPUT_COLUMNS = ['image_path', 'title', 'author', 'summary', 'affiliation']
 
 cat2id = {'Communication':'1',
           'Organization':'2',
           'Evolution':'3',
           'Simulation':'4'}
 
-for cat in ['Communication','Evolution','Simulation','Organization']:
-    df = df_raw[df_raw['AwesomeListCategory'] == cat]
+def output_path(cat):
+    return "./book_{}/data.csv".format(cat.lower())
 
-    new_df = pd.DataFrame(columns=['image_path','title','author','summary','affiliation'])
+def content_hash(df):
+    """
+    Hash of the rows and columns a book is built from
+    """
+    row_hashes = pd.util.hash_pandas_object(df[INPUT_COLUMNS], index=False).to_numpy()
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(str(TRANSFORM_VERSION).encode())
+    return digest.hexdigest()
 
-    index = 0
+def build_book(cat, df):
+    """
+    Book pages for one category: a cover page with the category image and
+    the first paper, one page per further paper, and a closing page. Each
+    page after the cover shows the image of the paper before it.
+    """
+    images = ("./images/" + df['PaperIndex'] + ".png").tolist()
+    return pd.DataFrame({
+        'image_path': ["./images/" + cat2id[cat] + "d.png"] + images,
+        'title': df['Title'].tolist() + ["To be Continued..."],
+        'author': df['Authors'].tolist() + ["Your Contributions are Welcome!"],
+        'summary': df['Abstract'].str.replace("\n", "", regex=False).tolist() + [""],
+        'affiliation': df['Affiliation'].tolist() + [""]
+    }, columns=OUTPUT_COLUMNS)
 
-    first_title = df.iloc[0]['Title']
-    first_author = df.iloc[0]['Authors']
-    first_affiliation = df.iloc[0]['Affiliation']
-    first_summary = df.iloc[0]['Abstract'].replace("\n","")
-    first_cover_path = "./images/" + cat2id[cat] + "d.png"
+def load_hashes(path=HASH_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-    first_line = pd.DataFrame([[first_cover_path,first_title,first_author,first_summary,first_affiliation]], columns=['image_path','title','author','summary','affiliation'])
-    new_df = pd.concat([new_df, first_line], ignore_index=True)
-    image_path_list = df['PaperIndex'].tolist()
-    for _, line in df[1:].iterrows():
-        print(line['Title'])
-        new_line = pd.DataFrame([["./images/{}.png".format(image_path_list[index]),line['Title'],line['Authors'],str(line['Abstract']).replace("\n",""),line['Affiliation']]], columns=['image_path','title','author','summary','affiliation'])
-        new_df = pd.concat([new_df, new_line], ignore_index=True)
-        index += 1
+def save_hashes(hashes, path=HASH_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(hashes, f, indent=1)
 
-    last_line = pd.DataFrame([["./images/{}.png".format(image_path_list[index]),"To be Continued...","Your Contributions are Welcome!","",""]], columns=['image_path','title','author','summary','affiliation'])
-    new_df = pd.concat([new_df, last_line], ignore_index=True)
+def transform(input_file=input_file, force=False):
+    """
+    Rebuild book_*/data.csv for every category whose input rows changed
+    since the last run, and return the categories rebuilt
+    """
+    df_raw = load_corpus(input_file, columns=INPUT_COLUMNS + ['AwesomeListCategory'])
+    groups = dict(tuple(df_raw.groupby('AwesomeListCategory', sort=False, observed=True)))
+    hashes = load_hashes()
+    rebuilt = []
+    for cat in ['Communication','Evolution','Simulation','Organization']:
+        df = groups[cat]
+        digest = content_hash(df)
+        if not force and hashes.get(cat) == digest and os.path.exists(output_path(cat)):
+            continue
+        build_book(cat, df).to_csv(output_path(cat))
+        hashes[cat] = digest
+        rebuilt.append(cat)
+    save_hashes(hashes)
+    return rebuilt
 
-    new_df.to_csv("./book_{}/data.csv".format(cat.lower()))
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the book data files from papers.csv")
+    parser.add_argument('--input', default=input_file)
+    parser.add_argument('--force', action='store_true', help="rebuild every book, changed or not")
+    args = parser.parse_args()
+    rebuilt = transform(args.input, args.force)
+    print("Rebuilt: {}".format(", ".join(rebuilt) if rebuilt else "nothing, all books up to date"))